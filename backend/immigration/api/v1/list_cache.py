@@ -0,0 +1,191 @@
+"""
+Short-lived per-tenant cache for list endpoint responses.
+
+Entries are keyed by tenant schema, a per-namespace generation token, the
+caller's scope and the absolute request URI (filters, pagination). Views
+call invalidate_list_cache() after every write, which orphans every cached
+page of the namespace at once. LIST_CACHE_TTL bounds staleness from changes
+the namespace does not track (e.g. user names).
+
+The cache is Django's default cache, which settings point at Redis outside
+development, so invalidations reach every worker process. Role-scoped
+responses key on user_scope(), which also changes whenever group, branch
+or region memberships change. Namespaces read by more than one endpoint
+(e.g. COLLEGE_APPLICATION_STATS_CACHE) are invalidated from model signals
+instead, so writes made anywhere reach them (see connect_list_cache_signals()).
+
+row_etag() derives detail endpoint ETags from the record itself, so
+conditional GETs change with the record and the related names it renders.
+"""
+
+import hashlib
+import uuid
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.http import parse_etags
+from rest_framework.response import Response
+
+from immigration.renderers import ORJSONRenderer
+
+# Seconds a cached list page is served for
+LIST_CACHE_TTL = 120
+
+# Generation shared by every role-scoped response (see user_scope())
+ROLE_SCOPE_CACHE = 'role_scope'
+
+# College application stage counts and dashboard statistics: invalidated on
+# every application type, stage and college application save or delete
+COLLEGE_APPLICATION_STATS_CACHE = 'college_application_statistics'
+
+
+def _generation_key(namespace):
+    return f"list_cache:{connection.schema_name}:{namespace}:generation"
+
+
+def _generation(namespace):
+    """Current generation token of namespace in this tenant."""
+    key = _generation_key(namespace)
+    generation = cache.get(key)
+    if generation is None:
+        # A random token, so an evicted generation never revives old entries
+        cache.add(key, uuid.uuid4().hex, None)
+        generation = cache.get(key)
+    return generation
+
+
+def invalidate_list_cache(namespace):
+    """Drop every cached list page of namespace for the current tenant."""
+    cache.set(_generation_key(namespace), uuid.uuid4().hex, None)
+
+
+def user_scope(user):
+    """
+    cached_list_response() scope of a response limited by user's role.
+
+    Combines the user id with the ROLE_SCOPE_CACHE generation, so pages
+    cached before a change to anyone's groups, branches or regions, or to a
+    branch's region, are not served again.
+    """
+    return f"{user.pk}:{_generation(ROLE_SCOPE_CACHE)}"
+
+
+def _invalidate_role_scope(sender, action=None, **kwargs):
+    if action is None or action in ('post_add', 'post_remove', 'post_clear'):
+        invalidate_list_cache(ROLE_SCOPE_CACHE)
+
+
+def _invalidate_college_application_stats(sender, **kwargs):
+    invalidate_list_cache(COLLEGE_APPLICATION_STATS_CACHE)
+
+
+def connect_list_cache_signals():
+    """
+    Invalidate role-scoped responses on membership changes, and signal
+    invalidated namespaces on their models' writes, made anywhere (API,
+    admin, shell). Called from the app's ready().
+    """
+    from immigration.models import ApplicationType, Branch, CollegeApplication, Stage
+
+    User = get_user_model()
+    for through in (User.groups.through, User.branches.through, User.regions.through):
+        m2m_changed.connect(_invalidate_role_scope, sender=through, dispatch_uid=f'role_scope:{through._meta.label}')
+    # Region managers see the branches of their regions
+    for name, signal in (('post_save', post_save), ('post_delete', post_delete)):
+        signal.connect(_invalidate_role_scope, sender=Branch, dispatch_uid=f'role_scope:branch:{name}')
+        for model in (ApplicationType, Stage, CollegeApplication):
+            signal.connect(
+                _invalidate_college_application_stats,
+                sender=model,
+                dispatch_uid=f'{COLLEGE_APPLICATION_STATS_CACHE}:{model._meta.label}:{name}',
+            )
+
+
+def cached_list_response(request, namespace, build, scope=None, ttl=LIST_CACHE_TTL):
+    """
+    Response for a GET list request, served from the cache when possible.
+
+    Args:
+        request: DRF request
+        namespace: Cache namespace invalidated by the resource's writes
+        build: Callable returning the response data on a cache miss
+        scope: Extra key part for responses that depend on the caller
+            (user_scope() for role-scoped lists)
+        ttl: Seconds the response is served for
+
+    Returns:
+        Response with an ETag header, or 304 when If-None-Match matches
+    """
+    key = ':'.join((
+        connection.schema_name,
+        namespace,
+        _generation(namespace),
+        str(scope),
+        request.build_absolute_uri(),
+    ))
+    key = 'list_cache:' + hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+    entry = cache.get(key)
+    if entry is None:
+        data = build()
+        body = ORJSONRenderer().render(data)
+        digest = hashlib.blake2b(body, digest_size=16).hexdigest()
+        entry = (data, body, digest)
+        cache.set(key, entry, ttl)
+    data, body, digest = entry
+
+    # Per representation: the browsable API and JSON share the data
+    tag = f"{digest}:{request.META.get('HTTP_ACCEPT', '')}"
+    etag = f'"{hashlib.blake2b(tag.encode(), digest_size=8).hexdigest()}"'
+    if_none_match = parse_etags(request.META.get('HTTP_IF_NONE_MATCH', ''))
+    # Weak comparison: GZipMiddleware hands out compressed responses' tags as W/"..."
+    if etag in {tag.removeprefix('W/') for tag in if_none_match}:
+        response = HttpResponseNotModified()
+    elif (
+        isinstance(request.accepted_renderer, ORJSONRenderer)
+        and request.accepted_media_type == ORJSONRenderer.media_type
+    ):
+        # Plain JSON (no indent): send the bytes encoded when the entry was cached
+        response = HttpResponse(body, content_type=ORJSONRenderer.media_type)
+    else:
+        response = Response(data)
+    response['ETag'] = etag
+    return response
+
+
+def row_etag(request, queryset, pk, fields, lookup='pk'):
+    """
+    ETag for the detail response of record pk, for condition(etag_func=...).
+
+    Hashes the tenant schema, the model, pk and the record's values of
+    fields (its updated_at plus the related columns the response renders,
+    e.g. user names), read with one query, and the Accept header. Returns
+    None when queryset, which should apply the endpoint's scoping, has no
+    such record, so the view answers instead (e.g. with a 404).
+
+    Args:
+        request: Request being answered
+        queryset: Records the caller may retrieve
+        pk: Record key from the URL
+        fields: values_list() names the response depends on
+        lookup: Field pk is matched against
+    """
+    try:
+        values = queryset.filter(**{lookup: pk}).values_list(*fields).first()
+    except (TypeError, ValueError, ValidationError):
+        # Malformed pk: let the view reject it
+        return None
+    if values is None:
+        return None
+    key = repr((
+        connection.schema_name,
+        queryset.model._meta.label,
+        lookup,
+        str(pk),
+        values,
+        request.META.get('HTTP_ACCEPT', ''),
+    ))
+    return hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
@@ -7,8 +7,14 @@ They are thin wrappers - business logic lives in services.
 
 from rest_framework import serializers
 from drf_spectacular.utils import extend_schema_field
+from immigration.api.v1.serializers.fields import UTCDateTimeField, user_display_name
 from immigration.models.agent import Agent
 
+_AGENT_TYPE_DISPLAY = dict(Agent.AGENT_TYPE_CHOICES)
+
+# Formats created_at/updated_at exactly as the output serializers do
+_DATETIME_FIELD = UTCDateTimeField(read_only=True)
+
 
 class AgentOutputSerializer(serializers.ModelSerializer):
     """
@@ -60,14 +66,14 @@ class AgentOutputSerializer(serializers.ModelSerializer):
     def get_created_by_name(self, obj):
         """Get creator name if exists."""
         if obj.created_by:
-            return f"{obj.created_by.first_name} {obj.created_by.last_name}".strip() or obj.created_by.username
+            return user_display_name(obj.created_by.first_name, obj.created_by.last_name, obj.created_by.username)
         return None
     
     @extend_schema_field(serializers.CharField(allow_null=True))
     def get_updated_by_name(self, obj):
         """Get updater name if exists."""
         if obj.updated_by:
-            return f"{obj.updated_by.first_name} {obj.updated_by.last_name}".strip() or obj.updated_by.username
+            return user_display_name(obj.updated_by.first_name, obj.updated_by.last_name, obj.updated_by.username)
         return None
     
     @extend_schema_field(serializers.CharField(allow_null=True))
@@ -78,6 +84,74 @@ class AgentOutputSerializer(serializers.ModelSerializer):
         return None
 
 
+# Columns read by agent_list_data(), for .values() agent querysets
+AGENT_LIST_VALUES = (
+    'id',
+    'agent_name',
+    'agent_type',
+    'company_name',
+    'designation',
+    'phone_number',
+    'email',
+    'website',
+    'invoice_to',
+    'street',
+    'suburb',
+    'state',
+    'postcode',
+    'country',
+    'description',
+    'created_by_id',
+    'created_by__first_name',
+    'created_by__last_name',
+    'created_by__username',
+    'created_at',
+    'updated_by_id',
+    'updated_by__first_name',
+    'updated_by__last_name',
+    'updated_by__username',
+    'updated_at',
+)
+
+
+def agent_list_data(row):
+    """
+    AgentOutputSerializer output for one AGENT_LIST_VALUES row.
+
+    The agent list builds its rows directly from the values() dicts instead
+    of instantiating agents (and their users) and running the serializer.
+    """
+    created_by, updated_by = row['created_by_id'], row['updated_by_id']
+    return {
+        'id': row['id'],
+        'agent_name': row['agent_name'],
+        'agent_type': row['agent_type'],
+        'agent_type_display': _AGENT_TYPE_DISPLAY.get(row['agent_type'], row['agent_type']),
+        'company_name': row['company_name'],
+        'designation': row['designation'],
+        'phone_number': row['phone_number'],
+        'email': row['email'],
+        'website': row['website'],
+        'invoice_to': row['invoice_to'],
+        'street': row['street'],
+        'suburb': row['suburb'],
+        'state': row['state'],
+        'postcode': row['postcode'],
+        'country': row['country'] or None,
+        'description': row['description'],
+        'created_by': created_by,
+        'created_by_name': None if created_by is None else user_display_name(
+            row['created_by__first_name'], row['created_by__last_name'], row['created_by__username'],
+        ),
+        'created_at': _DATETIME_FIELD.to_representation(row['created_at']),
+        'updated_by': updated_by,
+        'updated_by_name': None if updated_by is None else user_display_name(
+            row['updated_by__first_name'], row['updated_by__last_name'], row['updated_by__username'],
+        ),
+        'updated_at': _DATETIME_FIELD.to_representation(row['updated_at']),
+    }
+
+
 class AgentCreateSerializer(serializers.Serializer):
     """
     Serializer for agent creation (POST requests).
@@ -99,9 +173,9 @@ class AgentCreateSerializer(serializers.Serializer):
     suburb = serializers.CharField(max_length=100, required=False, allow_blank=True)
     state = serializers.CharField(max_length=100, required=False, allow_blank=True)
     postcode = serializers.CharField(max_length=20, required=False, allow_blank=True)
-    country = serializers.CharField(max_length=2, required=False, allow_blank=True)
+    country = serializers.CharField(min_length=2, max_length=2, required=False, allow_blank=True)
     
-    description = serializers.CharField(required=False, allow_blank=True)
+    description = serializers.CharField(max_length=500, required=False, allow_blank=True)
 
 
 class AgentUpdateSerializer(serializers.Serializer):
@@ -125,6 +199,6 @@ class AgentUpdateSerializer(serializers.Serializer):
     suburb = serializers.CharField(max_length=100, required=False, allow_blank=True)
     state = serializers.CharField(max_length=100, required=False, allow_blank=True)
     postcode = serializers.CharField(max_length=20, required=False, allow_blank=True)
-    country = serializers.CharField(max_length=2, required=False, allow_blank=True)
+    country = serializers.CharField(min_length=2, max_length=2, required=False, allow_blank=True)
     
-    description = serializers.CharField(required=False, allow_blank=True)
+    description = serializers.CharField(max_length=500, required=False, allow_blank=True)
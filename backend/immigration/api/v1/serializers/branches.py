@@ -7,8 +7,12 @@ They are thin wrappers - business logic lives in services.
 
 from rest_framework import serializers
 from drf_spectacular.utils import extend_schema_field
+from immigration.api.v1.serializers.fields import UTCDateTimeField, user_display_name
 from immigration.models.branch import Branch
 
+# Formats created_at/updated_at exactly as the output serializers do
+_DATETIME_FIELD = UTCDateTimeField(read_only=True)
+
 
 class BranchOutputSerializer(serializers.ModelSerializer):
     """
@@ -58,17 +62,77 @@ class BranchOutputSerializer(serializers.ModelSerializer):
     def get_created_by_name(self, obj):
         """Get creator name if exists."""
         if obj.created_by:
-            return f"{obj.created_by.first_name} {obj.created_by.last_name}".strip() or obj.created_by.username
+            return user_display_name(obj.created_by.first_name, obj.created_by.last_name, obj.created_by.username)
         return None
     
     @extend_schema_field(serializers.CharField(allow_null=True))
     def get_updated_by_name(self, obj):
         """Get updater name if exists."""
         if obj.updated_by:
-            return f"{obj.updated_by.first_name} {obj.updated_by.last_name}".strip() or obj.updated_by.username
+            return user_display_name(obj.updated_by.first_name, obj.updated_by.last_name, obj.updated_by.username)
         return None
 
 
+# Columns read by branch_list_data(), for .values() branch querysets
+BRANCH_LIST_VALUES = (
+    'id',
+    'name',
+    'region_id',
+    'region__name',
+    'phone',
+    'website',
+    'street',
+    'suburb',
+    'state',
+    'postcode',
+    'country',
+    'created_by_id',
+    'created_by__first_name',
+    'created_by__last_name',
+    'created_by__username',
+    'created_at',
+    'updated_by_id',
+    'updated_by__first_name',
+    'updated_by__last_name',
+    'updated_by__username',
+    'updated_at',
+)
+
+
+def branch_list_data(row):
+    """
+    BranchOutputSerializer output for one BRANCH_LIST_VALUES row.
+
+    The branch list builds its rows directly from the values() dicts instead
+    of instantiating branches (and their regions/users) and running the
+    serializer.
+    """
+    created_by, updated_by = row['created_by_id'], row['updated_by_id']
+    return {
+        'id': row['id'],
+        'name': row['name'],
+        'region': row['region_id'],
+        'region_name': row['region__name'],
+        'phone': row['phone'],
+        'website': row['website'],
+        'street': row['street'],
+        'suburb': row['suburb'],
+        'state': row['state'],
+        'postcode': row['postcode'],
+        'country': row['country'],
+        'created_by': created_by,
+        'created_by_name': None if created_by is None else user_display_name(
+            row['created_by__first_name'], row['created_by__last_name'], row['created_by__username'],
+        ),
+        'created_at': _DATETIME_FIELD.to_representation(row['created_at']),
+        'updated_by': updated_by,
+        'updated_by_name': None if updated_by is None else user_display_name(
+            row['updated_by__first_name'], row['updated_by__last_name'], row['updated_by__username'],
+        ),
+        'updated_at': _DATETIME_FIELD.to_representation(row['updated_at']),
+    }
+
+
 class BranchCreateSerializer(serializers.Serializer):
     """
     Serializer for branch creation (POST requests).
@@ -86,7 +150,7 @@ class BranchCreateSerializer(serializers.Serializer):
     suburb = serializers.CharField(max_length=100, required=False, allow_blank=True)
     state = serializers.CharField(max_length=100, required=False, allow_blank=True)
     postcode = serializers.CharField(max_length=20, required=False, allow_blank=True)
-    country = serializers.CharField(max_length=2, required=False, allow_blank=True)
+    country = serializers.CharField(min_length=2, max_length=2, required=False, allow_blank=True)
 
 
 class BranchUpdateSerializer(serializers.Serializer):
@@ -106,7 +170,7 @@ class BranchUpdateSerializer(serializers.Serializer):
     suburb = serializers.CharField(max_length=100, required=False, allow_blank=True)
     state = serializers.CharField(max_length=100, required=False, allow_blank=True)
     postcode = serializers.CharField(max_length=20, required=False, allow_blank=True)
-    country = serializers.CharField(max_length=2, required=False, allow_blank=True)
+    country = serializers.CharField(min_length=2, max_length=2, required=False, allow_blank=True)
 
 
 class BranchOptionSerializer(serializers.ModelSerializer):
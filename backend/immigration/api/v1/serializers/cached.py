@@ -0,0 +1,40 @@
+"""
+Per-class caching of ModelSerializer field introspection.
+
+ModelSerializer.get_fields() walks the model's ``_meta`` and builds every
+field from scratch each time a serializer is instantiated. The result only
+depends on the serializer class, so it is built once per class and every
+instance receives copies it can bind to itself.
+"""
+
+import copy
+
+from rest_framework import serializers
+
+_FIELDS_CACHE = {}
+
+
+def _copy_field(field):
+    """Copy a template field so binding it does not touch the cached one."""
+    if isinstance(field, serializers.BaseSerializer) or hasattr(field, 'child') or hasattr(field, 'child_relation'):
+        # Nested serializers and list fields own bound child fields
+        return copy.deepcopy(field)
+    return copy.copy(field)
+
+
+class CachedFieldsMixin:
+    """
+    Mixin for output serializers instantiated on every request.
+
+    Also worth it on plain Serializers, whose get_fields() deep-copies every
+    declared field per instance.
+
+    Usage: ``class UserOutputSerializer(CachedFieldsMixin, serializers.ModelSerializer)``.
+    """
+
+    def get_fields(self):
+        cls = type(self)
+        template = _FIELDS_CACHE.get(cls)
+        if template is None:
+            template = _FIELDS_CACHE[cls] = super().get_fields()
+        return {name: _copy_field(field) for name, field in template.items()}
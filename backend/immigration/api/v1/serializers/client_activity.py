@@ -7,6 +7,10 @@ ClientActivity is read-only (no create/update serializers needed).
 from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
 from immigration.models import ClientActivity
+from immigration.api.v1.serializers.fields import user_display_name
+
+# Shared by client_activity_data(); stateless, so one instance serves every call
+_DATETIME_FIELD = serializers.DateTimeField(read_only=True)
 
 
 class ClientActivityOutput(serializers.ModelSerializer):
@@ -53,5 +57,28 @@ class ClientActivityOutput(serializers.ModelSerializer):
     def get_performed_by_name(self, obj):
         """Get performer's full name if exists."""
         if obj.performed_by:
-            return f"{obj.performed_by.first_name} {obj.performed_by.last_name}".strip() or obj.performed_by.username
+            return user_display_name(obj.performed_by.first_name, obj.performed_by.last_name, obj.performed_by.username)
         return None
+
+
+def client_activity_data(activity):
+    """
+    ClientActivityOutput output for one activity.
+
+    The timeline builds its page directly instead of instantiating the
+    serializer (and a ListSerializer around it) for every request.
+    """
+    performed_by = activity.performed_by
+    return {
+        'id': activity.id,
+        'client': activity.client_id,
+        'activity_type': activity.activity_type,
+        'activity_type_display': str(activity.get_activity_type_display()),
+        'performed_by': activity.performed_by_id,
+        'performed_by_name': None if performed_by is None else (
+            user_display_name(performed_by.first_name, performed_by.last_name, performed_by.username)
+        ),
+        'description': activity.description,
+        'metadata': activity.metadata,
+        'created_at': _DATETIME_FIELD.to_representation(activity.created_at),
+    }
@@ -2,25 +2,83 @@
 Serializers for client supporting resources.
 """
 
-from rest_framework import serializers
+import datetime
 
+from rest_framework import ISO_8601, serializers
+from rest_framework.settings import api_settings
+
+from immigration.api.v1.serializers.cached import CachedFieldsMixin
+from immigration.api.v1.serializers.fields import UTCDateTimeField
 from immigration.models import LPE, Passport, Proficiency, Qualification, Employment
 
+# Format values exactly as the ModelSerializer fields below do, for the
+# *_list_data() row builders. The fields are built and their methods bound
+# once, at import. DRF emits None without calling them for nulls.
+_format_datetime = UTCDateTimeField(read_only=True).to_representation
+
+if api_settings.DATE_FORMAT == ISO_8601:
+    # DRF's default format is the date's own isoformat()
+    _format_date = datetime.date.isoformat
+else:
+    _format_date = serializers.DateField(read_only=True).to_representation
+
+if api_settings.COERCE_DECIMAL_TO_STRING:
+    # Scores come from numeric(4, 1) columns, already at the field's precision,
+    # so quantizing them again changes nothing
+    _format_score = "{:f}".format
+else:
+    _format_score = serializers.DecimalField(max_digits=4, decimal_places=1, read_only=True).to_representation
+
+
+def _datetime(value):
+    return None if value is None else _format_datetime(value)
+
+
+def _date(value):
+    return None if value is None else _format_date(value)
+
 
-class LPESerializer(serializers.ModelSerializer):
+def _score(value):
+    return None if value is None else _format_score(value)
+
+
+class LPESerializer(CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = LPE
         fields = ["id", "name", "validity_term", "description", "created_at", "updated_at"]
         read_only_fields = ["id", "created_at", "updated_at"]
 
 
-class LPECreateUpdateSerializer(serializers.Serializer):
+# Columns read by lpe_list_data(), for values_list(named=True) exam querysets
+LPE_LIST_VALUES = tuple(LPESerializer.Meta.fields)
+
+
+def lpe_list_data(row):
+    """
+    LPESerializer output for one LPE_LIST_VALUES row.
+
+    List endpoints build their rows with the *_list_data() functions from
+    values_list(named=True) rows, instead of instantiating models and
+    running the ModelSerializer's per-field dispatch for every row. Named
+    rows are plain tuples: Django builds no per-row dict for them.
+    """
+    return {
+        "id": row.id,
+        "name": row.name,
+        "validity_term": row.validity_term,
+        "description": row.description,
+        "created_at": _datetime(row.created_at),
+        "updated_at": _datetime(row.updated_at),
+    }
+
+
+class LPECreateUpdateSerializer(CachedFieldsMixin, serializers.Serializer):
     name = serializers.CharField(max_length=100)
     validity_term = serializers.IntegerField(min_value=0, max_value=100, required=False, default=0)
     description = serializers.CharField(allow_blank=True, required=False, default="")
 
 
-class ProficiencyOutputSerializer(serializers.ModelSerializer):
+class ProficiencyOutputSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     test_name_display = serializers.CharField(source="test_name.name", read_only=True)
 
     class Meta:
@@ -42,7 +100,41 @@ class ProficiencyOutputSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "test_name_display", "created_at", "updated_at"]
 
 
-class ProficiencyCreateUpdateSerializer(serializers.Serializer):
+# Columns read by proficiency_list_data(): the serializer's model fields plus
+# the exam name rendered as test_name_display
+PROFICIENCY_LIST_VALUES = (
+    *(
+        name for name in ProficiencyOutputSerializer.Meta.fields
+        if name not in ProficiencyOutputSerializer._declared_fields
+    ),
+    "test_name__name",
+)
+
+
+def proficiency_list_data(row):
+    """ProficiencyOutputSerializer output for one PROFICIENCY_LIST_VALUES row."""
+    data = {
+        "id": row.id,
+        "client_id": row.client_id,
+        "test_name_id": row.test_name_id,
+    }
+    if row.test_name_id is not None:
+        # The serializer skips test_name.name for proficiencies without an exam
+        data["test_name_display"] = row.test_name__name
+    data.update({
+        "overall_score": _score(row.overall_score),
+        "speaking_score": _score(row.speaking_score),
+        "reading_score": _score(row.reading_score),
+        "listening_score": _score(row.listening_score),
+        "writing_score": _score(row.writing_score),
+        "test_date": _date(row.test_date),
+        "created_at": _datetime(row.created_at),
+        "updated_at": _datetime(row.updated_at),
+    })
+    return data
+
+
+class ProficiencyCreateUpdateSerializer(CachedFieldsMixin, serializers.Serializer):
     client_id = serializers.IntegerField()
     test_name_id = serializers.IntegerField()
     overall_score = serializers.DecimalField(max_digits=4, decimal_places=1)
@@ -53,7 +145,7 @@ class ProficiencyCreateUpdateSerializer(serializers.Serializer):
     test_date = serializers.DateField()
 
 
-class QualificationOutputSerializer(serializers.ModelSerializer):
+class QualificationOutputSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Qualification
         fields = [
@@ -72,7 +164,28 @@ class QualificationOutputSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "created_at", "updated_at"]
 
 
-class QualificationCreateUpdateSerializer(serializers.Serializer):
+# Columns read by qualification_list_data()
+QUALIFICATION_LIST_VALUES = tuple(QualificationOutputSerializer.Meta.fields)
+
+
+def qualification_list_data(row):
+    """QualificationOutputSerializer output for one QUALIFICATION_LIST_VALUES row."""
+    return {
+        "id": row.id,
+        "client_id": row.client_id,
+        "course": row.course,
+        "institute": row.institute,
+        "degree": row.degree,
+        "field_of_study": row.field_of_study,
+        "enroll_date": _date(row.enroll_date),
+        "completion_date": _date(row.completion_date),
+        "country": row.country,
+        "created_at": _datetime(row.created_at),
+        "updated_at": _datetime(row.updated_at),
+    }
+
+
+class QualificationCreateUpdateSerializer(CachedFieldsMixin, serializers.Serializer):
     client_id = serializers.IntegerField()
     course = serializers.CharField(max_length=100)
     institute = serializers.CharField(max_length=100)
@@ -83,7 +196,7 @@ class QualificationCreateUpdateSerializer(serializers.Serializer):
     country = serializers.CharField(max_length=2)
 
 
-class PassportOutputSerializer(serializers.ModelSerializer):
+class PassportOutputSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Passport
         fields = [
@@ -101,7 +214,27 @@ class PassportOutputSerializer(serializers.ModelSerializer):
         read_only_fields = ["client_id", "created_at", "updated_at"]
 
 
-class PassportCreateUpdateSerializer(serializers.Serializer):
+# Columns read by passport_list_data()
+PASSPORT_LIST_VALUES = tuple(PassportOutputSerializer.Meta.fields)
+
+
+def passport_list_data(row):
+    """PassportOutputSerializer output for one PASSPORT_LIST_VALUES row."""
+    return {
+        "client_id": row.client_id,
+        "passport_no": row.passport_no,
+        "passport_country": row.passport_country,
+        "date_of_issue": _date(row.date_of_issue),
+        "date_of_expiry": _date(row.date_of_expiry),
+        "place_of_issue": row.place_of_issue,
+        "country_of_birth": row.country_of_birth,
+        "nationality": row.nationality,
+        "created_at": _datetime(row.created_at),
+        "updated_at": _datetime(row.updated_at),
+    }
+
+
+class PassportCreateUpdateSerializer(CachedFieldsMixin, serializers.Serializer):
     client_id = serializers.IntegerField()
     passport_no = serializers.CharField(max_length=20)
     passport_country = serializers.CharField(max_length=2)
@@ -112,7 +245,7 @@ class PassportCreateUpdateSerializer(serializers.Serializer):
     nationality = serializers.CharField(max_length=2)
 
 
-class EmploymentOutputSerializer(serializers.ModelSerializer):
+class EmploymentOutputSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Employment
         fields = [
@@ -129,7 +262,26 @@ class EmploymentOutputSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "created_at", "updated_at"]
 
 
-class EmploymentCreateUpdateSerializer(serializers.Serializer):
+# Columns read by employment_list_data()
+EMPLOYMENT_LIST_VALUES = tuple(EmploymentOutputSerializer.Meta.fields)
+
+
+def employment_list_data(row):
+    """EmploymentOutputSerializer output for one EMPLOYMENT_LIST_VALUES row."""
+    return {
+        "id": row.id,
+        "client_id": row.client_id,
+        "employer_name": row.employer_name,
+        "position": row.position,
+        "start_date": _date(row.start_date),
+        "end_date": _date(row.end_date),
+        "country": row.country,
+        "created_at": _datetime(row.created_at),
+        "updated_at": _datetime(row.updated_at),
+    }
+
+
+class EmploymentCreateUpdateSerializer(CachedFieldsMixin, serializers.Serializer):
     client_id = serializers.IntegerField()
     employer_name = serializers.CharField(max_length=200)
     position = serializers.CharField(max_length=200)
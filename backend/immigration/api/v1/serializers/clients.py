@@ -9,6 +9,10 @@ from rest_framework import serializers
 from drf_spectacular.utils import extend_schema_field
 from immigration.models import Client
 
+# Shared by client_output_data(); stateless, so one instance serves every call
+_DATE_FIELD = serializers.DateField(read_only=True)
+_DATETIME_FIELD = serializers.DateTimeField(read_only=True)
+
 
 class ClientOutputSerializer(serializers.ModelSerializer):
     """
@@ -98,6 +102,64 @@ class ClientOutputSerializer(serializers.ModelSerializer):
         return None
 
 
+# Columns read by ClientOutputSerializer, for .only() client querysets joined
+# as in client_list(): the related rows contribute just the names rendered
+CLIENT_OUTPUT_ONLY = (
+    *(name for name in ClientOutputSerializer.Meta.fields if name not in ClientOutputSerializer._declared_fields),
+    'visa_category__name',
+    'agent__agent_name',
+    'assigned_to__first_name',
+    'assigned_to__last_name',
+    'branch__name',
+    'created_by__first_name',
+    'created_by__last_name',
+)
+
+
+def client_output_data(client):
+    """
+    ClientOutputSerializer output for one client.
+
+    ClientViewSet renders every client response with it: builds the dict
+    directly instead of instantiating the serializer and walking its fields.
+    The serializer still describes the responses in the API schema.
+    """
+    agent, assigned_to = client.agent, client.assigned_to
+    created_by, branch = client.created_by, client.branch
+    return {
+        'id': client.id,
+        'first_name': client.first_name,
+        'middle_name': client.middle_name,
+        'last_name': client.last_name,
+        'gender': client.gender,
+        'dob': None if client.dob is None else _DATE_FIELD.to_representation(client.dob),
+        'phone_number': client.phone_number,
+        'email': client.email,
+        'referred_by': client.referred_by,
+        'street': client.street,
+        'suburb': client.suburb,
+        'state': client.state,
+        'postcode': client.postcode,
+        'country': client.country.code,
+        'visa_category': client.visa_category_id,
+        'visa_category_name': client.visa_category.name if client.visa_category_id is not None else None,
+        'agent': client.agent_id,
+        'agent_name': str(agent) if agent else None,
+        'description': client.description,
+        'assigned_to': client.assigned_to_id,
+        'assigned_to_name': f"{assigned_to.first_name} {assigned_to.last_name}" if assigned_to else None,
+        'stage': client.stage,
+        'active': client.active,
+        'branch': client.branch_id,
+        'branch_name': branch.name if branch else None,
+        'created_by': client.created_by_id,
+        'created_by_name': f"{created_by.first_name} {created_by.last_name}" if created_by else None,
+        'created_at': _DATETIME_FIELD.to_representation(client.created_at),
+        'updated_by': client.updated_by_id,
+        'updated_at': _DATETIME_FIELD.to_representation(client.updated_at),
+    }
+
+
 class ClientCreateSerializer(serializers.Serializer):
     """
     Serializer for client creation (POST requests).
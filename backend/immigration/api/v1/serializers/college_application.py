@@ -10,6 +10,13 @@ from drf_spectacular.utils import extend_schema_field
 
 from immigration.models import ApplicationType, Stage, CollegeApplication
 
+# Fields formatting values for the *_output_data() builders, as the
+# ModelSerializer fields below do
+_DATE_FIELD = serializers.DateField(read_only=True)
+_DATETIME_FIELD = serializers.DateTimeField(read_only=True)
+_TAX_PERCENTAGE_FIELD = serializers.DecimalField(max_digits=5, decimal_places=2, read_only=True)
+_TUITION_FEE_FIELD = serializers.DecimalField(max_digits=12, decimal_places=2, read_only=True)
+
 
 # ==============================================================================
 # APPLICATION TYPE SERIALIZERS
@@ -70,6 +77,34 @@ class ApplicationTypeOutputSerializer(serializers.ModelSerializer):
         return None
 
 
+def application_type_output_data(application_type):
+    """
+    ApplicationTypeOutputSerializer output for one application type.
+
+    The viewsets build their responses with the *_output_data() functions
+    of this module instead of instantiating the serializer and walking its
+    fields per object. The serializers still describe the responses in the
+    API schema.
+    """
+    created_by = application_type.created_by
+    return {
+        'id': application_type.id,
+        'title': application_type.title,
+        'currency': application_type.currency,
+        'tax_name': application_type.tax_name,
+        'tax_percentage': _TAX_PERCENTAGE_FIELD.to_representation(application_type.tax_percentage),
+        'description': application_type.description,
+        'is_active': application_type.is_active,
+        'stages_count': application_type.stages_count,
+        'has_applications': application_type.has_applications,
+        'created_by': application_type.created_by_id,
+        'created_by_name': f"{created_by.first_name} {created_by.last_name}" if created_by else None,
+        'created_at': _DATETIME_FIELD.to_representation(application_type.created_at),
+        'updated_by': application_type.updated_by_id,
+        'updated_at': _DATETIME_FIELD.to_representation(application_type.updated_at),
+    }
+
+
 class ApplicationTypeCreateSerializer(serializers.Serializer):
     """
     Serializer for application type creation (POST requests).
@@ -167,6 +202,23 @@ class StageOutputSerializer(serializers.ModelSerializer):
         return obj.is_final_stage
 
 
+def stage_output_data(stage):
+    """StageOutputSerializer output for one stage."""
+    return {
+        'id': stage.id,
+        'application_type': stage.application_type_id,
+        'application_type_title': stage.application_type.title,
+        'stage_name': stage.stage_name,
+        'position': stage.position,
+        'description': stage.description,
+        'is_final_stage': stage.is_final_stage,
+        'created_by': stage.created_by_id,
+        'created_at': _DATETIME_FIELD.to_representation(stage.created_at),
+        'updated_by': stage.updated_by_id,
+        'updated_at': _DATETIME_FIELD.to_representation(stage.updated_at),
+    }
+
+
 class StageCreateSerializer(serializers.Serializer):
     """
     Serializer for stage creation (POST requests).
@@ -348,6 +400,49 @@ class CollegeApplicationOutputSerializer(serializers.ModelSerializer):
         return obj.is_final_stage
 
 
+def college_application_output_data(application):
+    """CollegeApplicationOutputSerializer output for one college application."""
+    client, stage, location = application.client, application.stage, application.location
+    super_agent, sub_agent = application.super_agent, application.sub_agent
+    assigned_to = application.assigned_to
+    state, country_name = location.state or '', location.country.name if location.country else ''
+    return {
+        'id': application.id,
+        'application_type': application.application_type_id,
+        'application_type_title': application.application_type.title,
+        'stage': application.stage_id,
+        'stage_name': stage.stage_name,
+        'stage_position': stage.position,
+        'is_final_stage': application.is_final_stage,
+        'client': application.client_id,
+        'client_name': f"{client.first_name} {client.last_name}",
+        'institute': application.institute_id,
+        'institute_name': application.institute.name,
+        'course': application.course_id,
+        'course_name': application.course.name,
+        'start_date': application.start_date_id,
+        'intake_date': _DATE_FIELD.to_representation(application.start_date.intake_date),
+        'location': application.location_id,
+        'location_display': f"{state}, {country_name}" if state and country_name else state or country_name,
+        'finish_date': (
+            None if application.finish_date is None else _DATE_FIELD.to_representation(application.finish_date)
+        ),
+        'total_tuition_fee': _TUITION_FEE_FIELD.to_representation(application.total_tuition_fee),
+        'student_id': application.student_id,
+        'super_agent': application.super_agent_id,
+        'super_agent_name': super_agent.agent_name if super_agent else None,
+        'sub_agent': application.sub_agent_id,
+        'sub_agent_name': sub_agent.agent_name if sub_agent else None,
+        'assigned_to': application.assigned_to_id,
+        'assigned_to_name': f"{assigned_to.first_name} {assigned_to.last_name}" if assigned_to else None,
+        'notes': application.notes,
+        'created_by': application.created_by_id,
+        'created_at': _DATETIME_FIELD.to_representation(application.created_at),
+        'updated_by': application.updated_by_id,
+        'updated_at': _DATETIME_FIELD.to_representation(application.updated_at),
+    }
+
+
 class CollegeApplicationCreateSerializer(serializers.Serializer):
     """
     Serializer for college application creation (POST requests).
@@ -0,0 +1,158 @@
+"""
+Compiled to_representation for read-only output serializers.
+
+DRF's Serializer.to_representation walks ``_readable_fields`` for every row and
+calls get_attribute()/to_representation() on each field generically. On list
+endpoints that loop dominates serialization time.
+
+CompiledRepresentationMixin generates a straight-line function for the
+serializer's field layout the first time it is used, caches the generated
+code on the serializer class, and reuses it for every row:
+
+- plain model columns are read directly (``instance.title``) and, for simple
+  field types, cast inline instead of calling field.to_representation()
+- foreign keys rendered as primary keys read the ``*_id`` column directly
+- every other field keeps DRF's exact get_attribute/to_representation calls
+
+Output is identical to the generic DRF loop. When the serializer context sets
+``omit_nulls`` (opt-in per request), null values are left out of the row
+except for fields listed in ``always_include_fields``.
+"""
+
+from rest_framework import serializers
+from rest_framework.fields import Field, SkipField
+from rest_framework.relations import PKOnlyObject, PrimaryKeyRelatedField
+from rest_framework.settings import api_settings
+
+# Field classes whose to_representation is a plain cast of a model column.
+# Matched by exact type so subclasses with custom behaviour are left alone.
+_COLUMN_CASTS = {
+    serializers.CharField: 'str',
+    serializers.IntegerField: 'int',
+    serializers.ReadOnlyField: '',
+}
+
+# BigAutoField primary keys map to BigIntegerField on DRF >= 3.16
+_BigIntegerField = getattr(serializers, 'BigIntegerField', None)
+
+
+def _plan_field(field, columns):
+    """Return the compile step for a bound field."""
+    attrs = field.source_attrs
+    if len(attrs) == 1 and attrs[0].isidentifier():
+        column = columns.get(attrs[0])
+        if column is not None:
+            field_type = type(field)
+            if column.many_to_one:
+                if field_type is PrimaryKeyRelatedField and field.pk_field is None:
+                    return ('column', column.attname, '')
+            elif not column.is_relation and field_type.get_attribute is Field.get_attribute:
+                if field_type in _COLUMN_CASTS:
+                    return ('column', column.attname, _COLUMN_CASTS[field_type])
+                if field_type is _BigIntegerField and not getattr(
+                    field, 'coerce_to_string', api_settings.COERCE_BIGINT_TO_STRING
+                ):
+                    return ('column', column.attname, 'int')
+                if field_type is serializers.JSONField and not field.binary:
+                    return ('column', column.attname, '')
+                return ('convert', column.attname)
+    return ('field',)
+
+
+def _emit(lines, indent, key, expr, check, skip_null):
+    """Append the statement storing ``expr`` under ``key`` in the row dict."""
+    if skip_null:
+        if expr != check:
+            lines.append(f'{indent}value = None if {check} is None else {expr}')
+        lines.append(f'{indent}if value is not None:')
+        lines.append(f'{indent}    ret[{key}] = value')
+    elif expr == check:
+        lines.append(f'{indent}ret[{key}] = {expr}')
+    else:
+        lines.append(f'{indent}ret[{key}] = None if {check} is None else {expr}')
+
+
+def _generate_source(names, plan, omit):
+    """Generate the factory source for one field layout."""
+    lines = [
+        'def _factory(fields, SkipField, PKOnlyObject):',
+        '    get_attribute = [f.get_attribute for f in fields]',
+        '    represent = [f.to_representation for f in fields]',
+    ]
+    for index, step in enumerate(plan):
+        if step[0] == 'field':
+            lines.append(f'    get_{index} = get_attribute[{index}]')
+        if step[0] != 'column':
+            lines.append(f'    rep_{index} = represent[{index}]')
+    lines.append('    def to_representation(instance):')
+    lines.append('        ret = {}')
+    for index, (name, step, skip_null) in enumerate(zip(names, plan, omit, strict=True)):
+        key = repr(name)
+        if step[0] == 'column':
+            _, attname, cast = step
+            lines.append(f'        value = instance.{attname}')
+            expr = f'{cast}(value)' if cast else 'value'
+            _emit(lines, '        ', key, expr, 'value', skip_null)
+        elif step[0] == 'convert':
+            lines.append(f'        value = instance.{step[1]}')
+            _emit(lines, '        ', key, f'rep_{index}(value)', 'value', skip_null)
+        else:
+            lines.append('        try:')
+            lines.append(f'            value = get_{index}(instance)')
+            lines.append('        except SkipField:')
+            lines.append('            pass')
+            lines.append('        else:')
+            lines.append(
+                '            check = value.pk if isinstance(value, PKOnlyObject) else value'
+            )
+            _emit(lines, '            ', key, f'rep_{index}(value)', 'check', skip_null)
+    lines.append('        return ret')
+    lines.append('    return to_representation')
+    return '\n'.join(lines)
+
+
+class CompiledRepresentationMixin:
+    """
+    Mixin for ModelSerializer output serializers used on list endpoints.
+
+    Usage: ``class TaskOutputSerializer(CompiledRepresentationMixin, serializers.ModelSerializer)``.
+    Instances that are not of ``Meta.model`` fall back to DRF's generic loop.
+    """
+
+    # Fields emitted even when null while context['omit_nulls'] is set
+    always_include_fields = frozenset()
+
+    def _compile_representation(self):
+        fields = list(self._readable_fields)
+        columns = {
+            column.name: column for column in self.Meta.model._meta.concrete_fields
+        }
+        names = tuple(field.field_name for field in fields)
+        plan = tuple(_plan_field(field, columns) for field in fields)
+        if self.context.get('omit_nulls'):
+            omit = tuple(name not in self.always_include_fields for name in names)
+        else:
+            omit = (False,) * len(names)
+
+        cls = type(self)
+        factories = cls.__dict__.get('_compiled_factories')
+        if factories is None:
+            factories = {}
+            cls._compiled_factories = factories
+        layout = (names, plan, omit)
+        factory = factories.get(layout)
+        if factory is None:
+            namespace = {}
+            source = _generate_source(names, plan, omit)
+            exec(compile(source, f'<compiled {cls.__name__}>', 'exec'), namespace)
+            factory = factories[layout] = namespace['_factory']
+        return factory(fields, SkipField, PKOnlyObject)
+
+    def to_representation(self, instance):
+        if not isinstance(instance, self.Meta.model):
+            return super().to_representation(instance)
+        compiled = self.__dict__.get('_compiled_representation')
+        if compiled is None:
+            compiled = self._compile_representation()
+            self._compiled_representation = compiled
+        return compiled(instance)
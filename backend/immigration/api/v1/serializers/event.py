@@ -8,6 +8,12 @@ They are thin wrappers - business logic lives in services.
 from rest_framework import serializers
 from drf_spectacular.utils import extend_schema_field
 from immigration.models import CalendarEvent
+from immigration.api.v1.serializers.fields import user_display_name
+
+# Fields formatting values for event_output_data(), as the ModelSerializer
+# fields below do
+_DATETIME_FIELD = serializers.DateTimeField(read_only=True)
+_DURATION_FIELD = serializers.DurationField(read_only=True)
 
 
 class EventOutputSerializer(serializers.ModelSerializer):
@@ -85,7 +91,7 @@ class EventOutputSerializer(serializers.ModelSerializer):
     @extend_schema_field(serializers.CharField(allow_null=True))
     def get_assigned_to_full_name(self, obj):
         if obj.assigned_to:
-            return f"{obj.assigned_to.first_name} {obj.assigned_to.last_name}".strip() or obj.assigned_to.username
+            return user_display_name(obj.assigned_to.first_name, obj.assigned_to.last_name, obj.assigned_to.username)
         return None
 
     @extend_schema_field(serializers.CharField(allow_null=True))
@@ -105,6 +111,51 @@ class EventOutputSerializer(serializers.ModelSerializer):
         return obj.duration_minutes
 
 
+def event_output_data(event):
+    """
+    EventOutputSerializer output for one event.
+
+    The event endpoints build their responses with it instead of
+    instantiating the serializer and walking its fields per object. The
+    serializer still describes the responses in the API schema.
+    """
+    assigned_to, branch = event.assigned_to, event.branch
+    created_by, updated_by = event.created_by, event.updated_by
+    if assigned_to:
+        assigned_to_full_name = (
+            user_display_name(assigned_to.first_name, assigned_to.last_name, assigned_to.username)
+        )
+    else:
+        assigned_to_full_name = None
+    return {
+        'id': event.id,
+        'title': event.title,
+        'description': event.description,
+        'start': _DATETIME_FIELD.to_representation(event.start),
+        'end': _DATETIME_FIELD.to_representation(event.end),
+        'duration': None if event.duration is None else _DURATION_FIELD.to_representation(event.duration),
+        'duration_minutes': event.duration_minutes,
+        'assigned_to': event.assigned_to_id,
+        'assigned_to_name': assigned_to.username if assigned_to else None,
+        'assigned_to_full_name': assigned_to_full_name,
+        'hex_color': event.hex_color,
+        'location': event.location,
+        'all_day': event.all_day,
+        'branch': event.branch_id,
+        'branch_id': event.branch_id,
+        'branch_name': branch.name if branch else None,
+        'created_by': event.created_by_id,
+        'created_by_name': created_by.username if created_by else None,
+        'created_at': _DATETIME_FIELD.to_representation(event.created_at),
+        'updated_by': event.updated_by_id,
+        'updated_by_name': updated_by.username if updated_by else None,
+        'updated_at': _DATETIME_FIELD.to_representation(event.updated_at),
+        'is_past': event.is_past,
+        'is_ongoing': event.is_ongoing,
+        'is_upcoming': event.is_upcoming,
+    }
+
+
 class EventCreateSerializer(serializers.Serializer):
     """
     Serializer for creating calendar events (POST requests).
@@ -0,0 +1,158 @@
+"""
+Reusable read-only serializer fields for output serializers.
+
+These replace repetitive SerializerMethodFields (one get_* method per column)
+with small field classes that can be declared once per column.
+"""
+
+import datetime
+
+from django.conf import settings
+from django.core.validators import MaxLengthValidator, MinLengthValidator
+from drf_spectacular.utils import extend_schema_field
+from rest_framework import ISO_8601, serializers
+from rest_framework.settings import api_settings
+from rest_framework.utils.formatting import lazy_format
+
+_SERVER_TZ_IS_UTC = settings.TIME_ZONE == 'UTC'
+
+_MISSING = object()
+
+# Normalized ChoiceField state keyed by the choices tuple, see CachedChoiceField
+_CHOICES_CACHE = {}
+
+
+def length_validators(min_length=None, max_length=None):
+    """
+    CharField length validators with DRF's messages, built once and shared.
+
+    Usage: ``USERNAME_VALIDATORS = length_validators(3, 150)`` at module level,
+    then ``serializers.CharField(validators=USERNAME_VALIDATORS)`` in place of
+    ``min_length=3, max_length=150`` on every field that uses the same bounds.
+    """
+    messages = serializers.CharField.default_error_messages
+    validators = []
+    if max_length is not None:
+        message = lazy_format(messages['max_length'], max_length=max_length)
+        validators.append(MaxLengthValidator(max_length, message=message))
+    if min_length is not None:
+        message = lazy_format(messages['min_length'], min_length=min_length)
+        validators.append(MinLengthValidator(min_length, message=message))
+    return validators
+
+
+def user_display_name(first_name, last_name, username=''):
+    """
+    "first last" name of a person, or username when both are blank.
+
+    Shared by the ``*_name`` output fields and the fast row builders that read
+    the columns with values(); fields without a username fallback omit it.
+    """
+    return " ".join(filter(None, (first_name, last_name))) or username
+
+
+@extend_schema_field(serializers.CharField(allow_null=True))
+class UsernameField(serializers.Field):
+    """
+    Read-only username of a related user.
+
+    Usage: ``assigned_by_name = UsernameField('assigned_by')``.
+    DRF emits None without calling to_representation when the user is unset.
+    """
+
+    def __init__(self, user_attr, **kwargs):
+        kwargs['source'] = user_attr
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, user):
+        return user.username
+
+
+@extend_schema_field(serializers.CharField(allow_null=True))
+class FullNameField(UsernameField):
+    """
+    Read-only "first last" name of a related user.
+
+    Usage: ``assigned_to_full_name = FullNameField('assigned_to')``.
+    """
+
+    def to_representation(self, user):
+        return user_display_name(user.first_name, user.last_name)
+
+
+@extend_schema_field(serializers.CharField(allow_null=True))
+class AnnotatedNameField(serializers.Field):
+    """
+    Read-only "first last" name of a related person, read from a queryset
+    annotation when present.
+
+    Usage: ``client_name = AnnotatedNameField('client', 'client_name_ann')``.
+    Instances loaded without the annotation (single-object responses) fall
+    back to building the name from the related object.
+    """
+
+    def __init__(self, relation, annotation, **kwargs):
+        self.relation = relation
+        self.annotation = annotation
+        kwargs['source'] = '*'
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, instance):
+        name = getattr(instance, self.annotation, _MISSING)
+        if name is _MISSING:
+            related = getattr(instance, self.relation)
+            name = " ".join((related.first_name, related.last_name)) if related else None
+        return name
+
+
+class CachedChoiceField(serializers.ChoiceField):
+    """
+    ChoiceField that normalizes a given choices tuple only once.
+
+    Serializers deep-copy their declared fields per instance, which re-runs
+    ChoiceField.__init__ and rebuilds the choice dicts on every request.
+    Fields declared with the same (hashable) choices share one read-only copy.
+
+    Usage: ``group_name = CachedChoiceField(choices=GROUP_CHOICES)``.
+    """
+
+    def _set_choices(self, choices):
+        try:
+            cached = _CHOICES_CACHE.get(choices)
+        except TypeError:
+            # Unhashable choices (lists, dicts): normalize as usual
+            super()._set_choices(choices)
+            return
+        if cached is None:
+            super()._set_choices(choices)
+            cached = _CHOICES_CACHE[choices] = (
+                self.grouped_choices,
+                self._choices,
+                self.choice_strings_to_values,
+            )
+        else:
+            self.grouped_choices, self._choices, self.choice_strings_to_values = cached
+
+    choices = property(serializers.ChoiceField._get_choices, _set_choices)
+
+
+class UTCDateTimeField(serializers.DateTimeField):
+    """
+    DateTimeField with a fast path for datetimes already in UTC.
+
+    TIME_ZONE is UTC and the database hands back UTC-aware datetimes, so DRF's
+    astimezone() round trip in enforce_timezone() changes nothing. Format those
+    values directly; output is identical to DateTimeField (ISO 8601, "Z").
+    Use via ``serializer_field_mapping`` on list-heavy ModelSerializers.
+    """
+
+    def to_representation(self, value):
+        if (
+            _SERVER_TZ_IS_UTC
+            and getattr(value, 'tzinfo', None) is datetime.UTC
+            and getattr(self, 'format', api_settings.DATETIME_FORMAT) == ISO_8601
+        ):
+            return value.isoformat()[:-6] + 'Z'
+        return super().to_representation(value)
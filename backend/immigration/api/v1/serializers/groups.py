@@ -7,6 +7,9 @@ from drf_spectacular.utils import extend_schema_field
 from django.contrib.auth.models import Group, Permission
 from immigration.constants import EXCLUDED_PERMISSION_CONTENT_TYPES, GROUP_DISPLAY_NAMES
 
+# "app_label.model" strings, as a set for per-permission membership tests
+EXCLUDED_CONTENT_TYPES = frozenset(EXCLUDED_PERMISSION_CONTENT_TYPES)
+
 
 def should_exclude_permission(permission):
     """
@@ -27,7 +30,7 @@ def should_exclude_permission(permission):
     else:
         return False
     
-    return content_type_str in EXCLUDED_PERMISSION_CONTENT_TYPES
+    return content_type_str in EXCLUDED_CONTENT_TYPES
 
 
 class PermissionSerializer(serializers.ModelSerializer):
@@ -8,6 +8,7 @@ They follow the pattern: CreateRequest, UpdateRequest, and Output serializers.
 from rest_framework import serializers
 from drf_spectacular.utils import extend_schema_field
 from immigration.models import Note
+from immigration.api.v1.serializers.fields import user_display_name
 
 
 class NoteCreateRequest(serializers.Serializer):
@@ -90,5 +91,5 @@ class NoteOutput(serializers.ModelSerializer):
     def get_author_name(self, obj):
         """Get author's full name if exists."""
         if obj.author:
-            return f"{obj.author.first_name} {obj.author.last_name}".strip() or obj.author.username
+            return user_display_name(obj.author.first_name, obj.author.last_name, obj.author.username)
         return None
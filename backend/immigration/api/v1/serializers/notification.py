@@ -11,6 +11,7 @@ are defined in one file and imported by views.
 from rest_framework import serializers
 from drf_spectacular.utils import extend_schema_field
 from immigration.models.notification import Notification
+from immigration.api.v1.serializers.fields import user_display_name
 from immigration.constants import NotificationType
 
 
@@ -58,7 +59,7 @@ class NotificationOutputSerializer(serializers.ModelSerializer):
     def get_assigned_to_name(self, obj):
         """Get assigned user's full name if exists."""
         if obj.assigned_to:
-            return f"{obj.assigned_to.first_name} {obj.assigned_to.last_name}".strip()
+            return user_display_name(obj.assigned_to.first_name, obj.assigned_to.last_name)
         return None
     
     @extend_schema_field(serializers.BooleanField())
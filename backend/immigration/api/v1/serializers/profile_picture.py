@@ -8,6 +8,7 @@ File upload uses multipart/form-data, handled separately in views.
 from rest_framework import serializers
 from drf_spectacular.utils import extend_schema_field
 from immigration.models import ProfilePicture
+from immigration.api.v1.serializers.fields import user_display_name
 
 
 class ProfilePictureOutput(serializers.ModelSerializer):
@@ -41,7 +42,7 @@ class ProfilePictureOutput(serializers.ModelSerializer):
     def get_uploaded_by_name(self, obj):
         """Get uploader's full name if exists."""
         if obj.uploaded_by:
-            return f"{obj.uploaded_by.first_name} {obj.uploaded_by.last_name}".strip() or obj.uploaded_by.username
+            return user_display_name(obj.uploaded_by.first_name, obj.uploaded_by.last_name, obj.uploaded_by.username)
         return None
     
     @extend_schema_field(serializers.URLField(allow_null=True))
@@ -60,3 +60,14 @@ class RegionUpdateSerializer(serializers.Serializer):
     name = serializers.CharField(max_length=100, required=False)
     description = serializers.CharField(required=False, allow_blank=True, max_length=1000)
 
+
+class RegionOptionSerializer(serializers.ModelSerializer):
+    """
+    Lightweight serializer for region dropdowns/select lists.
+    Returns only id and name.
+    """
+
+    class Meta:
+        model = Region
+        fields = ['id', 'name']
+        read_only_fields = ['id', 'name']
@@ -8,19 +8,51 @@ This module follows the centralized schema pattern where all task serializers
 are defined in one file and imported by views.
 """
 
+from django.db import models
 from rest_framework import serializers
 from drf_spectacular.utils import extend_schema_field
 from immigration.models.task import Task
+from immigration.api.v1.serializers.compiled import CompiledRepresentationMixin
+from immigration.api.v1.serializers.fields import (
+    FullNameField,
+    UTCDateTimeField,
+    UsernameField,
+    user_display_name,
+)
 from immigration.constants import TaskPriority, TaskStatus
 
 
-class TaskOutputSerializer(serializers.ModelSerializer):
+class TaskOutputSerializer(CompiledRepresentationMixin, serializers.ModelSerializer):
     """
     Serializer for task output (GET requests).
     
     Returns complete task data including computed fields.
+    Null assignment/link fields are omitted when the view sets
+    context['omit_nulls'] (see TaskViewSet.get_serializer_context).
     """
 
+    always_include_fields = frozenset({
+        'id',
+        'title',
+        'detail',
+        'priority',
+        'priority_display',
+        'status',
+        'status_display',
+        'due_date',
+        'assigned_to_branch',
+        'tags',
+        'comments',
+        'created_at',
+        'updated_at',
+    })
+
+    # due_date/completed_at/created_at/updated_at are formatted for every row
+    serializer_field_mapping = {
+        **serializers.ModelSerializer.serializer_field_mapping,
+        models.DateTimeField: UTCDateTimeField,
+    }
+
     assigned_to_name = serializers.CharField(
         source='assigned_to.username',
         read_only=True,
@@ -28,7 +60,7 @@ class TaskOutputSerializer(serializers.ModelSerializer):
     )
     
     # Computed field for full name
-    assigned_to_full_name = serializers.SerializerMethodField()
+    assigned_to_full_name = FullNameField('assigned_to')
     
     # Branch assignment fields
     branch_id = serializers.IntegerField(
@@ -44,16 +76,16 @@ class TaskOutputSerializer(serializers.ModelSerializer):
     assigned_to_branch = serializers.SerializerMethodField()
     
     # Assigned by fields
-    assigned_by_name = serializers.SerializerMethodField()
-    assigned_by_full_name = serializers.SerializerMethodField()
+    assigned_by_name = UsernameField('assigned_by')
+    assigned_by_full_name = FullNameField('assigned_by')
 
     # Created by fields (for delete permissions)
-    created_by_name = serializers.SerializerMethodField()
-    created_by_full_name = serializers.SerializerMethodField()
+    created_by_name = UsernameField('created_by')
+    created_by_full_name = FullNameField('created_by')
 
     # Updated by fields (for completed/cancelled tasks)
-    updated_by_name = serializers.SerializerMethodField()
-    updated_by_full_name = serializers.SerializerMethodField()
+    updated_by_name = UsernameField('updated_by')
+    updated_by_full_name = FullNameField('updated_by')
     
     # Linked entity fields
     linked_entity_type = serializers.SerializerMethodField()
@@ -72,7 +104,7 @@ class TaskOutputSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Task
-        fields = [
+        fields = (
             'id',
             'title',
             'detail',
@@ -106,62 +138,13 @@ class TaskOutputSerializer(serializers.ModelSerializer):
             'completed_at',
             'created_at',
             'updated_at',
-        ]
-        read_only_fields = [
+        )
+        read_only_fields = (
             'id',
             'completed_at',
             'created_at',
             'updated_at',
-        ]
-    
-    @extend_schema_field(serializers.CharField(allow_null=True))
-    def get_assigned_to_full_name(self, obj):
-        """Get assigned user's full name if exists."""
-        if obj.assigned_to:
-            return f"{obj.assigned_to.first_name} {obj.assigned_to.last_name}".strip()
-        return None
-    
-    @extend_schema_field(serializers.CharField(allow_null=True))
-    def get_assigned_by_name(self, obj):
-        """Get assigned_by user's username if exists."""
-        if obj.assigned_by:
-            return obj.assigned_by.username
-        return None
-    
-    @extend_schema_field(serializers.CharField(allow_null=True))
-    def get_assigned_by_full_name(self, obj):
-        """Get assigned_by user's full name if exists."""
-        if obj.assigned_by:
-            return f"{obj.assigned_by.first_name} {obj.assigned_by.last_name}".strip()
-        return None
-
-    @extend_schema_field(serializers.CharField(allow_null=True))
-    def get_created_by_name(self, obj):
-        """Get created_by user's username if exists."""
-        if obj.created_by:
-            return obj.created_by.username
-        return None
-
-    @extend_schema_field(serializers.CharField(allow_null=True))
-    def get_created_by_full_name(self, obj):
-        """Get created_by user's full name if exists."""
-        if obj.created_by:
-            return f"{obj.created_by.first_name} {obj.created_by.last_name}".strip()
-        return None
-
-    @extend_schema_field(serializers.CharField(allow_null=True))
-    def get_updated_by_name(self, obj):
-        """Get updated_by user's username if exists."""
-        if obj.updated_by:
-            return obj.updated_by.username
-        return None
-    
-    @extend_schema_field(serializers.CharField(allow_null=True))
-    def get_updated_by_full_name(self, obj):
-        """Get updated_by user's full name if exists."""
-        if obj.updated_by:
-            return f"{obj.updated_by.first_name} {obj.updated_by.last_name}".strip()
-        return None
+        )
     
     @extend_schema_field(serializers.BooleanField())
     def get_assigned_to_branch(self, obj):
@@ -185,7 +168,7 @@ class TaskOutputSerializer(serializers.ModelSerializer):
 
         if entity_type == 'client':
             # For clients, return full name
-            return f"{obj.linked_entity.first_name} {obj.linked_entity.last_name}".strip()
+            return user_display_name(obj.linked_entity.first_name, obj.linked_entity.last_name)
         elif entity_type == 'visaapplication':
             # For visa applications, return application number or client name
             if hasattr(obj.linked_entity, 'application_number'):
@@ -4,15 +4,63 @@ User serializers - SIMPLIFIED to use Django Groups only.
 No role field - uses group_name instead.
 """
 
+from operator import attrgetter
+
 from rest_framework import serializers
 from drf_spectacular.utils import extend_schema_field
 from django.contrib.auth import get_user_model
 from immigration.constants import ALL_GROUPS, GROUP_DISPLAY_NAMES
+from immigration.api.v1.serializers.branches import BranchOptionSerializer
+from immigration.api.v1.serializers.cached import CachedFieldsMixin
+from immigration.api.v1.serializers.fields import CachedChoiceField, length_validators
+from immigration.api.v1.serializers.groups import EXCLUDED_CONTENT_TYPES
+from immigration.api.v1.serializers.regions import RegionOptionSerializer
 
 User = get_user_model()
 
+_MISSING = object()
+
+GROUP_CHOICES = tuple(ALL_GROUPS)
+
+# Length rules shared by the user create/update fields
+USERNAME_VALIDATORS = length_validators(3, 150)
+NAME_VALIDATORS = length_validators(1, 150)
+PASSWORD_VALIDATORS = length_validators(8)
+
+# Display names for every known group, so the replace().title() fallback only
+# ever runs for groups created outside ALL_GROUPS
+_GROUP_DISPLAY = {
+    name: GROUP_DISPLAY_NAMES.get(name, name.replace('_', ' ').title())
+    for name in ALL_GROUPS
+}
+
+
+def group_display_name(name):
+    """Display name for a group name."""
+    display = _GROUP_DISPLAY.get(name)
+    if display is None:
+        display = name.replace('_', ' ').title()
+    return display
+
+
+def _id_list_field():
+    """Optional list of ids (branch_ids/region_ids) shared by user create/update."""
+    return serializers.ListField(
+        child=serializers.IntegerField(),
+        required=False,
+        allow_null=True,
+        allow_empty=True,
+    )
+
+
+class GroupDisplayNameField(serializers.CharField):
+    """Read-only display name for a group name attribute."""
+
+    def to_representation(self, value):
+        return group_display_name(value)
 
-class AssignableUserSerializer(serializers.ModelSerializer):
+
+class AssignableUserSerializer(CachedFieldsMixin, serializers.Serializer):
     """
     Minimal serializer for user assignment dropdowns.
 
@@ -23,38 +71,49 @@ class AssignableUserSerializer(serializers.ModelSerializer):
     which is accessible to all authenticated users without special permissions.
     """
 
-    full_name = serializers.SerializerMethodField(read_only=True)
-    primary_group = serializers.SerializerMethodField(read_only=True)
-    primary_group_display = serializers.SerializerMethodField(read_only=True)
+    # Plain Serializer: fields are declared up front, no model introspection
+    id = serializers.IntegerField(read_only=True)
+    full_name = serializers.CharField(read_only=True)
+    email = serializers.EmailField(read_only=True)
+    # Requires the user_annotate_primary_group() annotation on the queryset
+    primary_group = serializers.CharField(
+        source='primary_group_name',
+        read_only=True,
+        allow_null=True,
+    )
+    primary_group_display = GroupDisplayNameField(
+        source='primary_group_name',
+        read_only=True,
+        allow_null=True,
+    )
+    username = serializers.CharField(read_only=True)
 
-    class Meta:
-        model = User
-        fields = ['id', 'full_name', 'email', 'primary_group', 'primary_group_display', 'username']
-        read_only_fields = fields
 
-    @extend_schema_field(serializers.CharField())
-    def get_full_name(self, obj):
-        """Get user's full name."""
-        if obj.first_name and obj.last_name:
-            return f"{obj.first_name} {obj.last_name}"
-        return obj.username
+# Columns read by assignable_user_data(), for .values() querysets annotated
+# with user_annotate_primary_group()
+ASSIGNABLE_USER_VALUES = ('id', 'username', 'email', 'first_name', 'last_name', 'primary_group_name')
 
-    @extend_schema_field(serializers.CharField(allow_null=True))
-    def get_primary_group(self, obj):
-        """Get the user's primary group (role)."""
-        primary = obj.get_primary_group()
-        return primary.name if primary else None
-    
-    @extend_schema_field(serializers.CharField(allow_null=True))
-    def get_primary_group_display(self, obj):
-        """Get the display name for the user's primary group."""
-        primary = obj.get_primary_group()
-        if primary:
-            return GROUP_DISPLAY_NAMES.get(primary.name, primary.name.replace('_', ' ').title())
-        return None
+
+def assignable_user_data(row):
+    """
+    AssignableUserSerializer output for one ASSIGNABLE_USER_VALUES row.
+
+    The assignable endpoint builds its rows directly from the values() dicts
+    instead of instantiating users and running the serializer per row.
+    """
+    first_name, last_name = row['first_name'], row['last_name']
+    group = row['primary_group_name']
+    return {
+        'id': row['id'],
+        'full_name': " ".join((first_name, last_name)) if first_name and last_name else row['username'],
+        'email': row['email'],
+        'primary_group': group,
+        'primary_group_display': None if group is None else group_display_name(group),
+        'username': row['username'],
+    }
 
 
-class UserOutputSerializer(serializers.ModelSerializer):
+class UserOutputSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for user output (GET requests).
     
@@ -62,80 +121,85 @@ class UserOutputSerializer(serializers.ModelSerializer):
     No role field - uses groups instead.
     """
     
-    full_name = serializers.SerializerMethodField(read_only=True)
+    full_name = serializers.CharField(read_only=True)
     groups_list = serializers.SerializerMethodField(read_only=True)
     groups_list_display = serializers.SerializerMethodField(read_only=True)
     primary_group = serializers.SerializerMethodField(read_only=True)
     primary_group_display = serializers.SerializerMethodField(read_only=True)
     
     # Multiple branches and regions
-    branches_data = serializers.SerializerMethodField(read_only=True)
-    regions_data = serializers.SerializerMethodField(read_only=True)
+    branches_data = BranchOptionSerializer(source='branches', many=True, read_only=True)
+    regions_data = RegionOptionSerializer(source='regions', many=True, read_only=True)
     
     # Direct user permissions (not from groups)
     user_permissions_list = serializers.SerializerMethodField(read_only=True)
     
-    @extend_schema_field(serializers.CharField())
-    def get_full_name(self, obj):
-        """Get user's full name."""
-        if obj.first_name and obj.last_name:
-            return f"{obj.first_name} {obj.last_name}"
-        return obj.username
-    
+    def _memo(self, obj, key, compute):
+        """
+        compute() once per user and key for this serialization pass.
+
+        Results live in the (request-scoped) serializer context, shared by
+        every field and every nested or child serializer of the pass.
+        """
+        memo = self.context.setdefault('_memo', {})
+        memo_key = (obj.pk, key)
+        value = memo.get(memo_key, _MISSING)
+        if value is _MISSING:
+            value = memo[memo_key] = compute()
+        return value
+
+    def _groups(self, obj):
+        """obj's groups, read once and shared by the groups/primary group fields."""
+        return self._memo(obj, 'groups', lambda: list(obj.groups.all()))
+
+    def _primary_group_name(self, obj):
+        """Primary group name, from the user_annotate_primary_group() annotation if present."""
+        name = getattr(obj, 'primary_group_name', _MISSING)
+        if name is _MISSING:
+            # Same group as User.get_primary_group(): lowest group id
+            groups = self._groups(obj)
+            name = min(groups, key=attrgetter('pk')).name if groups else None
+        return name
+
     @extend_schema_field(serializers.ListField(child=serializers.CharField()))
     def get_groups_list(self, obj):
         """Get all groups user belongs to."""
-        return [g.name for g in obj.groups.all()]
+        return [group.name for group in self._groups(obj)]
     
     @extend_schema_field(serializers.ListField(child=serializers.CharField()))
     def get_groups_list_display(self, obj):
         """Get display names for all groups user belongs to."""
-        return [
-            GROUP_DISPLAY_NAMES.get(g.name, g.name.replace('_', ' ').title())
-            for g in obj.groups.all()
-        ]
+        return [group_display_name(group.name) for group in self._groups(obj)]
     
     @extend_schema_field(serializers.CharField(allow_null=True))
     def get_primary_group(self, obj):
         """Get the user's primary group."""
-        primary = obj.get_primary_group()
-        return primary.name if primary else None
+        return self._primary_group_name(obj)
     
     @extend_schema_field(serializers.CharField(allow_null=True))
     def get_primary_group_display(self, obj):
         """Get the display name for the user's primary group."""
-        primary = obj.get_primary_group()
-        if primary:
-            return GROUP_DISPLAY_NAMES.get(primary.name, primary.name.replace('_', ' ').title())
-        return None
-    
-    @extend_schema_field(serializers.ListField(child=serializers.DictField()))
-    def get_branches_data(self, obj):
-        """Get all branches."""
-        return [{'id': b.id, 'name': b.name} for b in obj.branches.all()]
-    
-    @extend_schema_field(serializers.ListField(child=serializers.DictField()))
-    def get_regions_data(self, obj):
-        """Get all regions."""
-        return [{'id': r.id, 'name': r.name} for r in obj.regions.all()]
+        name = self._primary_group_name(obj)
+        return group_display_name(name) if name else None
     
     @extend_schema_field(serializers.ListField(child=serializers.DictField()))
     def get_user_permissions_list(self, obj):
         """Get user's direct permissions (not from groups)."""
-        from immigration.api.v1.serializers.groups import should_exclude_permission
-        return [
-            {
-                'id': perm.id,
-                'name': perm.name,
-                'content_type': f'{perm.content_type.app_label}.{perm.content_type.model}',
-            }
-            for perm in obj.user_permissions.all().select_related('content_type')
-            if not should_exclude_permission(perm)
-        ]
+        permissions = obj.user_permissions.all()
+        if 'user_permissions' not in getattr(obj, '_prefetched_objects_cache', {}):
+            # Not prefetched by the view (single-user responses)
+            permissions = permissions.select_related('content_type')
+        result = []
+        for perm in permissions:
+            # Same test as should_exclude_permission(), on the label built once
+            content_type = f'{perm.content_type.app_label}.{perm.content_type.model}'
+            if content_type not in EXCLUDED_CONTENT_TYPES:
+                result.append({'id': perm.id, 'name': perm.name, 'content_type': content_type})
+        return result
     
     class Meta:
         model = User
-        fields = [
+        fields = (
             'id',
             'username',
             'email',
@@ -154,51 +218,41 @@ class UserOutputSerializer(serializers.ModelSerializer):
             'is_superuser',
             'date_joined',
             'last_login',
-        ]
-        read_only_fields = [
+        )
+        read_only_fields = (
             'id',
             'date_joined',
             'last_login',
-        ]
+        )
 
 
-class UserCreateSerializer(serializers.Serializer):
+class UserCreateSerializer(CachedFieldsMixin, serializers.Serializer):
     """
     Serializer for user creation (POST requests).
     
     Uses group_name instead of role.
     """
     
-    username = serializers.CharField(min_length=3, max_length=150)
+    username = serializers.CharField(validators=USERNAME_VALIDATORS)
     email = serializers.EmailField()
-    password = serializers.CharField(min_length=8, write_only=True)
-    first_name = serializers.CharField(min_length=1, max_length=150)
-    last_name = serializers.CharField(min_length=1, max_length=150)
+    password = serializers.CharField(validators=PASSWORD_VALIDATORS, write_only=True)
+    first_name = serializers.CharField(validators=NAME_VALIDATORS)
+    last_name = serializers.CharField(validators=NAME_VALIDATORS)
     
     # Group and scope
-    group_name = serializers.ChoiceField(choices=ALL_GROUPS)
+    group_name = CachedChoiceField(choices=GROUP_CHOICES)
     
     # Multiple branches
-    branch_ids = serializers.ListField(
-        child=serializers.IntegerField(),
-        required=False,
-        allow_null=True,
-        allow_empty=True
-    )
+    branch_ids = _id_list_field()
     
     # Multiple regions
-    region_ids = serializers.ListField(
-        child=serializers.IntegerField(),
-        required=False,
-        allow_null=True,
-        allow_empty=True
-    )
+    region_ids = _id_list_field()
     
     # Optional fields
     is_active = serializers.BooleanField(default=True)
 
 
-class UserUpdateSerializer(serializers.Serializer):
+class UserUpdateSerializer(CachedFieldsMixin, serializers.Serializer):
     """
     Serializer for user updates (PUT/PATCH requests).
     
@@ -207,27 +261,17 @@ class UserUpdateSerializer(serializers.Serializer):
     """
     
     email = serializers.EmailField(required=False)
-    first_name = serializers.CharField(min_length=1, max_length=150, required=False)
-    last_name = serializers.CharField(min_length=1, max_length=150, required=False)
-    password = serializers.CharField(min_length=8, write_only=True, required=False)
+    first_name = serializers.CharField(validators=NAME_VALIDATORS, required=False)
+    last_name = serializers.CharField(validators=NAME_VALIDATORS, required=False)
+    password = serializers.CharField(validators=PASSWORD_VALIDATORS, write_only=True, required=False)
     
     # Group and scope
-    group_name = serializers.ChoiceField(choices=ALL_GROUPS, required=False)
+    group_name = CachedChoiceField(choices=GROUP_CHOICES, required=False)
     
     # Multiple branches
-    branch_ids = serializers.ListField(
-        child=serializers.IntegerField(),
-        required=False,
-        allow_null=True,
-        allow_empty=True
-    )
+    branch_ids = _id_list_field()
     
     # Multiple regions
-    region_ids = serializers.ListField(
-        child=serializers.IntegerField(),
-        required=False,
-        allow_null=True,
-        allow_empty=True
-    )
+    region_ids = _id_list_field()
     
     is_active = serializers.BooleanField(required=False)
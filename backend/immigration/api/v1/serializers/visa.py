@@ -5,30 +5,94 @@ These serializers handle JSON serialization/deserialization for visa application
 They are thin wrappers - business logic lives in services.
 """
 
+from django.db import models
 from rest_framework import serializers
 from drf_spectacular.utils import extend_schema_field
 from immigration.models import VisaApplication
+from immigration.api.v1.serializers.cached import CachedFieldsMixin
+from immigration.api.v1.serializers.compiled import CompiledRepresentationMixin
+from immigration.api.v1.serializers.fields import (
+    AnnotatedNameField,
+    CachedChoiceField,
+    UTCDateTimeField,
+)
 
+VISA_STATUS_CHOICES = tuple(value for value, _ in VisaApplication.VISA_STATUS_CHOICES)
 
-class VisaApplicationOutputSerializer(serializers.ModelSerializer):
+
+@extend_schema_field({
+    'oneOf': [
+        {'type': 'string'},
+        {
+            'type': 'object',
+            'properties': {
+                'name': {'type': 'string'},
+                'received': {'type': 'boolean'},
+            },
+        },
+    ]
+})
+class RequiredDocumentField(serializers.Field):
+    """
+    One required document: a name, or a {"name", "received"} checklist item.
+
+    Both shapes are normalized by the application services.
+    """
+
+    default_error_messages = {
+        'invalid': 'Expected a document name or an object with name and received.',
+        'blank': 'This field may not be blank.',
+    }
+
+    def to_internal_value(self, data):
+        if isinstance(data, str):
+            return self._name(data)
+        if isinstance(data, dict) and data.keys() <= {'name', 'received'}:
+            received = data.get('received', False)
+            if isinstance(data.get('name'), str) and isinstance(received, bool):
+                return {'name': self._name(data['name']), 'received': received}
+        self.fail('invalid')
+
+    def _name(self, name):
+        name = name.strip()
+        if not name:
+            self.fail('blank')
+        return name
+
+    def to_representation(self, value):
+        return value
+
+
+class VisaApplicationOutputSerializer(
+    CompiledRepresentationMixin,
+    CachedFieldsMixin,
+    serializers.ModelSerializer,
+):
     """
     Serializer for visa application output (GET requests).
     
     Returns complete application data including related objects.
     """
-    
-    client_name = serializers.SerializerMethodField()
+
+    # created_at/updated_at are formatted for every row
+    serializer_field_mapping = {
+        **serializers.ModelSerializer.serializer_field_mapping,
+        models.DateTimeField: UTCDateTimeField,
+    }
+    
+    # Annotated by visa_application_annotate_names() on list querysets
+    client_name = AnnotatedNameField('client', 'client_name_ann')
     visa_type_name = serializers.CharField(source='visa_type.name', read_only=True)
     visa_category_name = serializers.CharField(
         source='visa_type.visa_category.name',
         read_only=True
     )
-    assigned_to_name = serializers.SerializerMethodField()
-    created_by_name = serializers.SerializerMethodField()
+    assigned_to_name = AnnotatedNameField('assigned_to', 'assigned_to_name_ann')
+    created_by_name = AnnotatedNameField('created_by', 'created_by_name_ann')
     
     class Meta:
         model = VisaApplication
-        fields = [
+        fields = (
             'id',
             'client',
             'client_name',
@@ -58,35 +122,14 @@ class VisaApplicationOutputSerializer(serializers.ModelSerializer):
             'created_at',
             'updated_by',
             'updated_at',
-        ]
-        read_only_fields = [
+        )
+        read_only_fields = (
             'id',
             'created_by',
             'created_at',
             'updated_by',
             'updated_at',
-        ]
-    
-    @extend_schema_field(serializers.CharField(allow_null=True))
-    def get_client_name(self, obj):
-        """Get client full name."""
-        if obj.client:
-            return f"{obj.client.first_name} {obj.client.last_name}"
-        return None
-    
-    @extend_schema_field(serializers.CharField(allow_null=True))
-    def get_assigned_to_name(self, obj):
-        """Get assigned user name if exists."""
-        if obj.assigned_to:
-            return f"{obj.assigned_to.first_name} {obj.assigned_to.last_name}"
-        return None
-    
-    @extend_schema_field(serializers.CharField(allow_null=True))
-    def get_created_by_name(self, obj):
-        """Get creator name if exists."""
-        if obj.created_by:
-            return f"{obj.created_by.first_name} {obj.created_by.last_name}"
-        return None
+        )
 
 
 class VisaApplicationCreateSerializer(serializers.Serializer):
@@ -115,21 +158,14 @@ class VisaApplicationCreateSerializer(serializers.Serializer):
     notes = serializers.CharField(required=False, allow_blank=True)
     assigned_to_id = serializers.IntegerField(required=False, allow_null=True)
     required_documents = serializers.ListField(
-        child=serializers.CharField(),
+        child=RequiredDocumentField(),
         required=False,
         default=list
     )
     
     # Status and dates
-    status = serializers.ChoiceField(
-        choices=[
-            'TO_BE_APPLIED',
-            'VISA_APPLIED',
-            'CASE_OPENED',
-            'GRANTED',
-            'REJECTED',
-            'WITHDRAWN'
-        ],
+    status = CachedChoiceField(
+        choices=VISA_STATUS_CHOICES,
         default='TO_BE_APPLIED'
     )
     expiry_date = serializers.DateField(required=False, allow_null=True)
@@ -173,18 +209,14 @@ class VisaApplicationUpdateSerializer(serializers.Serializer):
     dependent = serializers.BooleanField(required=False)
     notes = serializers.CharField(required=False, allow_blank=True)
     assigned_to_id = serializers.IntegerField(required=False, allow_null=True)
-    required_documents = serializers.JSONField(required=False)
+    required_documents = serializers.ListField(
+        child=RequiredDocumentField(),
+        required=False
+    )
     
     # Status and dates
-    status = serializers.ChoiceField(
-        choices=[
-            'TO_BE_APPLIED',
-            'VISA_APPLIED',
-            'CASE_OPENED',
-            'GRANTED',
-            'REJECTED',
-            'WITHDRAWN'
-        ],
+    status = CachedChoiceField(
+        choices=VISA_STATUS_CHOICES,
         required=False
     )
     expiry_date = serializers.DateField(required=False, allow_null=True)
@@ -5,18 +5,21 @@ These serializers handle JSON serialization/deserialization for visa type endpoi
 """
 
 from rest_framework import serializers
-from immigration.models.visa import VisaType, VisaCategory
+from immigration.models.visa import VisaType
+from immigration.api.v1.serializers.cached import CachedFieldsMixin
 
 
-class VisaCategoryOutputSerializer(serializers.ModelSerializer):
+class VisaCategoryOutputSerializer(serializers.Serializer):
     """Serializer for visa category output."""
     
-    class Meta:
-        model = VisaCategory
-        fields = ['id', 'name', 'code', 'description']
+    # Plain Serializer: fields are declared up front, no model introspection
+    id = serializers.IntegerField(read_only=True)
+    name = serializers.CharField(read_only=True)
+    code = serializers.CharField(read_only=True, allow_null=True)
+    description = serializers.CharField(read_only=True)
 
 
-class VisaTypeOutputSerializer(serializers.ModelSerializer):
+class VisaTypeOutputSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for visa type output (GET requests).
     
@@ -5,6 +5,10 @@ This module provides RESTful API endpoints for agent management with
 role-based access control and proper separation of concerns.
 """
 
+from django.db import transaction
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
+from django.views.decorators.vary import vary_on_headers
 from rest_framework import status
 from rest_framework.viewsets import ViewSet
 from rest_framework.response import Response
@@ -18,17 +22,66 @@ from immigration.api.v1.serializers.agents import (
     AgentOutputSerializer,
     AgentCreateSerializer,
     AgentUpdateSerializer,
+    AGENT_LIST_VALUES,
+    agent_list_data,
 )
-from immigration.selectors.agents import agent_list, agent_get, deleted_agents_list
+from immigration.api.v1.list_cache import cached_list_response, invalidate_list_cache, row_etag
+from immigration.api.v1.views.utils import query_filters
+from immigration.selectors.agents import agent_list, agent_get
 from immigration.services.agents import (
     agent_create,
     agent_update,
-    agent_delete,
-    agent_restore,
+    agent_delete_by_id,
+    agent_restore_by_id,
     AgentCreateInput,
     AgentUpdateInput
 )
 from immigration.models.agent import Agent
+from immigration.constants import TRUTHY_QUERY_VALUES
+
+# list_cache namespace of GET /agents/ pages, invalidated by every agent write
+AGENT_LIST_CACHE = 'agents'
+
+# Query params passed through to agent_list() as filters
+AGENT_FILTER_KEYS = frozenset((
+    'search',
+    'agent_name',
+    'agent_type',
+    'email',
+    'phone_number',
+    'country',
+))
+
+
+# Path parameter shared by every detail endpoint's schema
+AGENT_ID_PARAMETER = OpenApiParameter(
+    name='id',
+    type=int,
+    location=OpenApiParameter.PATH,
+    description='Agent ID',
+    required=True,
+)
+
+
+# Agent columns AgentOutputSerializer renders that its updated_at does not track
+AGENT_ETAG_VALUES = (
+    'updated_at',
+    'created_by__first_name',
+    'created_by__last_name',
+    'created_by__username',
+    'updated_by__first_name',
+    'updated_by__last_name',
+    'updated_by__username',
+)
+
+
+def agent_etag(request, pk=None, **kwargs):
+    """ETag for agent detail responses, from the agent's row."""
+    return row_etag(request, Agent.objects.all(), pk, AGENT_ETAG_VALUES)
+
+
+# Conditional GET: If-None-Match short-circuits to 304 before the agent is loaded
+agent_condition = method_decorator(condition(etag_func=agent_etag))
 
 
 class CanManageAgents(RoleBasedPermission):
@@ -39,6 +92,8 @@ class CanManageAgents(RoleBasedPermission):
     required_permission = 'immigration.view_agent'
 
 
+# Responses depend on the caller (permissions, role scope), so shared caches key on the token
+@method_decorator(vary_on_headers('Authorization'), name='dispatch')
 @extend_schema_view(
     list=extend_schema(
         summary="List all agents",
@@ -122,15 +177,7 @@ class CanManageAgents(RoleBasedPermission):
     retrieve=extend_schema(
         summary="Get agent details",
         description="Retrieve details of a specific agent by ID.",
-        parameters=[
-            OpenApiParameter(
-                name='id',
-                type=int,
-                location=OpenApiParameter.PATH,
-                description='Agent ID',
-                required=True,
-            ),
-        ],
+        parameters=[AGENT_ID_PARAMETER],
         responses={
             200: AgentOutputSerializer,
             401: {'description': 'Unauthorized'},
@@ -142,15 +189,7 @@ class CanManageAgents(RoleBasedPermission):
     update=extend_schema(
         summary="Update agent (full update)",
         description="Update all fields of an agent.",
-        parameters=[
-            OpenApiParameter(
-                name='id',
-                type=int,
-                location=OpenApiParameter.PATH,
-                description='Agent ID',
-                required=True,
-            ),
-        ],
+        parameters=[AGENT_ID_PARAMETER],
         request=AgentUpdateSerializer,
         responses={
             200: AgentOutputSerializer,
@@ -164,15 +203,7 @@ class CanManageAgents(RoleBasedPermission):
     partial_update=extend_schema(
         summary="Partial update agent",
         description="Update specific fields of an agent. Only provided fields are updated.",
-        parameters=[
-            OpenApiParameter(
-                name='id',
-                type=int,
-                location=OpenApiParameter.PATH,
-                description='Agent ID',
-                required=True,
-            ),
-        ],
+        parameters=[AGENT_ID_PARAMETER],
         request=AgentUpdateSerializer,
         responses={
             200: AgentOutputSerializer,
@@ -186,15 +217,7 @@ class CanManageAgents(RoleBasedPermission):
     destroy=extend_schema(
         summary="Delete agent (soft delete)",
         description="Soft delete an agent. Sets deleted_at timestamp without removing from database.",
-        parameters=[
-            OpenApiParameter(
-                name='id',
-                type=int,
-                location=OpenApiParameter.PATH,
-                description='Agent ID',
-                required=True,
-            ),
-        ],
+        parameters=[AGENT_ID_PARAMETER],
         responses={
             204: {'description': 'No Content - Successfully deleted'},
             401: {'description': 'Unauthorized'},
@@ -206,15 +229,7 @@ class CanManageAgents(RoleBasedPermission):
     restore=extend_schema(
         summary="Restore soft-deleted agent",
         description="Restore a previously soft-deleted agent.",
-        parameters=[
-            OpenApiParameter(
-                name='id',
-                type=int,
-                location=OpenApiParameter.PATH,
-                description='Agent ID',
-                required=True,
-            ),
-        ],
+        parameters=[AGENT_ID_PARAMETER],
         responses={
             200: AgentOutputSerializer,
             400: {'description': 'Bad Request - Agent is not soft-deleted'},
@@ -245,32 +260,29 @@ class AgentViewSet(ViewSet):
         GET /api/v1/agents/
         """
         # Extract filters from query params
-        filters = {
-            'search': request.query_params.get('search'),
-            'agent_name': request.query_params.get('agent_name'),
-            'agent_type': request.query_params.get('agent_type'),
-            'email': request.query_params.get('email'),
-            'phone_number': request.query_params.get('phone_number'),
-            'country': request.query_params.get('country'),
-        }
-
-        # Remove None values
-        filters = {k: v for k, v in filters.items() if v is not None}
+        query_params = request.query_params
+        filters = query_filters(query_params, AGENT_FILTER_KEYS)
 
         # Check if user wants to include soft-deleted agents
-        include_deleted = str(
-            request.query_params.get('include_deleted', 'false')
-        ).lower() in ('true', '1', 'yes', 'on')
+        include_deleted = query_params.get('include_deleted', 'false').lower() in TRUTHY_QUERY_VALUES
 
-        # Get filtered agents using selector
-        agents = agent_list(user=request.user, filters=filters, include_deleted=include_deleted)
+        def build():
+            # Get filtered agents using selector
+            agents = agent_list(user=request.user, filters=filters, include_deleted=include_deleted)
+            agents = agents.values(*AGENT_LIST_VALUES)
 
-        # Apply pagination
-        paginator = self.pagination_class()
-        page = paginator.paginate_queryset(agents, request)
-        serializer = AgentOutputSerializer(page, many=True)
+            # Apply pagination; rows are plain dicts, shaped like AgentOutputSerializer
+            paginator = self.pagination_class()
+            page = paginator.paginate_queryset(agents, request)
 
-        return paginator.get_paginated_response(serializer.data)
+            return paginator.get_paginated_data([agent_list_data(row) for row in page])
+
+        # Agents are not user-scoped, so every user shares the cached pages
+        return cached_list_response(
+            request,
+            AGENT_LIST_CACHE,
+            build,
+        )
     
     def create(self, request):
         """
@@ -283,11 +295,13 @@ class AgentViewSet(ViewSet):
         serializer.is_valid(raise_exception=True)
         
         try:
-            # Convert to Pydantic model for service
-            input_data = AgentCreateInput(**serializer.validated_data)
+            # Convert to Pydantic model for service, which also lower-cases email
+            # domains and rejects blank emails and countries
+            input_data = AgentCreateInput.model_validate(serializer.validated_data)
             
             # Create agent using service
             agent = agent_create(data=input_data, user=request.user)
+            invalidate_list_cache(AGENT_LIST_CACHE)
             
             # Return created agent
             output_serializer = AgentOutputSerializer(agent)
@@ -299,6 +313,7 @@ class AgentViewSet(ViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
     
+    @agent_condition
     def retrieve(self, request, pk=None):
         """
         Get a specific agent by ID.
@@ -309,12 +324,6 @@ class AgentViewSet(ViewSet):
             # Get agent using selector
             agent = agent_get(user=request.user, agent_id=pk)
             
-            if not agent:
-                return Response(
-                    {'detail': 'Agent not found'},
-                    status=status.HTTP_404_NOT_FOUND
-                )
-            
             # Serialize and return
             serializer = AgentOutputSerializer(agent)
             return Response(serializer.data)
@@ -346,28 +355,27 @@ class AgentViewSet(ViewSet):
         Internal method to handle both full and partial updates.
         """
         try:
-            # Get agent using selector
-            agent = agent_get(user=request.user, agent_id=pk)
-            
-            if not agent:
-                return Response(
-                    {'detail': 'Agent not found'},
-                    status=status.HTTP_404_NOT_FOUND
+            # Lock the row from fetch to save, so concurrent edits of the
+            # same agent (and its name uniqueness check) run one at a time
+            with transaction.atomic():
+                # Get agent using selector
+                agent = agent_get(user=request.user, agent_id=pk, for_update=True)
+                
+                # Validate input
+                serializer = AgentUpdateSerializer(data=request.data, partial=partial)
+                serializer.is_valid(raise_exception=True)
+                
+                # Convert to Pydantic model for service, which also lower-cases email
+                # domains and rejects blank emails and countries
+                input_data = AgentUpdateInput.model_validate(serializer.validated_data)
+                
+                # Update agent using service
+                updated_agent = agent_update(
+                    agent=agent,
+                    data=input_data,
+                    user=request.user
                 )
-            
-            # Validate input
-            serializer = AgentUpdateSerializer(data=request.data, partial=partial)
-            serializer.is_valid(raise_exception=True)
-            
-            # Convert to Pydantic model for service
-            input_data = AgentUpdateInput(**serializer.validated_data)
-            
-            # Update agent using service
-            updated_agent = agent_update(
-                agent=agent,
-                data=input_data,
-                user=request.user
-            )
+            invalidate_list_cache(AGENT_LIST_CACHE)
             
             # Return updated agent
             output_serializer = AgentOutputSerializer(updated_agent)
@@ -390,26 +398,16 @@ class AgentViewSet(ViewSet):
         
         DELETE /api/v1/agents/{id}/
         """
-        try:
-            # Get agent using selector
-            agent = agent_get(user=request.user, agent_id=pk)
-            
-            if not agent:
-                return Response(
-                    {'detail': 'Agent not found'},
-                    status=status.HTTP_404_NOT_FOUND
-                )
-            
-            # Delete agent using service (soft delete)
-            agent_delete(agent=agent, user=request.user)
-            
-            return Response(status=status.HTTP_204_NO_CONTENT)
-
-        except Agent.DoesNotExist:
+        # Soft delete with a single UPDATE; no row means the agent is
+        # missing or already deleted
+        if not agent_delete_by_id(agent_id=pk, user=request.user):
             return Response(
                 {'detail': 'Agent not found'},
                 status=status.HTTP_404_NOT_FOUND
             )
+        invalidate_list_cache(AGENT_LIST_CACHE)
+        
+        return Response(status=status.HTTP_204_NO_CONTENT)
 
     @action(detail=True, methods=['post'], url_path='restore')
     def restore(self, request, pk=None):
@@ -418,23 +416,14 @@ class AgentViewSet(ViewSet):
 
         POST /api/v1/agents/{id}/restore/
         """
-        try:
-            # Fetch agent from soft-deleted list
-            agent = deleted_agents_list(user=request.user).get(id=pk)
-
-            # Restore via service to ensure consistent behavior
-            restored_agent = agent_restore(agent=agent, user=request.user)
-
-            output_serializer = AgentOutputSerializer(restored_agent)
-            return Response(output_serializer.data)
-
-        except Agent.DoesNotExist:
+        # Restore only if the agent is currently soft-deleted (single UPDATE)
+        if not agent_restore_by_id(agent_id=pk, user=request.user):
             return Response(
                 {'detail': 'Agent not found or not soft-deleted'},
                 status=status.HTTP_404_NOT_FOUND
             )
-        except ValueError as e:
-            return Response(
-                {'detail': str(e)},
-                status=status.HTTP_400_BAD_REQUEST
-            )
+        invalidate_list_cache(AGENT_LIST_CACHE)
+
+        restored_agent = agent_get(user=request.user, agent_id=pk)
+        output_serializer = AgentOutputSerializer(restored_agent)
+        return Response(output_serializer.data)
@@ -4,6 +4,10 @@ Branch ViewSet for CRUD operations.
 This ViewSet provides full CRUD functionality for branches with role-based access control.
 """
 
+from django.db import transaction
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
+from django.views.decorators.vary import vary_on_headers
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.viewsets import ViewSet
@@ -16,21 +20,74 @@ from immigration.api.v1.serializers.branches import (
     BranchOptionSerializer,
     BranchCreateSerializer,
     BranchUpdateSerializer,
+    BRANCH_LIST_VALUES,
+    branch_list_data,
 )
 from immigration.api.v1.permissions import CanManageBranches
 from immigration.authentication import TenantJWTAuthentication
+from immigration.constants import TRUTHY_QUERY_VALUES
 from immigration.pagination import StandardResultsSetPagination
-from immigration.selectors.branches import branch_list, branch_get
+from immigration.api.v1.list_cache import cached_list_response, invalidate_list_cache, row_etag, user_scope
+from immigration.api.v1.views.utils import query_filters
+from immigration.selectors.branches import branch_access_filter, branch_list, branch_get
 from immigration.services.branches import (
     branch_create,
     branch_update,
-    branch_delete,
-    branch_restore,
+    branch_delete_by_id,
+    branch_restore_by_id,
     BranchCreateInput,
     BranchUpdateInput,
 )
 
+# list_cache namespace of GET /branches/ pages, invalidated by every branch write
+BRANCH_LIST_CACHE = 'branches'
 
+# Query params passed through to branch_list() as filters
+BRANCH_FILTER_KEYS = frozenset((
+    'search',
+    'name',
+    'region_id',
+    'phone',
+    'country',
+    'state',
+))
+
+
+# Path parameter shared by every detail endpoint's schema
+BRANCH_ID_PARAMETER = OpenApiParameter(
+    name='id',
+    type=int,
+    location=OpenApiParameter.PATH,
+    description='Branch ID',
+    required=True,
+)
+
+
+# Branch columns BranchOutputSerializer renders that its updated_at does not track
+BRANCH_ETAG_VALUES = (
+    'updated_at',
+    'region__name',
+    'created_by__first_name',
+    'created_by__last_name',
+    'created_by__username',
+    'updated_by__first_name',
+    'updated_by__last_name',
+    'updated_by__username',
+)
+
+
+def branch_etag(request, pk=None, **kwargs):
+    """ETag for branch detail responses, from the branch's row if user may see it."""
+    branches = branch_access_filter(Branch.objects.all(), user=request.user)
+    return row_etag(request, branches, pk, BRANCH_ETAG_VALUES)
+
+
+# Conditional GET: If-None-Match short-circuits to 304 before the branch is loaded
+branch_condition = method_decorator(condition(etag_func=branch_etag))
+
+
+# Responses depend on the caller (permissions, role scope), so shared caches key on the token
+@method_decorator(vary_on_headers('Authorization'), name='dispatch')
 @extend_schema_view(
     list=extend_schema(
         summary="List all branches",
@@ -118,15 +175,7 @@ from immigration.services.branches import (
     retrieve=extend_schema(
         summary="Get branch details",
         description="Retrieve details of a specific branch by ID. User must have access to this branch based on their role and scope.",
-        parameters=[
-            OpenApiParameter(
-                name='id',
-                type=int,
-                location=OpenApiParameter.PATH,
-                description='Branch ID',
-                required=True,
-            ),
-        ],
+        parameters=[BRANCH_ID_PARAMETER],
         responses={
             200: BranchOutputSerializer,
             401: {'description': 'Unauthorized'},
@@ -138,15 +187,7 @@ from immigration.services.branches import (
     update=extend_schema(
         summary="Update branch (full update)",
         description="Update all fields of a branch. User must have access to this branch based on their role and scope.",
-        parameters=[
-            OpenApiParameter(
-                name='id',
-                type=int,
-                location=OpenApiParameter.PATH,
-                description='Branch ID',
-                required=True,
-            ),
-        ],
+        parameters=[BRANCH_ID_PARAMETER],
         request=BranchUpdateSerializer,
         responses={
             200: BranchOutputSerializer,
@@ -160,15 +201,7 @@ from immigration.services.branches import (
     partial_update=extend_schema(
         summary="Partial update branch",
         description="Update specific fields of a branch. Only provided fields are updated.",
-        parameters=[
-            OpenApiParameter(
-                name='id',
-                type=int,
-                location=OpenApiParameter.PATH,
-                description='Branch ID',
-                required=True,
-            ),
-        ],
+        parameters=[BRANCH_ID_PARAMETER],
         request=BranchUpdateSerializer,
         responses={
             200: BranchOutputSerializer,
@@ -182,15 +215,7 @@ from immigration.services.branches import (
     destroy=extend_schema(
         summary="Delete branch (soft delete)",
         description="Soft delete a branch. Sets deleted_at timestamp without removing from database.",
-        parameters=[
-            OpenApiParameter(
-                name='id',
-                type=int,
-                location=OpenApiParameter.PATH,
-                description='Branch ID',
-                required=True,
-            ),
-        ],
+        parameters=[BRANCH_ID_PARAMETER],
         responses={
             204: {'description': 'No Content - Successfully deleted'},
             401: {'description': 'Unauthorized'},
@@ -202,15 +227,7 @@ from immigration.services.branches import (
     restore=extend_schema(
         summary="Restore soft-deleted branch",
         description="Restore a previously soft-deleted branch. Only administrators can restore branches.",
-        parameters=[
-            OpenApiParameter(
-                name='id',
-                type=int,
-                location=OpenApiParameter.PATH,
-                description='Branch ID',
-                required=True,
-            ),
-        ],
+        parameters=[BRANCH_ID_PARAMETER],
         responses={
             200: BranchOutputSerializer,
             400: {'description': 'Bad Request - Branch is not soft-deleted'},
@@ -241,32 +258,30 @@ class BranchViewSet(ViewSet):
         GET /api/v1/branches/
         """
         # Extract filters from query params
-        filters = {
-            'search': request.query_params.get('search'),
-            'name': request.query_params.get('name'),
-            'region_id': request.query_params.get('region_id'),
-            'phone': request.query_params.get('phone'),
-            'country': request.query_params.get('country'),
-            'state': request.query_params.get('state'),
-        }
-
-        # Remove None values
-        filters = {k: v for k, v in filters.items() if v is not None}
+        query_params = request.query_params
+        filters = query_filters(query_params, BRANCH_FILTER_KEYS)
 
         # Check if user wants to include soft-deleted branches
-        include_deleted = str(
-            request.query_params.get('include_deleted', 'false')
-        ).lower() in ('true', '1', 'yes', 'on')
+        include_deleted = query_params.get('include_deleted', 'false').lower() in TRUTHY_QUERY_VALUES
+
+        def build():
+            # Get filtered branches using selector
+            branches = branch_list(user=request.user, filters=filters, include_deleted=include_deleted)
+            branches = branches.values(*BRANCH_LIST_VALUES)
 
-        # Get filtered branches using selector
-        branches = branch_list(user=request.user, filters=filters, include_deleted=include_deleted)
+            # Apply pagination; rows are plain dicts, shaped like BranchOutputSerializer
+            paginator = self.pagination_class()
+            page = paginator.paginate_queryset(branches, request)
 
-        # Apply pagination
-        paginator = self.pagination_class()
-        page = paginator.paginate_queryset(branches, request)
-        serializer = BranchOutputSerializer(page, many=True)
+            return paginator.get_paginated_data([branch_list_data(row) for row in page])
 
-        return paginator.get_paginated_response(serializer.data)
+        # Branches are role-scoped, so pages are cached per user
+        return cached_list_response(
+            request,
+            BRANCH_LIST_CACHE,
+            build,
+            scope=user_scope(request.user),
+        )
     
     def create(self, request):
         """
@@ -279,11 +294,13 @@ class BranchViewSet(ViewSet):
         serializer.is_valid(raise_exception=True)
         
         try:
-            # Convert to Pydantic model for service
-            input_data = BranchCreateInput(**serializer.validated_data)
+            # Convert to Pydantic model for service, which also lower-cases email
+            # domains and rejects blank emails and countries
+            input_data = BranchCreateInput.model_validate(serializer.validated_data)
             
             # Create branch using service
             branch = branch_create(data=input_data, user=request.user)
+            invalidate_list_cache(BRANCH_LIST_CACHE)
             
             # Return created branch
             output_serializer = BranchOutputSerializer(branch)
@@ -295,6 +312,7 @@ class BranchViewSet(ViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
     
+    @branch_condition
     def retrieve(self, request, pk=None):
         """
         Get a specific branch by ID.
@@ -305,12 +323,6 @@ class BranchViewSet(ViewSet):
             # Get branch using selector
             branch = branch_get(user=request.user, branch_id=pk)
             
-            if not branch:
-                return Response(
-                    {'detail': 'Branch not found'},
-                    status=status.HTTP_404_NOT_FOUND
-                )
-            
             # Serialize and return
             serializer = BranchOutputSerializer(branch)
             return Response(serializer.data)
@@ -342,28 +354,27 @@ class BranchViewSet(ViewSet):
         Internal method to handle both full and partial updates.
         """
         try:
-            # Get branch using selector
-            branch = branch_get(user=request.user, branch_id=pk)
-            
-            if not branch:
-                return Response(
-                    {'detail': 'Branch not found'},
-                    status=status.HTTP_404_NOT_FOUND
+            # Lock the row from fetch to save, so concurrent edits of the
+            # same branch (and its name uniqueness check) run one at a time
+            with transaction.atomic():
+                # Get branch using selector
+                branch = branch_get(user=request.user, branch_id=pk, for_update=True)
+                
+                # Validate input
+                serializer = BranchUpdateSerializer(data=request.data, partial=partial)
+                serializer.is_valid(raise_exception=True)
+                
+                # Convert to Pydantic model for service, which also lower-cases email
+                # domains and rejects blank emails and countries
+                input_data = BranchUpdateInput.model_validate(serializer.validated_data)
+                
+                # Update branch using service
+                updated_branch = branch_update(
+                    branch=branch,
+                    data=input_data,
+                    user=request.user
                 )
-            
-            # Validate input
-            serializer = BranchUpdateSerializer(data=request.data, partial=partial)
-            serializer.is_valid(raise_exception=True)
-            
-            # Convert to Pydantic model for service
-            input_data = BranchUpdateInput(**serializer.validated_data)
-            
-            # Update branch using service
-            updated_branch = branch_update(
-                branch=branch,
-                data=input_data,
-                user=request.user
-            )
+            invalidate_list_cache(BRANCH_LIST_CACHE)
             
             # Return updated branch
             output_serializer = BranchOutputSerializer(updated_branch)
@@ -386,26 +397,16 @@ class BranchViewSet(ViewSet):
         
         DELETE /api/v1/branches/{id}/
         """
-        try:
-            # Get branch using selector
-            branch = branch_get(user=request.user, branch_id=pk)
-            
-            if not branch:
-                return Response(
-                    {'detail': 'Branch not found'},
-                    status=status.HTTP_404_NOT_FOUND
-                )
-            
-            # Delete branch using service
-            branch_delete(branch=branch, user=request.user)
-            
-            return Response(status=status.HTTP_204_NO_CONTENT)
-        
-        except Branch.DoesNotExist:
+        # Soft delete with a single UPDATE; no row means the branch is
+        # missing, already deleted or out of scope
+        if not branch_delete_by_id(branch_id=pk, user=request.user):
             return Response(
                 {'detail': 'Branch not found'},
                 status=status.HTTP_404_NOT_FOUND
             )
+        invalidate_list_cache(BRANCH_LIST_CACHE)
+        
+        return Response(status=status.HTTP_204_NO_CONTENT)
     
     def restore(self, request, pk=None):
         """
@@ -414,27 +415,21 @@ class BranchViewSet(ViewSet):
         POST /api/v1/branches/{id}/restore/
         """
         try:
-            # Get branch using selector (including deleted)
-            branch = branch_get(user=request.user, branch_id=pk, include_deleted=True)
-            
-            if not branch:
+            # Restore only if the branch is soft-deleted and in scope (single UPDATE)
+            if not branch_restore_by_id(branch_id=pk, user=request.user):
+                # Tell a live branch (400) from a missing one (404)
+                branch_get(user=request.user, branch_id=pk, fields=('id', 'region'))
                 return Response(
-                    {'detail': 'Branch not found'},
-                    status=status.HTTP_404_NOT_FOUND
+                    {'detail': 'Branch is not soft-deleted'},
+                    status=status.HTTP_400_BAD_REQUEST
                 )
-            
-            # Restore branch using service
-            restored_branch = branch_restore(branch=branch, user=request.user)
+            invalidate_list_cache(BRANCH_LIST_CACHE)
             
             # Return restored branch
+            restored_branch = branch_get(user=request.user, branch_id=pk)
             output_serializer = BranchOutputSerializer(restored_branch)
             return Response(output_serializer.data)
         
-        except ValueError as e:
-            return Response(
-                {'detail': str(e)},
-                status=status.HTTP_400_BAD_REQUEST
-            )
         except Branch.DoesNotExist:
             return Response(
                 {'detail': 'Branch not found'},
@@ -462,7 +457,8 @@ class BranchViewSet(ViewSet):
         filters = {}
         branches = branch_list(user=request.user, filters=filters, include_deleted=False)
         
-        # Return only id and name
+        # Return only id and name: skip the output joins and unused columns
+        branches = branches.select_related(None).only('id', 'name')
         serializer = BranchOptionSerializer(branches, many=True)
         return Response(serializer.data)
 
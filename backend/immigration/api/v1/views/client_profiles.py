@@ -2,12 +2,16 @@
 API endpoints for client supporting resources.
 """
 
+from django.http import HttpResponse
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 from rest_framework import status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.viewsets import ViewSet
 from immigration.authentication import TenantJWTAuthentication
 
+from immigration.api.v1.list_cache import row_etag
 from immigration.api.v1.permissions import CanManageClients
 from immigration.api.v1.serializers.client_profiles import (
     LPECreateUpdateSerializer,
@@ -20,9 +24,22 @@ from immigration.api.v1.serializers.client_profiles import (
     QualificationOutputSerializer,
     EmploymentCreateUpdateSerializer,
     EmploymentOutputSerializer,
+    EMPLOYMENT_LIST_VALUES,
+    LPE_LIST_VALUES,
+    PASSPORT_LIST_VALUES,
+    PROFICIENCY_LIST_VALUES,
+    QUALIFICATION_LIST_VALUES,
+    employment_list_data,
+    lpe_list_data,
+    passport_list_data,
+    proficiency_list_data,
+    qualification_list_data,
 )
-from immigration.pagination import StandardResultsSetPagination
+from immigration.api.v1.views.utils import query_filters
+from immigration.pagination import KeysetPagination
+from immigration.selectors.clients import client_list
 from immigration.selectors.client_profiles import (
+    language_exam_get,
     language_exam_list,
     passport_get,
     passport_list,
@@ -55,24 +72,88 @@ from immigration.services.client_profiles import (
 )
 from immigration.models import LPE, Passport, Proficiency, Qualification, Employment
 
+# Query params passed through to the list selectors as filters
+PROFICIENCY_FILTER_KEYS = frozenset(("client_id", "test_name_id", "test_date"))
+CLIENT_RECORD_FILTER_KEYS = frozenset(("client_id",))
+
+
+# Columns the detail responses render besides each record's updated_at
+LPE_ETAG_VALUES = ("updated_at", "name", "validity_term", "description")
+PROFICIENCY_ETAG_VALUES = ("updated_at", "test_name__name")
+CLIENT_RECORD_ETAG_VALUES = ("updated_at",)
+
+
+def _client_records(record_list):
+    """
+    records(user) for _retrieve_condition(): record_list()'s records of the
+    clients user may see that are not soft-deleted.
+    """
+    def records(user):
+        return record_list(user=user).filter(client__in=client_list(user=user).values("pk"))
+
+    return records
+
+
+def _retrieve_condition(records, fields, lookup="pk"):
+    """
+    Conditional GET decorator for a retrieve().
+
+    If-None-Match short-circuits to 304 before the record is loaded. The
+    ETag comes from the record's row (see row_etag()), read from
+    records(user); records outside it get no ETag, so the view answers
+    with its 403/404 instead.
+    """
+    def etag(request, **kwargs):
+        return row_etag(request, records(request.user), kwargs.get(lookup), fields, lookup=lookup)
+
+    return method_decorator(condition(etag_func=etag))
+
+
+def _no_content():
+    """
+    Empty 204 response for destroy(), without DRF's render pass.
+
+    Built per request (middleware adds headers to it) and, like DRF's
+    Response with no data, without a Content-Type.
+    """
+    response = HttpResponse(status=status.HTTP_204_NO_CONTENT)
+    del response["Content-Type"]
+    return response
+
+
+def _get_or_error(selector, does_not_exist, **kwargs):
+    """
+    Run a *_get selector, mapping its errors to the error responses.
+
+    Returns (record, None), or (None, response): 403 for a record outside the
+    user's scope (PermissionError), 404 for a missing one.
+    """
+    try:
+        return selector(**kwargs), None
+    except PermissionError:
+        return None, Response({"detail": "Forbidden"}, status=status.HTTP_403_FORBIDDEN)
+    except does_not_exist:
+        return None, Response({"detail": "Not found."}, status=status.HTTP_404_NOT_FOUND)
+
 
 class LanguageExamViewSet(ViewSet):
     authentication_classes = [TenantJWTAuthentication]
     permission_classes = [CanManageClients]
-    pagination_class = StandardResultsSetPagination
+    pagination_class = KeysetPagination
 
     def list(self, request):
-        exams = language_exam_list(filters=request.query_params)
+        exams = language_exam_list(filters=request.query_params).values_list(
+            *LPE_LIST_VALUES, named=True,
+        )
         paginator = self.pagination_class()
         page = paginator.paginate_queryset(exams, request)
-        serializer = LPESerializer(page, many=True)
-        return paginator.get_paginated_response(serializer.data)
+        return paginator.get_paginated_response([lpe_list_data(row) for row in page])
 
+    @_retrieve_condition(lambda user: LPE.objects.all(), LPE_ETAG_VALUES)
     def retrieve(self, request, pk=None):
-        try:
-            exam = language_exam_list().get(id=pk)
-        except LPE.DoesNotExist:
-            return Response({"detail": "Not found."}, status=status.HTTP_404_NOT_FOUND)
+        exam, error = _get_or_error(language_exam_get, LPE.DoesNotExist, exam_id=pk)
+        if error is not None:
+            return error
         serializer = LPESerializer(exam)
         return Response(serializer.data)
 
@@ -84,10 +165,9 @@ class LanguageExamViewSet(ViewSet):
         return Response(LPESerializer(exam).data, status=status.HTTP_201_CREATED)
 
     def update(self, request, pk=None):
-        try:
-            exam = language_exam_list().get(id=pk)
-        except LPE.DoesNotExist:
-            return Response({"detail": "Not found."}, status=status.HTTP_404_NOT_FOUND)
+        exam, error = _get_or_error(language_exam_get, LPE.DoesNotExist, exam_id=pk)
+        if error is not None:
+            return error
 
         serializer = LPECreateUpdateSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
@@ -95,43 +175,38 @@ class LanguageExamViewSet(ViewSet):
         exam = lpe_update(exam=exam, data=input_data, user=request.user)
         return Response(LPESerializer(exam).data)
 
-    def partial_update(self, request, pk=None):
-        # Treat partial updates the same as full updates (fields are optional)
-        return self.update(request, pk)
+    # Treat partial updates the same as full updates (fields are optional)
+    partial_update = update
 
     def destroy(self, request, pk=None):
-        try:
-            exam = language_exam_list().get(id=pk)
-        except LPE.DoesNotExist:
-            return Response({"detail": "Not found."}, status=status.HTTP_404_NOT_FOUND)
+        exam, error = _get_or_error(language_exam_get, LPE.DoesNotExist, exam_id=pk)
+        if error is not None:
+            return error
         lpe_delete(exam=exam, user=request.user)
-        return Response(status=status.HTTP_204_NO_CONTENT)
+        return _no_content()
 
 
 class ProficiencyViewSet(ViewSet):
     authentication_classes = [TenantJWTAuthentication]
     permission_classes = [CanManageClients]
-    pagination_class = StandardResultsSetPagination
+    pagination_class = KeysetPagination
 
     def list(self, request):
-        filters = {
-            "client_id": request.query_params.get("client_id"),
-            "test_name_id": request.query_params.get("test_name_id"),
-            "test_date": request.query_params.get("test_date"),
-        }
-        proficiencies = proficiency_list(user=request.user, filters=filters)
+        filters = query_filters(request.query_params, PROFICIENCY_FILTER_KEYS)
+        proficiencies = proficiency_list(user=request.user, filters=filters).values_list(
+            *PROFICIENCY_LIST_VALUES, named=True,
+        )
         paginator = self.pagination_class()
         page = paginator.paginate_queryset(proficiencies, request)
-        serializer = ProficiencyOutputSerializer(page, many=True)
-        return paginator.get_paginated_response(serializer.data)
+        return paginator.get_paginated_response([proficiency_list_data(row) for row in page])
 
+    @_retrieve_condition(_client_records(proficiency_list), PROFICIENCY_ETAG_VALUES)
     def retrieve(self, request, pk=None):
-        try:
-            proficiency = proficiency_get(user=request.user, proficiency_id=pk)
-        except PermissionError:
-            return Response({"detail": "Forbidden"}, status=status.HTTP_403_FORBIDDEN)
-        except Proficiency.DoesNotExist:
-            return Response({"detail": "Not found."}, status=status.HTTP_404_NOT_FOUND)
+        proficiency, error = _get_or_error(
+            proficiency_get, Proficiency.DoesNotExist, user=request.user, proficiency_id=pk,
+        )
+        if error is not None:
+            return error
 
         return Response(ProficiencyOutputSerializer(proficiency).data)
 
@@ -143,12 +218,11 @@ class ProficiencyViewSet(ViewSet):
         return Response(ProficiencyOutputSerializer(proficiency).data, status=status.HTTP_201_CREATED)
 
     def update(self, request, pk=None):
-        try:
-            proficiency = proficiency_get(user=request.user, proficiency_id=pk)
-        except PermissionError:
-            return Response({"detail": "Forbidden"}, status=status.HTTP_403_FORBIDDEN)
-        except Proficiency.DoesNotExist:
-            return Response({"detail": "Not found."}, status=status.HTTP_404_NOT_FOUND)
+        proficiency, error = _get_or_error(
+            proficiency_get, Proficiency.DoesNotExist, user=request.user, proficiency_id=pk,
+        )
+        if error is not None:
+            return error
 
         serializer = ProficiencyCreateUpdateSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
@@ -156,43 +230,40 @@ class ProficiencyViewSet(ViewSet):
         proficiency = proficiency_update(proficiency=proficiency, data=input_data, user=request.user)
         return Response(ProficiencyOutputSerializer(proficiency).data)
 
-    def partial_update(self, request, pk=None):
-        return self.update(request, pk)
+    partial_update = update
 
     def destroy(self, request, pk=None):
-        try:
-            proficiency = proficiency_get(user=request.user, proficiency_id=pk)
-        except PermissionError:
-            return Response({"detail": "Forbidden"}, status=status.HTTP_403_FORBIDDEN)
-        except Proficiency.DoesNotExist:
-            return Response({"detail": "Not found."}, status=status.HTTP_404_NOT_FOUND)
+        proficiency, error = _get_or_error(
+            proficiency_get, Proficiency.DoesNotExist, user=request.user, proficiency_id=pk,
+        )
+        if error is not None:
+            return error
 
         proficiency_delete(proficiency=proficiency, user=request.user)
-        return Response(status=status.HTTP_204_NO_CONTENT)
+        return _no_content()
 
 
 class QualificationViewSet(ViewSet):
     authentication_classes = [TenantJWTAuthentication]
     permission_classes = [CanManageClients]
-    pagination_class = StandardResultsSetPagination
+    pagination_class = KeysetPagination
 
     def list(self, request):
-        filters = {
-            "client_id": request.query_params.get("client_id"),
-        }
-        qualifications = qualification_list(user=request.user, filters=filters)
+        filters = query_filters(request.query_params, CLIENT_RECORD_FILTER_KEYS)
+        qualifications = qualification_list(user=request.user, filters=filters).values_list(
+            *QUALIFICATION_LIST_VALUES, named=True,
+        )
         paginator = self.pagination_class()
         page = paginator.paginate_queryset(qualifications, request)
-        serializer = QualificationOutputSerializer(page, many=True)
-        return paginator.get_paginated_response(serializer.data)
+        return paginator.get_paginated_response([qualification_list_data(row) for row in page])
 
+    @_retrieve_condition(_client_records(qualification_list), CLIENT_RECORD_ETAG_VALUES)
     def retrieve(self, request, pk=None):
-        try:
-            qualification = qualification_get(user=request.user, qualification_id=pk)
-        except PermissionError:
-            return Response({"detail": "Forbidden"}, status=status.HTTP_403_FORBIDDEN)
-        except Qualification.DoesNotExist:
-            return Response({"detail": "Not found."}, status=status.HTTP_404_NOT_FOUND)
+        qualification, error = _get_or_error(
+            qualification_get, Qualification.DoesNotExist, user=request.user, qualification_id=pk,
+        )
+        if error is not None:
+            return error
 
         return Response(QualificationOutputSerializer(qualification).data)
 
@@ -204,12 +275,11 @@ class QualificationViewSet(ViewSet):
         return Response(QualificationOutputSerializer(qualification).data, status=status.HTTP_201_CREATED)
 
     def update(self, request, pk=None):
-        try:
-            qualification = qualification_get(user=request.user, qualification_id=pk)
-        except PermissionError:
-            return Response({"detail": "Forbidden"}, status=status.HTTP_403_FORBIDDEN)
-        except Qualification.DoesNotExist:
-            return Response({"detail": "Not found."}, status=status.HTTP_404_NOT_FOUND)
+        qualification, error = _get_or_error(
+            qualification_get, Qualification.DoesNotExist, user=request.user, qualification_id=pk,
+        )
+        if error is not None:
+            return error
 
         serializer = QualificationCreateUpdateSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
@@ -217,19 +287,17 @@ class QualificationViewSet(ViewSet):
         qualification = qualification_update(qualification=qualification, data=input_data, user=request.user)
         return Response(QualificationOutputSerializer(qualification).data)
 
-    def partial_update(self, request, pk=None):
-        return self.update(request, pk)
+    partial_update = update
 
     def destroy(self, request, pk=None):
-        try:
-            qualification = qualification_get(user=request.user, qualification_id=pk)
-        except PermissionError:
-            return Response({"detail": "Forbidden"}, status=status.HTTP_403_FORBIDDEN)
-        except Qualification.DoesNotExist:
-            return Response({"detail": "Not found."}, status=status.HTTP_404_NOT_FOUND)
+        qualification, error = _get_or_error(
+            qualification_get, Qualification.DoesNotExist, user=request.user, qualification_id=pk,
+        )
+        if error is not None:
+            return error
 
         qualification_delete(qualification=qualification, user=request.user)
-        return Response(status=status.HTTP_204_NO_CONTENT)
+        return _no_content()
 
 
 class PassportViewSet(ViewSet):
@@ -238,20 +306,21 @@ class PassportViewSet(ViewSet):
     lookup_field = "client_id"
 
     def list(self, request):
-        filters = {
-            "client_id": request.query_params.get("client_id"),
-        }
-        passports = passport_list(user=request.user, filters=filters)
-        serializer = PassportOutputSerializer(passports, many=True)
-        return Response(serializer.data)
-
+        filters = query_filters(request.query_params, CLIENT_RECORD_FILTER_KEYS)
+        passports = passport_list(user=request.user, filters=filters).values_list(
+            *PASSPORT_LIST_VALUES, named=True,
+        )
+        # Unpaginated: iterator() keeps the fetched rows out of the queryset's
+        # result cache, so only the response rows are held at once
+        return Response([passport_list_data(row) for row in passports.iterator(chunk_size=500)])
+
+    @_retrieve_condition(_client_records(passport_list), CLIENT_RECORD_ETAG_VALUES, lookup="client_id")
     def retrieve(self, request, client_id=None):
-        try:
-            passport = passport_get(user=request.user, client_id=client_id)
-        except PermissionError:
-            return Response({"detail": "Forbidden"}, status=status.HTTP_403_FORBIDDEN)
-        except Passport.DoesNotExist:
-            return Response({"detail": "Not found."}, status=status.HTTP_404_NOT_FOUND)
+        passport, error = _get_or_error(
+            passport_get, Passport.DoesNotExist, user=request.user, client_id=client_id,
+        )
+        if error is not None:
+            return error
 
         return Response(PassportOutputSerializer(passport).data)
 
@@ -272,43 +341,40 @@ class PassportViewSet(ViewSet):
     def update(self, request, client_id=None):
         return self.upsert(request)
 
-    def partial_update(self, request, client_id=None):
-        return self.upsert(request)
+    partial_update = update
 
     def destroy(self, request, client_id=None):
-        try:
-            passport = passport_get(user=request.user, client_id=client_id)
-        except PermissionError:
-            return Response({"detail": "Forbidden"}, status=status.HTTP_403_FORBIDDEN)
-        except Passport.DoesNotExist:
-            return Response({"detail": "Not found."}, status=status.HTTP_404_NOT_FOUND)
+        passport, error = _get_or_error(
+            passport_get, Passport.DoesNotExist, user=request.user, client_id=client_id,
+        )
+        if error is not None:
+            return error
 
         passport.delete()
-        return Response(status=status.HTTP_204_NO_CONTENT)
+        return _no_content()
 
 
 class EmploymentViewSet(ViewSet):
     authentication_classes = [TenantJWTAuthentication]
     permission_classes = [CanManageClients]
-    pagination_class = StandardResultsSetPagination
+    pagination_class = KeysetPagination
 
     def list(self, request):
-        filters = {
-            "client_id": request.query_params.get("client_id"),
-        }
-        employments = employment_list(user=request.user, filters=filters)
+        filters = query_filters(request.query_params, CLIENT_RECORD_FILTER_KEYS)
+        employments = employment_list(user=request.user, filters=filters).values_list(
+            *EMPLOYMENT_LIST_VALUES, named=True,
+        )
         paginator = self.pagination_class()
         page = paginator.paginate_queryset(employments, request)
-        serializer = EmploymentOutputSerializer(page, many=True)
-        return paginator.get_paginated_response(serializer.data)
+        return paginator.get_paginated_response([employment_list_data(row) for row in page])
 
+    @_retrieve_condition(_client_records(employment_list), CLIENT_RECORD_ETAG_VALUES)
     def retrieve(self, request, pk=None):
-        try:
-            employment = employment_get(user=request.user, employment_id=pk)
-        except PermissionError:
-            return Response({"detail": "Forbidden"}, status=status.HTTP_403_FORBIDDEN)
-        except Employment.DoesNotExist:
-            return Response({"detail": "Not found."}, status=status.HTTP_404_NOT_FOUND)
+        employment, error = _get_or_error(
+            employment_get, Employment.DoesNotExist, user=request.user, employment_id=pk,
+        )
+        if error is not None:
+            return error
 
         return Response(EmploymentOutputSerializer(employment).data)
 
@@ -320,12 +386,11 @@ class EmploymentViewSet(ViewSet):
         return Response(EmploymentOutputSerializer(employment).data, status=status.HTTP_201_CREATED)
 
     def update(self, request, pk=None):
-        try:
-            employment = employment_get(user=request.user, employment_id=pk)
-        except PermissionError:
-            return Response({"detail": "Forbidden"}, status=status.HTTP_403_FORBIDDEN)
-        except Employment.DoesNotExist:
-            return Response({"detail": "Not found."}, status=status.HTTP_404_NOT_FOUND)
+        employment, error = _get_or_error(
+            employment_get, Employment.DoesNotExist, user=request.user, employment_id=pk,
+        )
+        if error is not None:
+            return error
 
         serializer = EmploymentCreateUpdateSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
@@ -333,17 +398,15 @@ class EmploymentViewSet(ViewSet):
         employment = employment_update(employment=employment, data=input_data, user=request.user)
         return Response(EmploymentOutputSerializer(employment).data)
 
-    def partial_update(self, request, pk=None):
-        return self.update(request, pk)
+    partial_update = update
 
     def destroy(self, request, pk=None):
-        try:
-            employment = employment_get(user=request.user, employment_id=pk)
-        except PermissionError:
-            return Response({"detail": "Forbidden"}, status=status.HTTP_403_FORBIDDEN)
-        except Employment.DoesNotExist:
-            return Response({"detail": "Not found."}, status=status.HTTP_404_NOT_FOUND)
+        employment, error = _get_or_error(
+            employment_get, Employment.DoesNotExist, user=request.user, employment_id=pk,
+        )
+        if error is not None:
+            return error
 
         employment_delete(employment=employment, user=request.user)
-        return Response(status=status.HTTP_204_NO_CONTENT)
+        return _no_content()
 
@@ -5,6 +5,11 @@ This module provides RESTful API endpoints for client management with
 role-based access control and proper separation of concerns.
 """
 
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import transaction
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
+from django.views.decorators.vary import vary_on_headers
 from rest_framework import status
 from rest_framework.viewsets import ViewSet
 from rest_framework.response import Response
@@ -12,16 +17,21 @@ from rest_framework.decorators import action
 from immigration.authentication import TenantJWTAuthentication
 from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter
 
+from immigration.api.v1.list_cache import cached_list_response, invalidate_list_cache, row_etag, user_scope
 from immigration.api.v1.permissions import CanManageClients
-from immigration.pagination import StandardResultsSetPagination
+from immigration.pagination import KeysetPagination
 from immigration.api.v1.serializers.clients import (
     ClientOutputSerializer,
     ClientCreateSerializer,
     ClientUpdateSerializer,
-    ClientStageCountSerializer
+    ClientStageCountSerializer,
+    CLIENT_OUTPUT_ONLY,
+    client_output_data,
 )
-from immigration.api.v1.serializers.client_activity import ClientActivityOutput
-from immigration.selectors.clients import client_list, client_get, deleted_clients_list
+from immigration.api.v1.serializers.client_activity import ClientActivityOutput, client_activity_data
+from immigration.api.v1.serializers.profile_picture import ProfilePictureOutput
+from immigration.api.v1.views.utils import query_filters
+from immigration.selectors.clients import client_list, client_get, client_stage_counts, deleted_clients_list
 from immigration.services.clients import (
     client_create,
     client_update,
@@ -30,8 +40,67 @@ from immigration.services.clients import (
     ClientCreateInput,
     ClientUpdateInput
 )
-from immigration.models import Client
-from django.db.models import Count
+from immigration.services.timeline import timeline_list
+from immigration.models import Client, ProfilePicture
+from immigration.models.profile_picture import validate_image_file
+from immigration.constants import TRUTHY_QUERY_VALUES
+
+# list_cache namespace of the cached stage counts: invalidated by the
+# client writes below
+CLIENT_CACHE = 'clients'
+
+# Query params passed through to client_list() as filters
+CLIENT_FILTER_KEYS = frozenset((
+    'search',
+    'email',
+    'stage',
+    'first_name',
+    'last_name',
+    'visa_category',
+))
+
+
+# Client columns the client responses render besides its updated_at
+CLIENT_ETAG_VALUES = (
+    'updated_at',
+    'visa_category__name',
+    'agent__agent_name',
+    'assigned_to__first_name',
+    'assigned_to__last_name',
+    'branch__name',
+    'created_by__first_name',
+    'created_by__last_name',
+)
+
+# Profile picture columns ProfilePictureOutput renders besides its updated_at
+PROFILE_PICTURE_ETAG_VALUES = (
+    'updated_at',
+    'file',
+    'uploaded_by__first_name',
+    'uploaded_by__last_name',
+    'uploaded_by__username',
+)
+
+
+def client_etag(request, pk=None, **kwargs):
+    """ETag for client detail responses, from the client's row if user may see it."""
+    # Clients are scoped by the user's branches/regions
+    return row_etag(request, client_list(user=request.user), pk, CLIENT_ETAG_VALUES)
+
+
+def profile_picture_etag(request, pk=None, **kwargs):
+    """ETag for profile picture GETs, from the picture's row."""
+    if request.method not in ('GET', 'HEAD'):
+        return None
+    return row_etag(
+        request, ProfilePicture.objects.all(), pk, PROFILE_PICTURE_ETAG_VALUES, lookup='client_id',
+    )
+
+
+# Conditional GET: If-None-Match short-circuits to 304 before the client
+# (or its picture) is loaded
+client_condition = method_decorator(condition(etag_func=client_etag))
+profile_picture_condition = method_decorator(condition(etag_func=profile_picture_etag))
 
 
 @extend_schema_view(
@@ -232,6 +301,7 @@ from django.db.models import Count
         tags=['clients'],
     ),
 )
+@method_decorator(vary_on_headers('Authorization'), name='dispatch')
 class ClientViewSet(ViewSet):
     """
     ViewSet for client management using service/selector pattern.
@@ -242,8 +312,11 @@ class ClientViewSet(ViewSet):
 
     authentication_classes = [TenantJWTAuthentication]
     permission_classes = [CanManageClients]
-    pagination_class = StandardResultsSetPagination
+    pagination_class = KeysetPagination
     queryset = Client.objects.none()  # For drf-spectacular schema generation
+    # Client ids only: anything else 404s in the URL resolver, so actions
+    # always get a numeric pk
+    lookup_value_regex = r'\d+'
     
     def list(self, request):
         """
@@ -252,37 +325,27 @@ class ClientViewSet(ViewSet):
         GET /api/v1/clients/
         """
         # Extract filters from query params
-        filters = {
-            'search': request.query_params.get('search'),
-            'email': request.query_params.get('email'),
-            'stage': request.query_params.get('stage'),
-            'first_name': request.query_params.get('first_name'),
-            'last_name': request.query_params.get('last_name'),
-            'visa_category': request.query_params.get('visa_category'),
-        }
+        query_params = request.query_params
+        filters = query_filters(query_params, CLIENT_FILTER_KEYS)
 
         # Parse active parameter as boolean (query params come as strings)
-        active_param = request.query_params.get('active')
-        if active_param is not None and active_param != '':
-            filters['active'] = str(active_param).lower() in ('true', '1', 'yes', 'on')
-
-        # Remove None values
-        filters = {k: v for k, v in filters.items() if v is not None}
+        active_param = query_params.get('active')
+        if active_param:
+            filters['active'] = active_param.lower() in TRUTHY_QUERY_VALUES
 
         # Check if user wants to include soft-deleted clients
-        include_deleted = str(
-            request.query_params.get('include_deleted', 'false')
-        ).lower() in ('true', '1', 'yes', 'on')
+        include_deleted = query_params.get('include_deleted', 'false').lower() in TRUTHY_QUERY_VALUES
 
         # Get filtered clients using selector
         clients = client_list(user=request.user, filters=filters, include_deleted=include_deleted)
+        # Skip the columns the output never reads (mostly on the joined users)
+        clients = clients.only(*CLIENT_OUTPUT_ONLY)
 
         # Apply pagination
         paginator = self.pagination_class()
         page = paginator.paginate_queryset(clients, request)
-        serializer = ClientOutputSerializer(page, many=True)
 
-        return paginator.get_paginated_response(serializer.data)
+        return paginator.get_paginated_response([client_output_data(client) for client in page])
     
     def create(self, request):
         """
@@ -300,10 +363,10 @@ class ClientViewSet(ViewSet):
             
             # Create client using service
             client = client_create(data=input_data, user=request.user)
+            invalidate_list_cache(CLIENT_CACHE)
             
             # Return created client
-            output_serializer = ClientOutputSerializer(client)
-            return Response(output_serializer.data, status=status.HTTP_201_CREATED)
+            return Response(client_output_data(client), status=status.HTTP_201_CREATED)
         
         except PermissionError as e:
             return Response(
@@ -316,6 +379,7 @@ class ClientViewSet(ViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
     
+    @client_condition
     def retrieve(self, request, pk=None):
         """
         Get a specific client by ID.
@@ -327,8 +391,7 @@ class ClientViewSet(ViewSet):
             client = client_get(user=request.user, client_id=pk)
             
             # Serialize and return
-            serializer = ClientOutputSerializer(client)
-            return Response(serializer.data)
+            return Response(client_output_data(client))
         
         except Client.DoesNotExist:
             return Response(
@@ -362,31 +425,34 @@ class ClientViewSet(ViewSet):
         Internal method to handle both full and partial updates.
         """
         try:
-            # Get client using selector (with scope validation)
-            client = client_get(user=request.user, client_id=pk)
-            
-            # Validate input
-            serializer = ClientUpdateSerializer(data=request.data, partial=partial)
-            serializer.is_valid(raise_exception=True)
-            
-            # Track which fields were explicitly provided (including None values)
-            # This is needed to distinguish between "field not provided" vs "field set to None"
-            provided_fields = set(request.data.keys())
-            
-            # Convert to Pydantic model for service
-            input_data = ClientUpdateInput(**serializer.validated_data)
-            
-            # Update client using service, passing which fields were explicitly provided
-            updated_client = client_update(
-                client=client,
-                data=input_data,
-                user=request.user,
-                provided_fields=provided_fields
-            )
+            # Lock the row from fetch to save, so concurrent edits of the same
+            # client apply one after the other instead of overwriting each other
+            with transaction.atomic():
+                # Get client using selector (with scope validation)
+                client = client_get(user=request.user, client_id=pk, for_update=True)
+                
+                # Validate input
+                serializer = ClientUpdateSerializer(data=request.data, partial=partial)
+                serializer.is_valid(raise_exception=True)
+                
+                # Track which fields were explicitly provided (including None values)
+                # This is needed to distinguish between "field not provided" vs "field set to None"
+                provided_fields = set(request.data.keys())
+                
+                # Convert to Pydantic model for service
+                input_data = ClientUpdateInput(**serializer.validated_data)
+                
+                # Update client using service, passing which fields were explicitly provided
+                updated_client = client_update(
+                    client=client,
+                    data=input_data,
+                    user=request.user,
+                    provided_fields=provided_fields
+                )
+            invalidate_list_cache(CLIENT_CACHE)
             
             # Return updated client
-            output_serializer = ClientOutputSerializer(updated_client)
-            return Response(output_serializer.data)
+            return Response(client_output_data(updated_client))
         
         except Client.DoesNotExist:
             return Response(
@@ -416,6 +482,7 @@ class ClientViewSet(ViewSet):
             
             # Delete client using service (soft delete)
             client_delete(client=client, user=request.user)
+            invalidate_list_cache(CLIENT_CACHE)
             
             return Response(status=status.HTTP_204_NO_CONTENT)
 
@@ -443,9 +510,9 @@ class ClientViewSet(ViewSet):
 
             # Restore via service to ensure consistent behavior
             restored_client = client_restore(client=client, user=request.user)
+            invalidate_list_cache(CLIENT_CACHE)
 
-            output_serializer = ClientOutputSerializer(restored_client)
-            return Response(output_serializer.data)
+            return Response(client_output_data(restored_client))
 
         except Client.DoesNotExist:
             return Response(
@@ -496,36 +563,13 @@ class ClientViewSet(ViewSet):
         
         GET /api/v1/clients/stage-counts/
         """
-        # Get scoped clients using selector (respects role-based filtering)
-        clients = client_list(user=request.user, filters={}, include_deleted=False)
-        
-        # Group by stage and count
-        stage_counts = clients.values('stage').annotate(count=Count('id'))
-        
-        # Initialize counts dictionary with all stages set to 0
-        # Using actual database values: LE, FU, CT, CL
-        counts = {
-            'LEAD': 0,
-            'FOLLOW_UP': 0,
-            'CLIENT': 0,
-            'CLOSE': 0,
-        }
-        
-        # Populate counts from queryset
-        total = 0
-        for item in stage_counts:
-            stage = item['stage']
-            count = item['count']
-            if stage in counts:
-                counts[stage] = count
-                total += count
-        
-        # Add total count
-        counts['TOTAL'] = total
-        
-        # Serialize and return
-        serializer = ClientStageCountSerializer(counts)
-        return Response(serializer.data)
+        # Count scoped clients per stage (respects role-based filtering).
+        # Already in ClientStageCountSerializer's shape: every stage plus TOTAL
+        def build():
+            return client_stage_counts(user=request.user)
+
+        # Cached per user until the next client write or role scope change
+        return cached_list_response(request, CLIENT_CACHE, build, scope=user_scope(request.user))
     
     @extend_schema(
         summary="Get client timeline",
@@ -536,6 +580,13 @@ class ClientViewSet(ViewSet):
         GET /api/v1/clients/{id}/timeline/
         """,
         parameters=[
+            OpenApiParameter(
+                name='id',
+                type=int,
+                location=OpenApiParameter.PATH,
+                description='Client ID',
+                required=True,
+            ),
             OpenApiParameter(
                 name='activity_type',
                 type=str,
@@ -553,8 +604,6 @@ class ClientViewSet(ViewSet):
         
         GET /api/v1/clients/{id}/timeline/
         """
-        from immigration.services.timeline import timeline_list
-        
         activity_type = request.query_params.get('activity_type')
         
         # Get timeline activities
@@ -564,15 +613,13 @@ class ClientViewSet(ViewSet):
         )
         
         # Paginate results
-        paginator = StandardResultsSetPagination()
+        paginator = self.pagination_class()
         page = paginator.paginate_queryset(activities, request)
         
         if page is not None:
-            serializer = ClientActivityOutput(page, many=True, context={'request': request})
-            return paginator.get_paginated_response(serializer.data)
+            return paginator.get_paginated_response([client_activity_data(activity) for activity in page])
         
-        serializer = ClientActivityOutput(activities, many=True, context={'request': request})
-        return Response(serializer.data)
+        return Response([client_activity_data(activity) for activity in activities])
     
     @extend_schema(
         methods=['GET'],
@@ -642,6 +689,7 @@ class ClientViewSet(ViewSet):
         tags=['clients'],
     )
     @action(detail=True, methods=['get', 'post', 'delete'], url_path='profile-picture')
+    @profile_picture_condition
     def profile_picture(self, request, pk=None):
         """
         Get, upload, or delete a client's profile picture.
@@ -650,20 +698,16 @@ class ClientViewSet(ViewSet):
         POST /api/v1/clients/{id}/profile-picture/ - Upload profile picture
         DELETE /api/v1/clients/{id}/profile-picture/ - Delete profile picture
         """
-        from immigration.models import ProfilePicture
-        from immigration.api.v1.serializers.profile_picture import ProfilePictureOutput
-        
         if request.method == 'GET':
-            # Get profile picture
-            try:
-                profile_picture = ProfilePicture.objects.get(client_id=pk)
-                serializer = ProfilePictureOutput(profile_picture, context={'request': request})
-                return Response(serializer.data)
-            except ProfilePicture.DoesNotExist:
+            # Get profile picture, with the uploader its output names
+            profile_picture = ProfilePicture.objects.filter(client_id=pk).select_related('uploaded_by').first()
+            if profile_picture is None:
                 return Response(
                     {'detail': 'Profile picture not found'},
                     status=status.HTTP_404_NOT_FOUND
                 )
+            serializer = ProfilePictureOutput(profile_picture, context={'request': request})
+            return Response(serializer.data)
         
         elif request.method == 'POST':
             # Upload/replace profile picture
@@ -679,18 +723,33 @@ class ClientViewSet(ViewSet):
                     {'detail': 'No file provided'},
                     status=status.HTTP_400_BAD_REQUEST
                 )
+            # Reject files over the size limit or of another type before any
+            # bytes are written to storage
+            try:
+                validate_image_file(file)
+            except DjangoValidationError as e:
+                return Response(
+                    {'detail': e.messages[0]},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
             
-            # Delete existing profile picture if exists
-            ProfilePicture.objects.filter(client_id=pk).delete()
-            
-            # Create new profile picture
-            profile_picture = ProfilePicture.objects.create(
+            # Create the profile picture, or replace the existing one, in a
+            # single INSERT ... ON CONFLICT (client_id) DO UPDATE
+            profile_picture = ProfilePicture(
                 client_id=pk,
                 file=file,
                 file_size=file.size,
                 file_type=file.content_type,
                 uploaded_by=request.user
             )
+            ProfilePicture.objects.bulk_create(
+                [profile_picture],
+                update_conflicts=True,
+                unique_fields=['client'],
+                update_fields=['file', 'file_size', 'file_type', 'uploaded_by', 'created_at', 'updated_at'],
+            )
+            # bulk_create() does not return the id of upserted rows on Django 4.2
+            profile_picture.pk = ProfilePicture.objects.values_list('pk', flat=True).get(client_id=pk)
             
             serializer = ProfilePictureOutput(profile_picture, context={'request': request})
             return Response(serializer.data, status=status.HTTP_201_CREATED)
@@ -703,12 +762,13 @@ class ClientViewSet(ViewSet):
                     status=status.HTTP_403_FORBIDDEN
                 )
             
-            try:
-                profile_picture = ProfilePicture.objects.get(client_id=pk)
-                profile_picture.delete()
-                return Response(status=status.HTTP_204_NO_CONTENT)
-            except ProfilePicture.DoesNotExist:
+            # Only what delete() reads: it removes the file from storage too,
+            # so this stays an instance delete rather than a queryset one
+            profile_picture = ProfilePicture.objects.filter(client_id=pk).only('id', 'file').first()
+            if profile_picture is None:
                 return Response(
                     {'detail': 'Profile picture not found'},
                     status=status.HTTP_404_NOT_FOUND
                 )
+            profile_picture.delete()
+            return Response(status=status.HTTP_204_NO_CONTENT)
@@ -13,25 +13,32 @@ from rest_framework.viewsets import ViewSet
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
+from immigration.api.v1.list_cache import (
+    COLLEGE_APPLICATION_STATS_CACHE,
+    cached_list_response,
+    invalidate_list_cache,
+    user_scope,
+)
 from immigration.authentication import TenantJWTAuthentication
-from immigration.pagination import StandardResultsSetPagination
+from immigration.pagination import CachedCountPagination
 from immigration.api.v1.permissions import (
     CanManageApplicationTypes,
     CanManageCollegeApplications,
 )
 
 from immigration.api.v1.serializers.college_application import (
-    ApplicationTypeOutputSerializer,
     ApplicationTypeCreateSerializer,
     ApplicationTypeUpdateSerializer,
-    StageOutputSerializer,
     StageCreateSerializer,
     StageUpdateSerializer,
     StageReorderSerializer,
-    CollegeApplicationOutputSerializer,
     CollegeApplicationCreateSerializer,
     CollegeApplicationUpdateSerializer,
+    application_type_output_data,
+    stage_output_data,
+    college_application_output_data,
 )
+from immigration.api.v1.views.utils import query_filters
 
 from immigration.selectors.college_applications import (
     application_type_list,
@@ -68,6 +75,24 @@ from immigration.services.college_applications import (
 )
 
 from immigration.models import ApplicationType, Stage, CollegeApplication
+from immigration.constants import TRUTHY_QUERY_VALUES
+
+# Seconds the stage counts and dashboard statistics are served for: they
+# also read institute, course, intake and client names, which do not
+# invalidate COLLEGE_APPLICATION_STATS_CACHE
+COLLEGE_APPLICATION_STATS_TTL = 60
+
+# Query params passed through to the list selectors as filters
+APPLICATION_TYPE_FILTER_KEYS = frozenset(('is_active', 'title'))
+STAGE_FILTER_KEYS = frozenset(('application_type_id',))
+COLLEGE_APPLICATION_FILTER_KEYS = frozenset((
+    'client_id',
+    'application_type_id',
+    'stage_id',
+    'institute_id',
+    'assigned_to_id',
+    'client_name',
+))
 
 
 # ==============================================================================
@@ -83,7 +108,7 @@ class ApplicationTypeViewSet(ViewSet):
 
     authentication_classes = [TenantJWTAuthentication]
     permission_classes = [CanManageApplicationTypes]
-    pagination_class = StandardResultsSetPagination
+    pagination_class = CachedCountPagination
 
     def list(self, request):
         """
@@ -93,25 +118,19 @@ class ApplicationTypeViewSet(ViewSet):
             is_active (bool): Filter by active status
             title (str): Search by title (case-insensitive)
         """
-        filters = {
-            'is_active': request.query_params.get('is_active'),
-            'title': request.query_params.get('title'),
-        }
-        # Remove None values
-        filters = {k: v for k, v in filters.items() if v is not None}
+        filters = query_filters(request.query_params, APPLICATION_TYPE_FILTER_KEYS)
 
         # Convert is_active to boolean
         if 'is_active' in filters:
-            filters['is_active'] = filters['is_active'].lower() in ['true', '1', 'yes']
+            filters['is_active'] = filters['is_active'].lower() in TRUTHY_QUERY_VALUES
 
         application_types = application_type_list(user=request.user, filters=filters)
 
         # Pagination
         paginator = self.pagination_class()
         page = paginator.paginate_queryset(application_types, request)
-        serializer = ApplicationTypeOutputSerializer(page, many=True)
 
-        return paginator.get_paginated_response(serializer.data)
+        return paginator.get_paginated_response([application_type_output_data(row) for row in page])
 
     def create(self, request):
         """Create new application type."""
@@ -125,8 +144,7 @@ class ApplicationTypeViewSet(ViewSet):
                 user=request.user
             )
 
-            output_serializer = ApplicationTypeOutputSerializer(application_type)
-            return Response(output_serializer.data, status=status.HTTP_201_CREATED)
+            return Response(application_type_output_data(application_type), status=status.HTTP_201_CREATED)
 
         except (PermissionError, ValueError) as e:
             return Response(
@@ -141,8 +159,7 @@ class ApplicationTypeViewSet(ViewSet):
                 user=request.user,
                 application_type_id=pk
             )
-            serializer = ApplicationTypeOutputSerializer(application_type)
-            return Response(serializer.data)
+            return Response(application_type_output_data(application_type))
 
         except ApplicationType.DoesNotExist:
             return Response(
@@ -168,8 +185,7 @@ class ApplicationTypeViewSet(ViewSet):
                 user=request.user
             )
 
-            output_serializer = ApplicationTypeOutputSerializer(updated)
-            return Response(output_serializer.data)
+            return Response(application_type_output_data(updated))
 
         except ApplicationType.DoesNotExist:
             return Response(
@@ -229,15 +245,11 @@ class StageViewSet(ViewSet):
         Query Parameters:
             application_type_id (int): Filter by application type
         """
-        filters = {
-            'application_type_id': request.query_params.get('application_type_id'),
-        }
-        filters = {k: v for k, v in filters.items() if v is not None}
+        filters = query_filters(request.query_params, STAGE_FILTER_KEYS)
 
         stages = stage_list(user=request.user, filters=filters)
-        serializer = StageOutputSerializer(stages, many=True)
 
-        return Response(serializer.data)
+        return Response([stage_output_data(stage) for stage in stages])
 
     def create(self, request):
         """Create new stage."""
@@ -248,8 +260,7 @@ class StageViewSet(ViewSet):
             input_data = StageCreateInput(**serializer.validated_data)
             stage = stage_create(data=input_data, user=request.user)
 
-            output_serializer = StageOutputSerializer(stage)
-            return Response(output_serializer.data, status=status.HTTP_201_CREATED)
+            return Response(stage_output_data(stage), status=status.HTTP_201_CREATED)
 
         except (PermissionError, ValueError) as e:
             return Response(
@@ -261,8 +272,7 @@ class StageViewSet(ViewSet):
         """Get specific stage."""
         try:
             stage = stage_get(user=request.user, stage_id=pk)
-            serializer = StageOutputSerializer(stage)
-            return Response(serializer.data)
+            return Response(stage_output_data(stage))
 
         except Stage.DoesNotExist:
             return Response(
@@ -281,8 +291,7 @@ class StageViewSet(ViewSet):
             input_data = StageUpdateInput(**serializer.validated_data)
             updated = stage_update(stage=stage, data=input_data, user=request.user)
 
-            output_serializer = StageOutputSerializer(updated)
-            return Response(output_serializer.data)
+            return Response(stage_output_data(updated))
 
         except Stage.DoesNotExist:
             return Response(
@@ -349,9 +358,10 @@ class StageViewSet(ViewSet):
                 reorder_data=reorder_inputs,
                 user=request.user
             )
+            # bulk_update() sends no post_save signals
+            invalidate_list_cache(COLLEGE_APPLICATION_STATS_CACHE)
 
-            serializer = StageOutputSerializer(updated_stages, many=True)
-            return Response(serializer.data)
+            return Response([stage_output_data(stage) for stage in updated_stages])
 
         except (PermissionError, ValueError) as e:
             return Response(
@@ -373,7 +383,7 @@ class CollegeApplicationViewSet(ViewSet):
 
     authentication_classes = [TenantJWTAuthentication]
     permission_classes = [CanManageCollegeApplications]
-    pagination_class = StandardResultsSetPagination
+    pagination_class = CachedCountPagination
 
     def list(self, request):
         """
@@ -387,24 +397,15 @@ class CollegeApplicationViewSet(ViewSet):
             assigned_to_id (int): Filter by assigned user
             client_name (str): Search by client name
         """
-        filters = {
-            'client_id': request.query_params.get('client_id'),
-            'application_type_id': request.query_params.get('application_type_id'),
-            'stage_id': request.query_params.get('stage_id'),
-            'institute_id': request.query_params.get('institute_id'),
-            'assigned_to_id': request.query_params.get('assigned_to_id'),
-            'client_name': request.query_params.get('client_name'),
-        }
-        filters = {k: v for k, v in filters.items() if v is not None}
+        filters = query_filters(request.query_params, COLLEGE_APPLICATION_FILTER_KEYS)
 
         applications = college_application_list(user=request.user, filters=filters)
 
         # Pagination
         paginator = self.pagination_class()
         page = paginator.paginate_queryset(applications, request)
-        serializer = CollegeApplicationOutputSerializer(page, many=True)
 
-        return paginator.get_paginated_response(serializer.data)
+        return paginator.get_paginated_response([college_application_output_data(row) for row in page])
 
     def create(self, request):
         """Create new college application."""
@@ -418,8 +419,7 @@ class CollegeApplicationViewSet(ViewSet):
                 user=request.user
             )
 
-            output_serializer = CollegeApplicationOutputSerializer(application)
-            return Response(output_serializer.data, status=status.HTTP_201_CREATED)
+            return Response(college_application_output_data(application), status=status.HTTP_201_CREATED)
 
         except PermissionError as e:
             return Response(
@@ -439,8 +439,7 @@ class CollegeApplicationViewSet(ViewSet):
                 user=request.user,
                 application_id=pk
             )
-            serializer = CollegeApplicationOutputSerializer(application)
-            return Response(serializer.data)
+            return Response(college_application_output_data(application))
 
         except CollegeApplication.DoesNotExist:
             return Response(
@@ -471,8 +470,7 @@ class CollegeApplicationViewSet(ViewSet):
                 user=request.user
             )
 
-            output_serializer = CollegeApplicationOutputSerializer(updated)
-            return Response(output_serializer.data)
+            return Response(college_application_output_data(updated))
 
         except CollegeApplication.DoesNotExist:
             return Response(
@@ -530,12 +528,18 @@ class CollegeApplicationViewSet(ViewSet):
         """
         application_type_id = request.query_params.get('application_type_id')
 
-        counts = college_application_stage_counts(
-            user=request.user,
-            application_type_id=application_type_id
-        )
+        def build():
+            return college_application_stage_counts(
+                user=request.user,
+                application_type_id=application_type_id
+            )
 
-        return Response(counts)
+        # Applications are scoped by the user's branches/regions: cached per
+        # role scope until the next write
+        return cached_list_response(
+            request, COLLEGE_APPLICATION_STATS_CACHE, build,
+            scope=user_scope(request.user), ttl=COLLEGE_APPLICATION_STATS_TTL,
+        )
 
     @action(detail=False, methods=['get'], url_path='dashboard-statistics')
     def dashboard_statistics(self, request):
@@ -552,9 +556,14 @@ class CollegeApplicationViewSet(ViewSet):
         """
         time_filter = request.query_params.get('time_filter', 'all')
 
-        statistics = college_application_dashboard_statistics(
-            user=request.user,
-            time_filter=time_filter
-        )
+        def build():
+            return college_application_dashboard_statistics(
+                user=request.user,
+                time_filter=time_filter
+            )
 
-        return Response(statistics)
+        # Cached per role scope until the next write
+        return cached_list_response(
+            request, COLLEGE_APPLICATION_STATS_CACHE, build,
+            scope=user_scope(request.user), ttl=COLLEGE_APPLICATION_STATS_TTL,
+        )
@@ -13,7 +13,7 @@ from rest_framework.response import Response
 from drf_spectacular.utils import extend_schema, OpenApiParameter
 from drf_spectacular.types import OpenApiTypes
 
-from immigration.pagination import StandardResultsSetPagination
+from immigration.pagination import CachedCountPagination
 from immigration.selectors.events import event_list, event_get, event_list_upcoming
 from immigration.services.events import (
     event_create,
@@ -24,9 +24,20 @@ from immigration.api.v1.serializers.event import (
     EventOutputSerializer,
     EventCreateSerializer,
     EventUpdateSerializer,
+    event_output_data,
 )
+from immigration.api.v1.views.utils import query_filters
 from immigration.models import CalendarEvent, User
 
+# Query params passed through to event_list() as filters
+EVENT_FILTER_KEYS = frozenset((
+    'start_date',
+    'end_date',
+    'assigned_to',
+    'branch',
+    'search',
+))
+
 
 class EventViewSet(viewsets.ViewSet):
     """
@@ -36,7 +47,7 @@ class EventViewSet(viewsets.ViewSet):
     """
 
     permission_classes = [IsAuthenticated]
-    pagination_class = StandardResultsSetPagination
+    pagination_class = CachedCountPagination
     queryset = CalendarEvent.objects.none()  # For schema generation
 
     @extend_schema(
@@ -74,23 +85,14 @@ class EventViewSet(viewsets.ViewSet):
     )
     def list(self, request):
         """List all calendar events with permission-based filtering."""
-        filters = {
-            'start_date': request.query_params.get('start_date'),
-            'end_date': request.query_params.get('end_date'),
-            'assigned_to': request.query_params.get('assigned_to'),
-            'branch': request.query_params.get('branch'),
-            'search': request.query_params.get('search'),
-        }
-        # Remove None values
-        filters = {k: v for k, v in filters.items() if v is not None}
+        filters = query_filters(request.query_params, EVENT_FILTER_KEYS)
 
         events = event_list(user=request.user, filters=filters)
 
         paginator = self.pagination_class()
         page = paginator.paginate_queryset(events, request)
-        serializer = EventOutputSerializer(page, many=True)
 
-        return paginator.get_paginated_response(serializer.data)
+        return paginator.get_paginated_response([event_output_data(event) for event in page])
 
     @extend_schema(
         summary="Create calendar event",
@@ -105,25 +107,12 @@ class EventViewSet(viewsets.ViewSet):
         serializer.is_valid(raise_exception=True)
 
         try:
-            # Get assigned_to user if provided
-            assigned_to = None
-            if 'assigned_to_id' in serializer.validated_data:
-                assigned_to_id = serializer.validated_data['assigned_to_id']
-                if assigned_to_id:
-                    try:
-                        assigned_to = User.objects.get(id=assigned_to_id)
-                    except User.DoesNotExist:
-                        return Response(
-                            {'detail': f'User with ID {assigned_to_id} not found'},
-                            status=status.HTTP_400_BAD_REQUEST
-                        )
-
-            # Create event
+            # Create event; the service looks up the assigned user
             event = event_create(
                 title=serializer.validated_data['title'],
                 start=serializer.validated_data['start'],
                 end=serializer.validated_data['end'],
-                assigned_to=assigned_to,
+                assigned_to_id=serializer.validated_data.get('assigned_to_id'),
                 hex_color=serializer.validated_data.get('hex_color', '#3788d8'),
                 description=serializer.validated_data.get('description', ''),
                 location=serializer.validated_data.get('location', ''),
@@ -132,9 +121,13 @@ class EventViewSet(viewsets.ViewSet):
                 created_by=request.user,
             )
 
-            output_serializer = EventOutputSerializer(event)
-            return Response(output_serializer.data, status=status.HTTP_201_CREATED)
+            return Response(event_output_data(event), status=status.HTTP_201_CREATED)
 
+        except User.DoesNotExist as e:
+            return Response(
+                {'detail': str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
         except Exception as e:
             return Response(
                 {'detail': str(e)},
@@ -151,8 +144,7 @@ class EventViewSet(viewsets.ViewSet):
         """Get a specific calendar event by ID."""
         try:
             event = event_get(user=request.user, event_id=pk)
-            serializer = EventOutputSerializer(event)
-            return Response(serializer.data)
+            return Response(event_output_data(event))
         except CalendarEvent.DoesNotExist:
             return Response(
                 {'detail': 'Event not found'},
@@ -179,29 +171,13 @@ class EventViewSet(viewsets.ViewSet):
             serializer = EventUpdateSerializer(data=request.data, partial=True)
             serializer.is_valid(raise_exception=True)
 
-            # Get assigned_to user if provided
-            assigned_to = None
-            if 'assigned_to_id' in serializer.validated_data:
-                assigned_to_id = serializer.validated_data['assigned_to_id']
-                if assigned_to_id:
-                    try:
-                        assigned_to = User.objects.get(id=assigned_to_id)
-                    except User.DoesNotExist:
-                        return Response(
-                            {'detail': f'User with ID {assigned_to_id} not found'},
-                            status=status.HTTP_400_BAD_REQUEST
-                        )
-                else:
-                    # Explicitly set to None if null
-                    assigned_to = None
-
             # Update event
             updated_event = event_update(
                 event=event_obj,
                 title=serializer.validated_data.get('title'),
                 start=serializer.validated_data.get('start'),
                 end=serializer.validated_data.get('end'),
-                assigned_to=assigned_to if 'assigned_to_id' in serializer.validated_data else None,
+                assigned_to_id=serializer.validated_data.get('assigned_to_id'),
                 hex_color=serializer.validated_data.get('hex_color'),
                 description=serializer.validated_data.get('description'),
                 location=serializer.validated_data.get('location'),
@@ -209,8 +185,7 @@ class EventViewSet(viewsets.ViewSet):
                 updated_by=request.user,
             )
 
-            output_serializer = EventOutputSerializer(updated_event)
-            return Response(output_serializer.data)
+            return Response(event_output_data(updated_event))
 
         except CalendarEvent.DoesNotExist:
             return Response(
@@ -222,6 +197,11 @@ class EventViewSet(viewsets.ViewSet):
                 {'detail': str(e)},
                 status=status.HTTP_403_FORBIDDEN
             )
+        except User.DoesNotExist as e:
+            return Response(
+                {'detail': str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
         except Exception as e:
             return Response(
                 {'detail': str(e)},
@@ -274,9 +254,8 @@ class EventViewSet(viewsets.ViewSet):
 
         paginator = self.pagination_class()
         page = paginator.paginate_queryset(events, request)
-        serializer = EventOutputSerializer(page, many=True)
 
-        return paginator.get_paginated_response(serializer.data)
+        return paginator.get_paginated_response([event_output_data(event) for event in page])
 
     @extend_schema(
         summary="Get today's events",
@@ -306,6 +285,5 @@ class EventViewSet(viewsets.ViewSet):
         
         paginator = self.pagination_class()
         page = paginator.paginate_queryset(events, request)
-        serializer = EventOutputSerializer(page, many=True)
 
-        return paginator.get_paginated_response(serializer.data)
+        return paginator.get_paginated_response([event_output_data(event) for event in page])
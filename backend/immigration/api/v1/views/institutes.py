@@ -18,6 +18,7 @@ from immigration.api.v1.serializers.institutes import (
     InstituteCreateSerializer,
     InstituteUpdateSerializer,
 )
+from immigration.api.v1.views.utils import query_filters
 from immigration.selectors.institutes import institute_list, institute_get, deleted_institutes_list
 from immigration.services.institutes import (
     institute_create,
@@ -28,6 +29,14 @@ from immigration.services.institutes import (
     InstituteUpdateInput
 )
 from immigration.models import Institute
+from immigration.constants import TRUTHY_QUERY_VALUES
+
+# Query params passed through to institute_list() as filters
+INSTITUTE_FILTER_KEYS = frozenset((
+    'search',
+    'name',
+    'short_name',
+))
 
 
 @extend_schema_view(
@@ -139,19 +148,11 @@ class InstituteViewSet(ViewSet):
         GET /api/v1/institutes/
         """
         # Extract filters from query params
-        filters = {
-            'search': request.query_params.get('search'),
-            'name': request.query_params.get('name'),
-            'short_name': request.query_params.get('short_name'),
-        }
-
-        # Remove None values
-        filters = {k: v for k, v in filters.items() if v is not None}
+        query_params = request.query_params
+        filters = query_filters(query_params, INSTITUTE_FILTER_KEYS)
 
         # Check if user wants to include soft-deleted institutes
-        include_deleted = str(
-            request.query_params.get('include_deleted', 'false')
-        ).lower() in ('true', '1', 'yes', 'on')
+        include_deleted = query_params.get('include_deleted', 'false').lower() in TRUTHY_QUERY_VALUES
 
         # Get filtered institutes using selector
         institutes = institute_list(user=request.user, filters=filters, include_deleted=include_deleted)
@@ -40,6 +40,51 @@ from immigration.constants import TaskPriority, TaskStatus
 
 User = get_user_model()
 
+# Columns TaskOutputSerializer reads. Related users/branch/content type are
+# joined for their name fields only, so skip the rest of their columns
+# (password hashes, flags, timestamps, ...).
+TASK_OUTPUT_ONLY_FIELDS = (
+    'id',
+    'title',
+    'detail',
+    'priority',
+    'status',
+    'due_date',
+    'tags',
+    'comments',
+    'object_id',
+    'completed_at',
+    'created_at',
+    'updated_at',
+    'assigned_to',
+    'assigned_to__id',
+    'assigned_to__username',
+    'assigned_to__first_name',
+    'assigned_to__last_name',
+    'assigned_by',
+    'assigned_by__id',
+    'assigned_by__username',
+    'assigned_by__first_name',
+    'assigned_by__last_name',
+    'created_by',
+    'created_by__id',
+    'created_by__username',
+    'created_by__first_name',
+    'created_by__last_name',
+    'updated_by',
+    'updated_by__id',
+    'updated_by__username',
+    'updated_by__first_name',
+    'updated_by__last_name',
+    'branch',
+    'branch__id',
+    'branch__name',
+    'content_type',
+    'content_type__id',
+    'content_type__app_label',
+    'content_type__model',
+)
+
 
 class TaskViewSet(viewsets.ModelViewSet):
     """
@@ -97,10 +142,10 @@ class TaskViewSet(viewsets.ModelViewSet):
             # Default: show ALL tasks (no restrictions)
             queryset = Task.objects.all()
 
-        # Use select_related to optimize queries
+        # Use select_related to optimize queries, fetching only serialized columns
         queryset = queryset.select_related(
-            'assigned_to', 'assigned_by', 'content_type', 'branch'
-        )
+            'assigned_to', 'assigned_by', 'created_by', 'updated_by', 'content_type', 'branch'
+        ).only(*TASK_OUTPUT_ONLY_FIELDS)
 
         # Filter by status if provided
         status_filter = self.request.query_params.get('status')
@@ -139,6 +184,18 @@ class TaskViewSet(viewsets.ModelViewSet):
         
         return queryset.order_by('-due_date', '-created_at')
     
+    def get_serializer_context(self):
+        """
+        Add omit_nulls to the serializer context.
+
+        Clients opt in with the ``X-Omit-Nulls: true`` header to receive task
+        rows without their null fields (unassigned user/branch, no linked
+        entity, ...). Without the header the response shape is unchanged.
+        """
+        context = super().get_serializer_context()
+        context['omit_nulls'] = self.request.headers.get('X-Omit-Nulls', '').lower() == 'true'
+        return context
+
     def get_serializer_class(self):
         """
         Return appropriate serializer class based on action.
@@ -153,6 +210,13 @@ class TaskViewSet(viewsets.ModelViewSet):
         summary="List tasks",
         description="Get all tasks (no role-based restrictions). Can filter by status, priority, content_type, object_id, assigned_to_me, and overdue.",
         parameters=[
+            OpenApiParameter(
+                name='X-Omit-Nulls',
+                type=OpenApiTypes.BOOL,
+                location=OpenApiParameter.HEADER,
+                description='Set to true to omit null fields from each task (default: false)',
+                required=False,
+            ),
             OpenApiParameter(
                 name='status',
                 type=OpenApiTypes.STR,
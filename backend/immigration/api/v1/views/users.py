@@ -13,6 +13,11 @@ from rest_framework.permissions import IsAuthenticated
 from immigration.authentication import TenantJWTAuthentication
 from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter
 from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Permission
+from django.db.models import Prefetch
+
+from immigration.models.branch import Branch
+from immigration.models.region import Region
 
 from immigration.api.v1.permissions import CanCreateUsers
 from immigration.pagination import StandardResultsSetPagination
@@ -22,11 +27,14 @@ from immigration.api.v1.serializers.users import (
     UserCreateSerializer,
     UserUpdateSerializer,
     AssignableUserSerializer,
+    ASSIGNABLE_USER_VALUES,
+    assignable_user_data,
 )
 from immigration.api.v1.serializers.groups import UserPermissionAssignmentSerializer
-from immigration.selectors.users import user_list, user_get
+from immigration.selectors.users import user_list, user_get, user_annotate_primary_group
 from immigration.services.users import (
     user_create,
+    user_bulk_create,
     user_update,
     UserCreateInput,
     UserUpdateInput
@@ -34,6 +42,38 @@ from immigration.services.users import (
 
 User = get_user_model()
 
+# Relations read by UserOutputSerializer for every user in a list.
+# branches_data/regions_data only render id and name.
+USER_OUTPUT_PREFETCH = (
+    'groups',
+    Prefetch('branches', queryset=Branch.objects.only('id', 'name')),
+    Prefetch('regions', queryset=Region.objects.only('id', 'name')),
+    Prefetch('user_permissions', queryset=Permission.objects.select_related('content_type')),
+)
+
+# Upper bound on users per POST /users/bulk/ request
+USER_BULK_CREATE_MAX = 500
+
+
+def _user_create_error_response(error):
+    """400 response for a ValueError raised by user_create()/user_bulk_create()."""
+    error_msg = str(error)
+    # Handle field-specific errors for better frontend display
+    if "Email" in error_msg and "already exists" in error_msg:
+        return Response(
+            {'email': ['A user with this email already exists.']},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    if "Username" in error_msg and "already exists" in error_msg:
+        return Response(
+            {'username': ['A user with this username already exists.']},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    return Response(
+        {'detail': error_msg},
+        status=status.HTTP_400_BAD_REQUEST
+    )
+
 
 @extend_schema_view(
     list=extend_schema(
@@ -225,6 +265,9 @@ class UserViewSet(ViewSet):
         if is_active is not None:
             users = users.filter(is_active=is_active.lower() == 'true')
 
+        # Prefetch serialized relations (one query each instead of per user)
+        users = user_annotate_primary_group(users).prefetch_related(*USER_OUTPUT_PREFETCH)
+
         # Apply pagination
         paginator = self.pagination_class()
         page = paginator.paginate_queryset(users, request)
@@ -259,22 +302,57 @@ class UserViewSet(ViewSet):
                 status=status.HTTP_403_FORBIDDEN
             )
         except ValueError as e:
-            error_msg = str(e)
-            # Handle field-specific errors for better frontend display
-            if "Email" in error_msg and "already exists" in error_msg:
-                return Response(
-                    {'email': ['A user with this email already exists.']},
-                    status=status.HTTP_400_BAD_REQUEST
-                )
-            if "Username" in error_msg and "already exists" in error_msg:
-                return Response(
-                    {'username': ['A user with this username already exists.']},
-                    status=status.HTTP_400_BAD_REQUEST
-                )
+            return _user_create_error_response(e)
+    
+    @extend_schema(
+        summary="Create users in bulk",
+        description="""
+        Creates several users in one request (batch onboarding).
+
+        Each item is validated exactly like POST /users/. The batch is
+        all-or-nothing: if any item is invalid, no user is created.
+        """,
+        request=UserCreateSerializer(many=True),
+        responses={
+            201: UserOutputSerializer(many=True),
+            400: {'description': 'Bad Request - Validation errors or duplicate username/email'},
+            401: {'description': 'Unauthorized'},
+            403: {'description': 'Forbidden - No permission to create users'},
+        },
+        tags=['users'],
+    )
+    @action(detail=False, methods=['post'], url_path='bulk')
+    def bulk_create(self, request):
+        """
+        Create several users at once.
+
+        POST /api/v1/users/bulk/
+        """
+        serializer = UserCreateSerializer(
+            data=request.data,
+            many=True,
+            allow_empty=False,
+            max_length=USER_BULK_CREATE_MAX,
+        )
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            input_data = [UserCreateInput(**item) for item in serializer.validated_data]
+            users = user_bulk_create(data=input_data, created_by=request.user)
+        except PermissionError as e:
             return Response(
-                {'detail': error_msg},
-                status=status.HTTP_400_BAD_REQUEST
+                {'detail': str(e)},
+                status=status.HTTP_403_FORBIDDEN
             )
+        except ValueError as e:
+            return _user_create_error_response(e)
+
+        # Re-read with the list endpoint's annotation and prefetches
+        created = user_annotate_primary_group(
+            User.objects.filter(id__in=[user.id for user in users])
+        ).prefetch_related(*USER_OUTPUT_PREFETCH).order_by('id')
+        output_serializer = UserOutputSerializer(created, many=True)
+        return Response(output_serializer.data, status=status.HTTP_201_CREATED)
     
     def retrieve(self, request, pk=None):
         """
@@ -520,12 +598,13 @@ class UserViewSet(ViewSet):
         if is_active is not None:
             users = users.filter(is_active=is_active.lower() == 'true')
 
-        # Apply pagination
+        users = user_annotate_primary_group(users).values(*ASSIGNABLE_USER_VALUES)
+
+        # Apply pagination; rows are plain dicts, shaped like AssignableUserSerializer
         paginator = self.pagination_class()
         page = paginator.paginate_queryset(users, request)
-        serializer = AssignableUserSerializer(page, many=True)
 
-        return paginator.get_paginated_response(serializer.data)
+        return paginator.get_paginated_response([assignable_user_data(row) for row in page])
 
     @extend_schema(
         summary="Assign permissions to user",
@@ -0,0 +1,8 @@
+"""
+Helpers shared by the API v1 viewsets.
+"""
+
+
+def query_filters(query_params, keys):
+    """Filter params of keys present in query_params; absent ones are not looked up."""
+    return {key: query_params[key] for key in query_params.keys() & keys}
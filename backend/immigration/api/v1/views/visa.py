@@ -19,7 +19,11 @@ from immigration.api.v1.serializers.visa import (
     VisaApplicationCreateSerializer,
     VisaApplicationUpdateSerializer
 )
-from immigration.selectors.applications import visa_application_list, visa_application_get
+from immigration.selectors.applications import (
+    visa_application_annotate_names,
+    visa_application_get,
+    visa_application_list,
+)
 from immigration.selectors.visa_statistics import (
     visa_application_status_counts,
     visa_application_dashboard_statistics
@@ -151,7 +155,9 @@ class VisaApplicationViewSet(ViewSet):
         }
         filters = {k: v for k, v in filters.items() if v is not None}
 
-        applications = visa_application_list(user=request.user, filters=filters)
+        applications = visa_application_annotate_names(
+            visa_application_list(user=request.user, filters=filters)
+        )
 
         # Apply pagination
         paginator = self.pagination_class()
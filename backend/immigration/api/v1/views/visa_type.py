@@ -4,6 +4,11 @@ Visa type API views using service/selector pattern.
 This module provides RESTful API endpoints for visa type management.
 """
 
+import hashlib
+
+from django.db import connection
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 from rest_framework import status
 from rest_framework.viewsets import ViewSet
 from rest_framework.decorators import action
@@ -23,6 +28,7 @@ from immigration.selectors.visa_types import (
     visa_type_list,
     visa_type_get,
     visa_category_list,
+    visa_reference_data_version,
 )
 from immigration.services.visa_types import (
     visa_type_create,
@@ -34,6 +40,27 @@ from immigration.services.visa_types import (
 from immigration.models.visa import VisaType
 
 
+def visa_reference_etag(request, *args, **kwargs):
+    """
+    ETag for visa type/category GET responses.
+
+    Combines the tenant schema, the reference data version, the full path
+    (filters, pagination, pk) and the Accept header, so a client only gets a
+    304 for a response it has already received.
+    """
+    key = ':'.join((
+        connection.schema_name,
+        visa_reference_data_version(),
+        request.get_full_path(),
+        request.META.get('HTTP_ACCEPT', ''),
+    ))
+    return hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+
+
+# Conditional GET: If-None-Match short-circuits to 304 before serializing
+reference_data_condition = method_decorator(condition(etag_func=visa_reference_etag))
+
+
 @extend_schema_view(
     list=extend_schema(
         summary="List all visa types",
@@ -116,6 +143,7 @@ class VisaTypeViewSet(ViewSet):
     permission_classes = [IsAuthenticated]
     pagination_class = StandardResultsSetPagination
     
+    @reference_data_condition
     def list(self, request):
         """List all visa types with optional filtering."""
         filters = {
@@ -151,6 +179,7 @@ class VisaTypeViewSet(ViewSet):
                 status=status.HTTP_403_FORBIDDEN if isinstance(e, PermissionError) else status.HTTP_400_BAD_REQUEST
             )
     
+    @reference_data_condition
     def retrieve(self, request, pk=None):
         """Get a specific visa type by ID."""
         try:
@@ -214,6 +243,7 @@ class VisaCategoryViewSet(ViewSet):
     authentication_classes = [TenantJWTAuthentication]
     permission_classes = [IsAuthenticated]
     
+    @reference_data_condition
     def list(self, request):
         """List all visa categories."""
         categories = visa_category_list()
@@ -46,6 +46,10 @@ class ImmigrationConfig(AppConfig):
         except Exception as e:
             logger.error(f"Error initializing events framework: {e}", exc_info=True)
         
+        # Role-scoped list caches follow membership changes
+        from immigration.api.v1.list_cache import connect_list_cache_signals
+        connect_list_cache_signals()
+
         # Old signals are now replaced by event framework
         # import immigration.signals  # Disabled - using event framework instead
         pass
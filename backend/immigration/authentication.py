@@ -8,10 +8,20 @@ A token generated for Tenant A cannot be used to access Tenant B's data.
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework.exceptions import AuthenticationFailed
 from django.db import connection
+import hashlib
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
+# Validated access tokens by a hash of the raw token, so a client's burst of
+# requests verifies the signature once. An entry is dropped after
+# TOKEN_CACHE_TTL seconds or when the token expires, whichever comes first.
+# Users are still looked up per request.
+TOKEN_CACHE_TTL = 30
+TOKEN_CACHE_SIZE = 1024
+_validated_tokens = {}
+
 
 class TenantJWTAuthentication(JWTAuthentication):
     """
@@ -31,6 +41,22 @@ class TenantJWTAuthentication(JWTAuthentication):
     If tenant mismatch detected → AuthenticationFailed exception
     """
 
+    def get_validated_token(self, raw_token):
+        """Validated token for raw_token, from the per-process cache when possible."""
+        key = hashlib.blake2b(raw_token, digest_size=16).digest()
+        now = time.monotonic()
+        entry = _validated_tokens.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+
+        validated_token = super().get_validated_token(raw_token)
+        ttl = min(TOKEN_CACHE_TTL, validated_token['exp'] - time.time())
+        if len(_validated_tokens) >= TOKEN_CACHE_SIZE:
+            # Bounded, not LRU: start over rather than track usage per hit
+            _validated_tokens.clear()
+        _validated_tokens[key] = (now + ttl, validated_token)
+        return validated_token
+
     def authenticate(self, request):
         """
         Authenticate request and validate tenant identifier (tid).
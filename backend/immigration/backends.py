@@ -0,0 +1,30 @@
+"""
+Django authentication backends.
+"""
+
+from django.contrib.auth.backends import ModelBackend
+from django.contrib.auth.models import Permission
+
+
+class ModelPermissionBackend(ModelBackend):
+    """
+    ModelBackend that reads a user's permissions in a single query.
+
+    ModelBackend loads the user's own permissions and their groups'
+    permissions with two queries on the first has_perm() of a request.
+    This backend reads both with one UNION and fills the same per-instance
+    cache, so has_perm() checks later in the request stay set lookups.
+    """
+
+    def get_all_permissions(self, user_obj, obj=None):
+        # Superusers are granted everything before backends are asked
+        if not user_obj.is_active or user_obj.is_anonymous or obj is not None or user_obj.is_superuser:
+            return super().get_all_permissions(user_obj, obj)
+        if not hasattr(user_obj, '_perm_cache'):
+            fields = ('content_type__app_label', 'codename')
+            user_perms = Permission.objects.filter(user=user_obj).values_list(*fields)
+            group_perms = Permission.objects.filter(group__user=user_obj).values_list(*fields)
+            user_obj._perm_cache = {
+                f"{app_label}.{codename}" for app_label, codename in user_perms.union(group_perms)
+            }
+        return user_obj._perm_cache
@@ -202,3 +202,6 @@ CURRENCY_CHOICES = [
     ('JPY', 'Japanese Yen'),
     # Add more currencies as needed
 ]
+
+# Query param values read as true (e.g. ?include_deleted=1)
+TRUTHY_QUERY_VALUES = frozenset(('true', '1', 'yes', 'on'))
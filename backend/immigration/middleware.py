@@ -1,29 +1,41 @@
 import threading
+from django.utils.functional import SimpleLazyObject
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework_simplejwt.exceptions import InvalidToken, AuthenticationFailed
 
 _local = threading.local()
 
 
+def _request_user(request):
+    """Resolve the user performing request, for get_current_user()."""
+    # DRF copies the user and token it authenticated onto the HttpRequest;
+    # reuse them instead of decoding and looking up the same JWT again
+    if getattr(request, 'auth', None) is not None:
+        return request.user
+
+    user = None
+
+    # Check if the request contains a JWT token
+    if 'HTTP_AUTHORIZATION' in request.META and request.META['HTTP_AUTHORIZATION'].startswith('Bearer'):
+        try:
+            user, _ = JWTAuthentication().authenticate(request)
+        except (InvalidToken, AuthenticationFailed):
+            pass  # If JWT authentication fails, continue with other authentication methods
+
+    # Fallback to the default authentication method (e.g., session-based)
+    if user is None:
+        user = request.user
+
+    return user
+
+
 class CurrentUserMiddleware:
     def __init__(self, get_response):
         self.get_response = get_response
 
     def __call__(self, request):
-        user = None
-
-        # Check if the request contains a JWT token
-        if 'HTTP_AUTHORIZATION' in request.META and request.META['HTTP_AUTHORIZATION'].startswith('Bearer'):
-            try:
-                user, _ = JWTAuthentication().authenticate(request)
-            except (InvalidToken, AuthenticationFailed):
-                pass  # If JWT authentication fails, continue with other authentication methods
-
-        # Fallback to the default authentication method (e.g., session-based)
-        if user is None:
-            user = request.user
-
-        _local.user = user
+        # Resolved on first use: read-only requests never pay for it
+        _local.user = SimpleLazyObject(lambda: _request_user(request))
         response = self.get_response(request)
         return response
 
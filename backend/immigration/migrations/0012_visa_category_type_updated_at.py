@@ -0,0 +1,26 @@
+# Generated by Django 4.2.6 on 2026-10-18 09:00
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('immigration', '0011_make_agent_email_nullable'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='visacategory',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now, help_text='Timestamp when record was last updated'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='visatype',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now, help_text='Timestamp when record was last updated'),
+            preserve_default=False,
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.6 on 2026-10-18 11:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('immigration', '0012_visa_category_type_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='agent',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['agent_name'], name='agent_live_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='branch',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['name'], name='branch_live_name_idx'),
+        ),
+    ]
@@ -46,6 +46,12 @@ class Agent(LifeCycleModel, SoftDeletionModel):
             models.Index(fields=['agent_type']),
             models.Index(fields=['email']),
             models.Index(fields=['deleted_at']),
+            # Live agents in list order (agent_list's default predicate)
+            models.Index(
+                fields=['agent_name'],
+                condition=models.Q(deleted_at__isnull=True),
+                name='agent_live_name_idx',
+            ),
         ]
 
     def __str__(self):
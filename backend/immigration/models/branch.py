@@ -44,6 +44,12 @@ class Branch(LifeCycleModel, SoftDeletionModel):
             models.Index(fields=['region']),
             models.Index(fields=['name']),
             models.Index(fields=['deleted_at']),
+            # Live branches in list order (branch_list's default predicate)
+            models.Index(
+                fields=['name'],
+                condition=models.Q(deleted_at__isnull=True),
+                name='branch_live_name_idx',
+            ),
         ]
 
     def __str__(self):
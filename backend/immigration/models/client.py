@@ -109,6 +109,12 @@ class Client(LifeCycleModel, SoftDeletionModel):
             models.Index(fields=['branch', 'stage']),
             models.Index(fields=['email']),
             models.Index(fields=['deleted_at']),  # For soft deletion queries
+            # Keyset pages of live clients (newest first, id tie-breaker)
+            models.Index(
+                fields=['-created_at', 'id'],
+                condition=models.Q(deleted_at__isnull=True),
+                name='client_live_created_idx',
+            ),
         ]
         ordering = ['-created_at']
     
@@ -72,6 +72,9 @@ class ApplicationType(LifeCycleModel, SoftDeletionModel):
         Returns:
             bool: True if applications exist, False otherwise
         """
+        if 'annotated_has_applications' in self.__dict__:
+            # Annotated by application_type_list()
+            return self.annotated_has_applications
         return self.college_applications.filter(deleted_at__isnull=True).exists()
 
     @property
@@ -82,6 +85,9 @@ class ApplicationType(LifeCycleModel, SoftDeletionModel):
         Returns:
             int: Number of stages
         """
+        if 'annotated_stages_count' in self.__dict__:
+            # Annotated by application_type_list()
+            return self.annotated_stages_count
         return self.stages.count()
 
 
@@ -151,6 +157,9 @@ class Stage(LifeCycleModel):
         Returns:
             bool: True if this stage has the highest position number
         """
+        if 'final_stage_position' in self.__dict__:
+            # Annotated by stage_list()
+            return self.position == self.final_stage_position
         max_position_result = Stage.objects.filter(
             application_type=self.application_type
         ).aggregate(max_position=Max('position'))
@@ -338,4 +347,7 @@ class CollegeApplication(LifeCycleModel, SoftDeletionModel):
         Returns:
             bool: True if in final stage, False otherwise
         """
+        if 'final_stage_position' in self.__dict__:
+            # Annotated by college_application_list()
+            return self.stage.position == self.final_stage_position
         return self.stage.is_final_stage if self.stage else False
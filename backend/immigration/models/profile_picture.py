@@ -43,8 +43,8 @@ def profile_picture_upload_path(instance, filename):
     """
     # Extract file extension
     ext = os.path.splitext(filename)[1]
-    # Use client ID in path for organization
-    return f'profile_pictures/client_{instance.client.id}/{instance.client.id}{ext}'
+    # Use client ID in path for organization (client_id: no client query)
+    return f'profile_pictures/client_{instance.client_id}/{instance.client_id}{ext}'
 
 
 class ProfilePicture(models.Model):
@@ -6,6 +6,7 @@ SIMPLIFIED: No role field - uses Django Groups only.
 
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.utils.functional import cached_property
 
 
 class User(AbstractUser):
@@ -58,6 +59,14 @@ class User(AbstractUser):
         groups_str = ', '.join([g.name for g in self.groups.all()]) or 'No Group'
         return f"{self.username} ({groups_str})"
     
+    @cached_property
+    def full_name(self):
+        """"First Last" when both are set, otherwise the username."""
+        first_name, last_name = self.first_name, self.last_name
+        if first_name and last_name:
+            return " ".join((first_name, last_name))
+        return self.username
+
     def get_primary_group(self):
         """Get the user's primary group (first group)."""
         return self.groups.first()
@@ -65,6 +74,16 @@ class User(AbstractUser):
     def is_in_group(self, group_name):
         """Check if user is in a specific group."""
         return self.groups.filter(name=group_name).exists()
+
+    @cached_property
+    def group_names(self):
+        """
+        Names of the user's groups, read once per instance.
+
+        Request users are loaded per request, so this is a snapshot for the
+        request: use is_in_group() after changing the user's groups.
+        """
+        return frozenset(self.groups.values_list('name', flat=True))
     
     def get_all_permissions_list(self):
         """
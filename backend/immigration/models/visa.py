@@ -20,6 +20,10 @@ class VisaCategory(models.Model):
     name = models.CharField(max_length=100, unique=True)
     code = models.CharField(max_length=20, unique=True, blank=True, null=True)
     description = models.TextField(blank=True)
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        help_text="Timestamp when record was last updated"
+    )
     
     class Meta:
         db_table = 'immigration_visacategory'
@@ -56,6 +60,10 @@ class VisaType(models.Model):
         blank=True,
         help_text="List of required documents for this visa type"
     )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        help_text="Timestamp when record was last updated"
+    )
     
     class Meta:
         db_table = 'immigration_visatype'
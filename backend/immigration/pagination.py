@@ -1,4 +1,27 @@
+import base64
+import binascii
+import hashlib
+import json
+import operator
+from functools import reduce
+
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.core.paginator import Paginator
+from django.db import OperationalError, connections, transaction
+from django.db.models import Q, QuerySet
+from django.utils.functional import cached_property
+from psycopg2 import errorcodes
+from rest_framework.exceptions import NotFound
 from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+# Milliseconds an exact COUNT(*) may run before TimeoutPaginator estimates
+COUNT_TIMEOUT_MS = 150
+
+# Seconds CachedCountPaginator reuses a count for the later pages of a query
+COUNT_CACHE_TTL = 60
 
 
 # This pagination will apply to all views where explicitly pagination_class not set.
@@ -21,6 +44,281 @@ class StandardResultsSetPagination(PageNumberPagination):
     page_size_query_param = 'page_size'
     max_page_size = 100
 
+    # Instances hold per-request state (self.page, self.request, and the
+    # cursors of KeysetPagination) between paginate_queryset() and
+    # get_paginated_response(), so views create one per request rather than
+    # sharing a module-level paginator. Sync views of the ASGI app run on a
+    # thread pool, so a shared instance would mix up concurrent requests;
+    # creating one costs well under a microsecond.
+
+    def get_paginated_data(self, data):
+        """
+        Paginated body for data, without wrapping it in a Response.
+
+        For callers that only need the payload (e.g. to cache it).
+        """
+        return {
+            'count': self.page.paginator.count,
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        }
+
+    def get_paginated_response(self, data):
+        return Response(self.get_paginated_data(data))
+
+
+class TimeoutPaginator(Paginator):
+    """
+    Paginator whose count gives up on slow COUNT(*) queries.
+
+    The exact count runs under a statement_timeout of COUNT_TIMEOUT_MS; when
+    it is cancelled, count falls back to the planner's row estimate for the
+    queryset's own SQL, so filters and role scoping still apply.
+    """
+
+    @cached_property
+    def count(self):
+        if not isinstance(self.object_list, QuerySet):
+            return super().count
+        connection = connections[self.object_list.db]
+        nested = connection.in_atomic_block
+        try:
+            with transaction.atomic(using=connection.alias):
+                with connection.cursor() as cursor:
+                    # Transaction-local, so it ends with the atomic block
+                    cursor.execute(
+                        "SELECT current_setting('statement_timeout'), "
+                        "set_config('statement_timeout', %s, true)",
+                        [str(COUNT_TIMEOUT_MS)],
+                    )
+                    previous = cursor.fetchone()[0]
+                count = self.object_list.count()
+                if nested:
+                    # Savepoint release keeps the setting: restore it for the
+                    # rest of the enclosing transaction
+                    with connection.cursor() as cursor:
+                        cursor.execute("SELECT set_config('statement_timeout', %s, true)", [previous])
+                return count
+        except OperationalError as exc:
+            if getattr(exc.__cause__, 'pgcode', None) != errorcodes.QUERY_CANCELED:
+                raise
+            # Cancelled (the rollback also reset statement_timeout)
+            return self._estimated_count(connection)
+
+    def _estimated_count(self, connection):
+        """Planner row estimate for the queryset, filters included."""
+        sql, params = self.object_list.order_by().query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return max(int(plan[0]['Plan']['Plan Rows']), 0)
+
+
+class TimeoutCountPagination(StandardResultsSetPagination):
+    """
+    StandardResultsSetPagination for large tables: counts are bounded by
+    COUNT_TIMEOUT_MS and estimated beyond it (see TimeoutPaginator).
+    """
+    django_paginator_class = TimeoutPaginator
+
+
+class CachedCountPaginator(Paginator):
+    """
+    Paginator that reuses the first page's count for the following pages.
+
+    The count of a queryset is cached for COUNT_CACHE_TTL seconds under the
+    tenant schema and the queryset's SQL, which carries its filters and the
+    caller's role scoping. The first page always counts afresh and refreshes
+    the entry, so the count on later pages is at most COUNT_CACHE_TTL stale.
+    """
+
+    # Whether count must not be read from the cache; page() sets it
+    refresh_count = True
+
+    def page(self, number):
+        # DRF passes the raw page parameter, or 1 when absent
+        self.refresh_count = str(number) == '1'
+        return super().page(number)
+
+    @cached_property
+    def count(self):
+        if not isinstance(self.object_list, QuerySet) or self.object_list.query.is_empty():
+            return super().count
+        connection = connections[self.object_list.db]
+        key = ':'.join((connection.schema_name, self.object_list.model._meta.label, str(self.object_list.query)))
+        key = 'paginator_count:' + hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+        if not self.refresh_count:
+            count = cache.get(key)
+            if count is not None:
+                return count
+        count = super().count
+        cache.set(key, count, COUNT_CACHE_TTL)
+        return count
+
+
+class CachedCountPagination(StandardResultsSetPagination):
+    """
+    StandardResultsSetPagination whose later pages skip the COUNT(*) query
+    (see CachedCountPaginator).
+    """
+    django_paginator_class = CachedCountPaginator
+
+
+class KeysetPagination(TimeoutCountPagination):
+    """
+    TimeoutCountPagination that seeks instead of using OFFSET.
+
+    Without a ``page`` parameter, pages are read with a WHERE clause on the
+    queryset's ordering columns (plus ``id`` as a tie-breaker) continuing
+    from the ``cursor`` parameter, so deep pages cost the same as the first.
+    ``next``/``previous`` are cursor links. Requests with ``page`` keep the
+    LIMIT/OFFSET behaviour of TimeoutCountPagination.
+
+    Rows must carry every ordering column and ``id`` under their ordering
+    names (include them in values() or values_list(named=True) querysets).
+    Querysets ordered by expressions fall back to OFFSET pagination.
+    """
+    cursor_query_param = 'cursor'
+    invalid_cursor_message = 'Invalid cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        ordering = self._keyset_ordering(queryset)
+        if ordering is None or self.page_query_param in request.query_params:
+            self.keyset = False
+            return super().paginate_queryset(queryset, request, view)
+
+        self.keyset = True
+        self.request = request
+        page_size = self.get_page_size(request)
+        values, reverse = self._decode_cursor(
+            request.query_params.get(self.cursor_query_param), queryset.model, ordering,
+        )
+
+        if reverse:
+            ordering = [(name, not descending) for name, descending in ordering]
+        qs = queryset.order_by(*(f"-{name}" if descending else name for name, descending in ordering))
+        if values is not None:
+            qs = qs.filter(self._after(queryset.model, ordering, values))
+
+        rows = list(qs[:page_size + 1])
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        if values is None and not has_more:
+            # The whole result fits on the first page
+            self.count = len(rows)
+        else:
+            self.count = self.django_paginator_class(queryset, page_size).count
+        if reverse:
+            rows.reverse()
+        names = [name for name, _ in ordering]
+        first = self._row_values(rows[0], names) if rows else None
+        last = self._row_values(rows[-1], names) if rows else None
+
+        # Seeking forward from a cursor: there are rows before it. Seeking
+        # backwards: the cursor itself came from a following row.
+        has_next = has_more if not reverse else True
+        has_previous = has_more if reverse else values is not None
+        self.next_cursor = (last, False) if has_next and rows else None
+        self.previous_cursor = (first, True) if has_previous and rows else None
+        return rows
+
+    def get_paginated_data(self, data):
+        if not self.keyset:
+            return super().get_paginated_data(data)
+        return {
+            'count': self.count,
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        }
+
+    def get_next_link(self):
+        if not self.keyset:
+            return super().get_next_link()
+        return self._cursor_link(self.next_cursor)
+
+    def get_previous_link(self):
+        if not self.keyset:
+            return super().get_previous_link()
+        return self._cursor_link(self.previous_cursor)
+
+    @staticmethod
+    def _keyset_ordering(queryset):
+        """[(name, descending), ...] of queryset's ordering plus id, or None."""
+        ordering = queryset.query.order_by or queryset.model._meta.ordering
+        result = []
+        for name in ordering:
+            if not isinstance(name, str) or name == '?' or '__' in name:
+                return None
+            descending = name.startswith('-')
+            name = name.lstrip('-')
+            result.append(('id' if name == 'pk' else name, descending))
+        if not any(name == 'id' for name, _ in result):
+            result.append(('id', False))
+        return result
+
+    @staticmethod
+    def _row_values(row, names):
+        if isinstance(row, dict):
+            return [row[name] for name in names]
+        return [getattr(row, name) for name in names]
+
+    @staticmethod
+    def _after(model, ordering, values):
+        """
+        Q matching rows after values in ordering.
+
+        PostgreSQL sorts NULLs last ascending and first descending, so a
+        NULL sorts after every value ascending and before every value
+        descending.
+        """
+        conditions = []
+        equal = Q()
+        for (name, descending), value in zip(ordering, values, strict=True):
+            if value is None:
+                if descending:
+                    conditions.append(equal & Q(**{f'{name}__isnull': False}))
+                equal &= Q(**{f'{name}__isnull': True})
+                continue
+            after = Q(**{f"{name}__{'lt' if descending else 'gt'}": value})
+            if not descending and model._meta.get_field(name).null:
+                after |= Q(**{f'{name}__isnull': True})
+            conditions.append(equal & after)
+            equal &= Q(**{name: value})
+        return reduce(operator.or_, conditions, Q(pk__in=[]))
+
+    def _decode_cursor(self, cursor, model, ordering):
+        """(values, reverse) of a cursor parameter; (None, False) when absent."""
+        if not cursor:
+            return None, False
+        try:
+            data = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+            values, reverse = data['v'], bool(data.get('r'))
+            if not isinstance(values, list):
+                raise ValueError(cursor)
+            # A cursor of another arity raises ValueError instead of truncating
+            values = [
+                None if value is None else model._meta.get_field(name).to_python(value)
+                for (name, _), value in zip(ordering, values, strict=True)
+            ]
+        except (AttributeError, TypeError, ValueError, KeyError, binascii.Error, ValidationError) as exc:
+            raise NotFound(self.invalid_cursor_message) from exc
+        return values, reverse
+
+    def _cursor_link(self, cursor):
+        if cursor is None:
+            return None
+        values, reverse = cursor
+        data = {'v': [value if value is None or isinstance(value, (int, str)) else str(value) for value in values]}
+        if reverse:
+            data['r'] = 1
+        encoded = base64.urlsafe_b64encode(json.dumps(data, separators=(',', ':')).encode()).decode('ascii')
+        url = remove_query_param(self.request.build_absolute_uri(), self.page_query_param)
+        return replace_query_param(url, self.cursor_query_param, encoded)
+
 
 class ClientPageNumberPagination(GenericPageNumberPagination):
     page_size = 200
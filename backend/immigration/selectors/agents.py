@@ -6,10 +6,13 @@ Agents are not tenant-scoped, so all authenticated users can view all agents.
 """
 
 from django.db.models import QuerySet
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Sequence
 
 from immigration.models.agent import Agent
 
+# Forward relations read by AgentOutputSerializer (created_by_name, updated_by_name)
+AGENT_OUTPUT_RELATED = ('created_by', 'updated_by')
+
 
 def agent_list(*, user, filters: Optional[Dict[str, Any]] = None, include_deleted: bool = False) -> QuerySet[Agent]:
     """
@@ -30,10 +33,7 @@ def agent_list(*, user, filters: Optional[Dict[str, Any]] = None, include_delete
 
     # Start with base queryset
     base_manager = Agent.all_objects if include_deleted else Agent.objects
-    qs = base_manager.select_related(
-        'created_by',
-        'updated_by'
-    ).all()
+    qs = base_manager.select_related(*AGENT_OUTPUT_RELATED).all()
     
     # Apply filters
     
@@ -64,7 +64,14 @@ def agent_list(*, user, filters: Optional[Dict[str, Any]] = None, include_delete
     return qs.order_by('agent_name')
 
 
-def agent_get(*, agent_id: int, user, include_deleted: bool = False) -> Optional[Agent]:
+def agent_get(
+    *,
+    agent_id: int,
+    user,
+    include_deleted: bool = False,
+    fields: Optional[Sequence[str]] = None,
+    for_update: bool = False,
+) -> Agent:
     """
     Get a single agent by ID.
 
@@ -72,19 +79,26 @@ def agent_get(*, agent_id: int, user, include_deleted: bool = False) -> Optional
         agent_id: ID of the agent to retrieve
         user: Authenticated user making the request
         include_deleted: If True, include soft-deleted agents
+        fields: Optional columns to load (``.only()``) for callers that do not
+            serialize the agent; related objects are not joined
+        for_update: If True, lock the agent row (``SELECT ... FOR UPDATE``)
+            until the caller's transaction ends; requires an atomic block
 
     Returns:
-        Agent instance or None if not found
+        Agent instance
+
+    Raises:
+        Agent.DoesNotExist: If agent doesn't exist
     """
     base_manager = Agent.all_objects if include_deleted else Agent.objects
-    
-    try:
-        return base_manager.select_related(
-            'created_by',
-            'updated_by'
-        ).get(id=agent_id)
-    except Agent.DoesNotExist:
-        return None
+    if fields:
+        qs = base_manager.only(*fields)
+    else:
+        qs = base_manager.select_related(*AGENT_OUTPUT_RELATED)
+    if for_update:
+        # Lock the agent row only, not the joined users
+        qs = qs.select_for_update(of=('self',))
+    return qs.get(id=agent_id)
 
 
 def deleted_agents_list(*, user) -> QuerySet[Agent]:
@@ -98,6 +112,5 @@ def deleted_agents_list(*, user) -> QuerySet[Agent]:
         QuerySet of soft-deleted Agent objects
     """
     return Agent.all_objects.filter(deleted_at__isnull=False).select_related(
-        'created_by',
-        'updated_by'
+        *AGENT_OUTPUT_RELATED,
     ).order_by('-deleted_at')
@@ -5,7 +5,8 @@ This module implements the selector pattern for visa application queries,
 providing role-based data scoping and filtering.
 """
 
-from django.db.models import QuerySet, Q
+from django.db.models import CharField, Case, QuerySet, Q, Value, When
+from django.db.models.functions import Concat
 from typing import Optional, Dict, Any
 
 from immigration.models import VisaApplication
@@ -153,3 +154,30 @@ def visa_application_get(*, user, application_id: int) -> VisaApplication:
         raise VisaApplication.DoesNotExist(
             f"VisaApplication with id={application_id} does not exist"
         )
+
+
+def _full_name_expression(relation: str) -> Case:
+    """"first last" of a related person, NULL when the relation is unset."""
+    return Case(
+        When(
+            **{f'{relation}__isnull': False},
+            then=Concat(f'{relation}__first_name', Value(' '), f'{relation}__last_name'),
+        ),
+        default=None,
+        output_field=CharField(),
+    )
+
+
+def visa_application_annotate_names(qs: QuerySet[VisaApplication]) -> QuerySet[VisaApplication]:
+    """
+    Annotate each application with ``client_name_ann``, ``assigned_to_name_ann``
+    and ``created_by_name_ann``.
+
+    Same "first last" strings VisaApplicationOutputSerializer would build in
+    Python, computed in SQL so list serialization skips the related objects.
+    """
+    return qs.annotate(
+        client_name_ann=_full_name_expression('client'),
+        assigned_to_name_ann=_full_name_expression('assigned_to'),
+        created_by_name_ann=_full_name_expression('created_by'),
+    )
@@ -7,11 +7,14 @@ providing role-based data scoping and filtering.
 Multi-tenant: Schema isolation provides automatic tenant scoping.
 """
 
-from django.db.models import QuerySet
-from typing import Optional, Dict, Any
+from django.db.models import Q, QuerySet
+from typing import Optional, Dict, Any, Sequence
 
 from immigration.models.branch import Branch
 
+# Forward relations read by BranchOutputSerializer (region_name, created_by_name, updated_by_name)
+BRANCH_OUTPUT_RELATED = ('region', 'created_by', 'updated_by')
+
 
 def branch_list(*, user, filters: Optional[Dict[str, Any]] = None, include_deleted: bool = False) -> QuerySet[Branch]:
     """
@@ -39,11 +42,7 @@ def branch_list(*, user, filters: Optional[Dict[str, Any]] = None, include_delet
     # Start with base queryset with optimized joins
     base_manager = Branch.all_objects if include_deleted else Branch.objects
 
-    qs = base_manager.select_related(
-        'region',
-        'created_by',
-        'updated_by'
-    ).all()
+    qs = base_manager.select_related(*BRANCH_OUTPUT_RELATED).all()
     
     # Group-based scoping
     # Multi-tenant: Schema provides automatic tenant isolation, no need to filter by tenant FK
@@ -101,7 +100,14 @@ def branch_list(*, user, filters: Optional[Dict[str, Any]] = None, include_delet
     return qs.order_by('name')
 
 
-def branch_get(*, branch_id: int, user, include_deleted: bool = False) -> Optional[Branch]:
+def branch_get(
+    *,
+    branch_id: int,
+    user,
+    include_deleted: bool = False,
+    fields: Optional[Sequence[str]] = None,
+    for_update: bool = False,
+) -> Branch:
     """
     Get a single branch by ID with scope validation.
 
@@ -111,32 +117,57 @@ def branch_get(*, branch_id: int, user, include_deleted: bool = False) -> Option
         branch_id: ID of the branch to retrieve
         user: Authenticated user making the request
         include_deleted: If True, include soft-deleted branches
+        fields: Optional columns to load (``.only()``) for callers that do not
+            serialize the branch; related objects are not joined. The scope
+            check reads ``region``, so include it for region managers.
+        for_update: If True, lock the branch row (``SELECT ... FOR UPDATE``)
+            until the caller's transaction ends; requires an atomic block
 
     Returns:
-        Branch instance or None if not found or user lacks access
+        Branch instance
+
+    Raises:
+        Branch.DoesNotExist: If branch doesn't exist or user lacks access
     """
     base_manager = Branch.all_objects if include_deleted else Branch.objects
-    
-    try:
-        branch = base_manager.select_related(
-            'region',
-            'created_by',
-            'updated_by'
-        ).get(id=branch_id)
-        
-        # Check if user has access to this branch based on their role
-        if user.is_in_group('CONSULTANT') or user.is_in_group('BRANCH_ADMIN'):
-            user_branches = user.branches.all()
-            if not user_branches.filter(id=branch_id).exists():
-                return None
-        elif user.is_in_group('REGION_MANAGER'):
-            user_regions = user.regions.all()
-            if branch.region and not user_regions.filter(id=branch.region.id).exists():
-                return None
-        
-        # SUPER_ADMIN and SUPER_SUPER_ADMIN have access to all branches in their scope
-        
-        return branch
-    except Branch.DoesNotExist:
-        return None
+    if fields:
+        qs = base_manager.only(*fields)
+    else:
+        qs = base_manager.select_related(*BRANCH_OUTPUT_RELATED)
+    if for_update:
+        # Lock the branch row only, not the joined region/users
+        qs = qs.select_for_update(of=('self',))
+    branch = qs.get(id=branch_id)
+
+    # Check if user has access to this branch based on their role
+    if user.is_in_group('CONSULTANT') or user.is_in_group('BRANCH_ADMIN'):
+        if not user.branches.filter(id=branch_id).exists():
+            raise Branch.DoesNotExist(f"Branch with id={branch_id} does not exist")
+    elif user.is_in_group('REGION_MANAGER'):
+        if branch.region_id and not user.regions.filter(id=branch.region_id).exists():
+            raise Branch.DoesNotExist(f"Branch with id={branch_id} does not exist")
 
+    # SUPER_ADMIN and SUPER_SUPER_ADMIN have access to all branches in their scope
+
+    return branch
+
+
+def branch_access_filter(qs: QuerySet[Branch], *, user) -> QuerySet[Branch]:
+    """
+    Restrict qs to branches the user may access, with branch_get()'s rules.
+
+    For single-statement writes (e.g. soft delete) that cannot run
+    branch_get()'s checks on a fetched instance.
+
+    Args:
+        qs: Branch queryset to restrict
+        user: Authenticated user making the request
+
+    Returns:
+        QuerySet of the branches in qs the user may access
+    """
+    if user.is_in_group('CONSULTANT') or user.is_in_group('BRANCH_ADMIN'):
+        return qs.filter(id__in=user.branches.values('id'))
+    if user.is_in_group('REGION_MANAGER'):
+        return qs.filter(Q(region__isnull=True) | Q(region__in=user.regions.values('id')))
+    return qs
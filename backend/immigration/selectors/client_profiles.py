@@ -14,42 +14,42 @@ from immigration.models import (
     Employment,
 )
 from immigration.selectors.clients import client_get
-from immigration.constants import (
-    GROUP_CONSULTANT,
-    GROUP_BRANCH_ADMIN,
-    GROUP_REGION_MANAGER,
-    GROUP_SUPER_ADMIN,
-)
+from immigration.selectors.scope import SCOPE_BRANCHES, client_scope
+
+# Forward relations read by ProficiencyOutputSerializer (test_name_display).
+# The qualification, passport and employment output serializers only read
+# client_id, so their lists join nothing.
+PROFICIENCY_OUTPUT_RELATED = ("test_name",)
+
+
+def _client_scope(user) -> Optional[Dict[str, Any]]:
+    """
+    Filter kwargs limiting records to the clients user may see.
+
+    Returns {} for tenant-wide access and None when user sees no clients.
+    """
+    scope = client_scope(user)
+    if scope is None:
+        # SUPER_ADMIN sees all in current tenant schema (automatic)
+        return {}
+    kind, ids = scope
+    if not ids:
+        return None
+    if kind == SCOPE_BRANCHES:
+        # Clients in the same branches
+        return {"client__assigned_to__branches__in": ids}
+    # Clients in the same regions
+    return {"client__assigned_to__regions__in": ids}
 
 
 def _scope_by_user(qs: QuerySet, user) -> QuerySet:
     """
     Apply branch/region/tenant scoping using the client relationship.
     """
-    if user.is_in_group(GROUP_CONSULTANT) or user.is_in_group(GROUP_BRANCH_ADMIN):
-        # Filter to clients in the same branches
-        user_branches = user.branches.all()
-        if user_branches.exists():
-            return qs.filter(client__assigned_to__branches__in=user_branches)
-        return qs.none()
-
-    if user.is_in_group(GROUP_REGION_MANAGER):
-        # Filter to clients in the same regions
-        user_regions = user.regions.all()
-        if user_regions.exists():
-            return qs.filter(client__assigned_to__regions__in=user_regions)
+    scope = _client_scope(user)
+    if scope is None:
         return qs.none()
-
-    # REMOVED: SUPER_ADMIN tenant filtering (schema provides isolation)
-    # if user.is_in_group(GROUP_SUPER_ADMIN):
-    #     if user.tenant:
-    #         return qs.filter(client__assigned_to__tenant=user.tenant)
-    #     return qs.none()
-    
-    # SUPER_ADMIN sees all in current tenant schema (automatic)
-
-    # SUPER_SUPER_ADMIN sees everything (no additional filter)
-    return qs
+    return qs.filter(**scope) if scope else qs
 
 
 def language_exam_list(*, filters: Optional[Dict[str, Any]] = None) -> QuerySet[LPE]:
@@ -65,12 +65,21 @@ def language_exam_list(*, filters: Optional[Dict[str, Any]] = None) -> QuerySet[
     return qs
 
 
+def language_exam_get(*, exam_id: int) -> LPE:
+    """
+    Retrieve a single language proficiency exam.
+
+    Exams are tenant-wide master data, so there is no user scoping.
+    """
+    return LPE.objects.get(id=exam_id)
+
+
 def proficiency_list(*, user, filters: Optional[Dict[str, Any]] = None) -> QuerySet[Proficiency]:
     """
     List proficiencies scoped to the requesting user's visibility.
     """
     filters = filters or {}
-    qs = Proficiency.objects.select_related("client__branch", "test_name")
+    qs = Proficiency.objects.select_related(*PROFICIENCY_OUTPUT_RELATED)
     qs = _scope_by_user(qs, user)
 
     if client_id := filters.get("client_id"):
@@ -104,7 +113,7 @@ def qualification_list(*, user, filters: Optional[Dict[str, Any]] = None) -> Que
     List qualifications scoped to the requesting user's visibility.
     """
     filters = filters or {}
-    qs = Qualification.objects.select_related("client__branch")
+    qs = Qualification.objects.all()
     qs = _scope_by_user(qs, user)
 
     if client_id := filters.get("client_id"):
@@ -131,7 +140,7 @@ def passport_list(*, user, filters: Optional[Dict[str, Any]] = None) -> QuerySet
     List passports scoped by client visibility.
     """
     filters = filters or {}
-    qs = Passport.objects.select_related("client__branch")
+    qs = Passport.objects.all()
     qs = _scope_by_user(qs, user)
 
     if client_id := filters.get("client_id"):
@@ -158,7 +167,7 @@ def employment_list(*, user, filters: Optional[Dict[str, Any]] = None) -> QueryS
     List employment records scoped by client visibility.
     """
     filters = filters or {}
-    qs = Employment.objects.select_related("client__branch")
+    qs = Employment.objects.all()
     qs = _scope_by_user(qs, user)
 
     if client_id := filters.get("client_id"):
@@ -5,16 +5,67 @@ This module implements the selector pattern for client queries,
 providing role-based data scoping and filtering.
 """
 
-from django.db.models import QuerySet
+from django.db.models import Count, Exists, OuterRef, Q, QuerySet
 from typing import Optional, Dict, Any
 
 from immigration.models import Client
-from immigration.constants import (
-    GROUP_CONSULTANT,
-    GROUP_BRANCH_ADMIN,
-    GROUP_REGION_MANAGER,
-    GROUP_SUPER_ADMIN,
-)
+from immigration.selectors.scope import SCOPE_BRANCHES, client_scope
+
+# Stages counted by client_stage_counts(), in response order
+_STAGES = ('LEAD', 'FOLLOW_UP', 'CLIENT', 'CLOSE')
+
+# client_stage_counts() aggregates, built once: one count per stage, and
+# TOTAL over those stages (clients without a stage are in neither)
+_STAGE_COUNTS = {
+    **{stage: Count('id', filter=Q(stage=stage)) for stage in _STAGES},
+    'TOTAL': Count('id', filter=Q(stage__in=_STAGES)),
+}
+
+
+def _client_queryset(include_deleted: bool = False) -> QuerySet[Client]:
+    """
+    Clients with the relations ClientOutputSerializer reads joined in.
+    """
+    base_manager = Client.all_objects if include_deleted else Client.objects
+    return base_manager.select_related(
+        'visa_category',
+        'agent',
+        'assigned_to',
+        'branch',
+        'created_by',
+    )
+
+
+def _client_scope(user) -> Optional[Dict[str, Any]]:
+    """
+    Filter kwargs limiting clients to those user may see.
+
+    Returns {} for tenant-wide access and None when user sees no clients.
+    """
+    scope = client_scope(user)
+    if scope is None:
+        # SUPER_ADMIN sees all clients in current tenant schema
+        return {}
+    kind, ids = scope
+    if not ids:
+        # Users without branches (or regions) see no clients
+        return None
+    if kind == SCOPE_BRANCHES:
+        # Clients in the same branches as the user
+        return {'branch_id__in': ids}
+    # Clients in branches within the user's regions
+    from immigration.models import Branch
+    return {'branch_id__in': Branch.objects.filter(region_id__in=ids).values('id')}
+
+
+def _scope_by_user(qs: QuerySet, user) -> QuerySet:
+    """
+    Limit a client queryset to the clients user may see.
+    """
+    scope = _client_scope(user)
+    if scope is None:
+        return qs.none()
+    return qs.filter(**scope) if scope else qs
 
 
 def client_list(*, user, filters: Optional[Dict[str, Any]] = None, include_deleted: bool = False) -> QuerySet[Client]:
@@ -41,49 +92,14 @@ def client_list(*, user, filters: Optional[Dict[str, Any]] = None, include_delet
     filters = filters or {}
 
     # Start with base queryset with optimized joins
-    base_manager = Client.all_objects if include_deleted else Client.objects
+    qs = _client_queryset(include_deleted=include_deleted)
+
+    qs = _scope_by_user(qs, user)
 
-    qs = base_manager.select_related(
-        'visa_category',
-        'agent',
-        'assigned_to',
-        'created_by',
-        'updated_by'
-    ).all()
-    
-    # Group-based scoping
-    # Multi-tenant: Schema provides automatic tenant isolation, no need to filter by tenant FK
-
-    if user.is_in_group(GROUP_CONSULTANT) or user.is_in_group(GROUP_BRANCH_ADMIN):
-        # Filter to clients in the same branches as the user
-        user_branches = user.branches.all()
-        if user_branches.exists():
-            qs = qs.filter(branch__in=user_branches)
-        else:
-            # If user has no branches assigned, they see no clients
-            qs = qs.none()
-
-    elif user.is_in_group(GROUP_REGION_MANAGER):
-        # Filter to clients in branches within the user's regions
-        user_regions = user.regions.all()
-        if user_regions.exists():
-            from immigration.models import Branch
-            branch_ids = Branch.objects.filter(region__in=user_regions).values_list('id', flat=True)
-            qs = qs.filter(branch_id__in=branch_ids)
-        else:
-            # If user has no regions assigned, they see no clients
-            qs = qs.none()
-
-    elif user.is_in_group(GROUP_SUPER_ADMIN):
-        # SUPER_ADMIN sees all clients in current tenant schema
-        # Schema isolation provides automatic tenant scoping
-        pass
-    
     # Apply additional filters
     
     # General search across name, email, and phone_number
     if 'search' in filters and filters['search']:
-        from django.db.models import Q
         search_term = filters['search']
         qs = qs.filter(
             Q(first_name__icontains=search_term) |
@@ -113,13 +129,15 @@ def client_list(*, user, filters: Optional[Dict[str, Any]] = None, include_delet
     return qs
 
 
-def client_get(*, user, client_id: int) -> Client:
+def client_get(*, user, client_id: int, for_update: bool = False) -> Client:
     """
     Get a specific client with scope validation.
     
     Args:
         user: Authenticated user making the request
         client_id: ID of the client to retrieve
+        for_update: If True, lock the client row (``SELECT ... FOR UPDATE``)
+            until the caller's transaction ends; requires an atomic block
     
     Returns:
         Client instance if user has access
@@ -128,20 +146,40 @@ def client_get(*, user, client_id: int) -> Client:
         Client.DoesNotExist: If client doesn't exist or user lacks access
         PermissionError: If user doesn't have permission to access this client
     """
-    # Use client_list to get scoped queryset, then filter by ID
-    qs = client_list(user=user)
-    
+    # One query answers both "does it exist" and "is it in the user's scope":
+    # the scoped client_list() queryset becomes an EXISTS annotation
+    in_scope = client_list(user=user).filter(pk=OuterRef('pk'))
+    qs = _client_queryset().annotate(in_scope=Exists(in_scope))
+    if for_update:
+        # Lock the client row only, not the joined rows
+        qs = qs.select_for_update(of=('self',))
+
     try:
         client = qs.get(id=client_id)
-        return client
     except Client.DoesNotExist:
-        # Check if client exists at all
-        if Client.objects.filter(id=client_id).exists():
-            raise PermissionError(
-                f"User {user.username} does not have permission to access client {client_id}"
-            )
         raise Client.DoesNotExist(f"Client with id={client_id} does not exist")
 
+    if not client.in_scope:
+        raise PermissionError(
+            f"User {user.username} does not have permission to access client {client_id}"
+        )
+    return client
+
+
+def client_stage_counts(*, user) -> Dict[str, int]:
+    """
+    Count the clients user can access, per stage.
+
+    Args:
+        user: Authenticated user making the request
+
+    Returns:
+        Dict with a count for every stage (0 when a stage has no clients)
+        and TOTAL, the sum of the stage counts
+    """
+    # One row of conditional counts; no joins or ordering, unlike client_list()
+    return _scope_by_user(Client.objects.all(), user).order_by().aggregate(**_STAGE_COUNTS)
+
 
 def deleted_clients_list(*, user, filters: Optional[Dict[str, Any]] = None) -> QuerySet[Client]:
     """
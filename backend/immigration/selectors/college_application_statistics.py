@@ -6,12 +6,11 @@ This module provides statistics and aggregations for:
 - Tracker stage counts (for tab badges)
 """
 
-from django.db.models import Count, Q, Max, Subquery, OuterRef, F
+from django.db.models import Count, Q, F
 from django.utils import timezone
 from datetime import timedelta
 from typing import Dict, Any, Optional
 
-from immigration.models import CollegeApplication, Stage
 from immigration.selectors.college_applications import college_application_list
 
 
@@ -49,7 +48,7 @@ def college_application_stage_counts(
     if application_type_id:
         qs = qs.filter(application_type_id=application_type_id)
 
-    # Count by stage
+    # Count by stage; the total is their sum
     stage_counts = qs.values(
         'stage__id',
         'stage__stage_name',
@@ -58,17 +57,18 @@ def college_application_stage_counts(
         count=Count('id')
     ).order_by('stage__position')
 
+    by_stage = [
+        {
+            'stage_id': item['stage__id'],
+            'stage_name': item['stage__stage_name'],
+            'position': item['stage__position'],
+            'count': item['count']
+        }
+        for item in stage_counts
+    ]
     result = {
-        'total': qs.count(),
-        'by_stage': [
-            {
-                'stage_id': item['stage__id'],
-                'stage_name': item['stage__stage_name'],
-                'position': item['stage__position'],
-                'count': item['count']
-            }
-            for item in stage_counts
-        ]
+        'total': sum(item['count'] for item in by_stage),
+        'by_stage': by_stage,
     }
 
     return result
@@ -127,38 +127,33 @@ def college_application_dashboard_statistics(
     # ==============================================================================
     # CRITICAL: Filter for FINAL STAGE applications only (for dashboard counting)
     # ==============================================================================
-    # Get max position per application_type using subquery
+    # college_application_list() annotates the max stage position of each
+    # application's type as final_stage_position
     # Note: Stage model uses hard delete (no deleted_at field)
-    max_position_subquery = Stage.objects.filter(
-        application_type_id=OuterRef('application_type_id')
-    ).values('application_type').annotate(
-        max_pos=Max('position')
-    ).values('max_pos')[:1]
-
-    # Filter applications where stage.position = max position for their application_type
-    final_stage_applications = qs.annotate(
-        max_stage_position=Subquery(max_position_subquery)
-    ).filter(
-        stage__position=F('max_stage_position')
-    )
+    final_stage = Q(stage__position=F('final_stage_position'))
 
     # ==============================================================================
     # Apply time filter to intake date (start_date.intake_date)
     # ==============================================================================
     if time_filter == 'today':
-        final_stage_applications = final_stage_applications.filter(
-            start_date__intake_date__gte=today_start.date()
-        )
+        final_stage &= Q(start_date__intake_date__gte=today_start.date())
     elif time_filter == 'this_week':
-        final_stage_applications = final_stage_applications.filter(
-            start_date__intake_date__gte=week_start.date()
-        )
+        final_stage &= Q(start_date__intake_date__gte=week_start.date())
     elif time_filter == 'this_month':
-        final_stage_applications = final_stage_applications.filter(
-            start_date__intake_date__gte=month_start.date()
-        )
+        final_stage &= Q(start_date__intake_date__gte=month_start.date())
     # 'all' = no time filter
 
+    final_stage_applications = qs.filter(final_stage)
+
+    # ==============================================================================
+    # Totals, counted in one query
+    # ==============================================================================
+    totals = qs.aggregate(
+        total_applications=Count('id'),
+        final_stage_count=Count('id', filter=final_stage),
+        pending_assignments=Count('id', filter=Q(assigned_to__isnull=True)),
+    )
+
     # ==============================================================================
     # Breakdown by intake date (top 10 upcoming intakes)
     # ==============================================================================
@@ -208,12 +203,12 @@ def college_application_dashboard_statistics(
     # Compile statistics
     # ==============================================================================
     return {
-        'total_applications': qs.count(),
-        'final_stage_count': final_stage_applications.count(),
+        'total_applications': totals['total_applications'],
+        'final_stage_count': totals['final_stage_count'],
         'time_filter': time_filter,
         'intake_breakdown': intake_breakdown,
         'application_type_breakdown': application_type_breakdown,
         'institute_breakdown': institute_breakdown,
         'recent_applications': recent_applications,
-        'pending_assignments': qs.filter(assigned_to__isnull=True).count()
+        'pending_assignments': totals['pending_assignments']
     }
@@ -8,7 +8,8 @@ providing role-based data scoping and filtering for:
 - CollegeApplication
 """
 
-from django.db.models import QuerySet
+from django.db.models import Count, Exists, Max, OuterRef, QuerySet, Subquery
+from django.db.models.functions import Coalesce
 from typing import Optional, Dict, Any
 
 from immigration.models import ApplicationType, Stage, CollegeApplication, Branch
@@ -20,6 +21,23 @@ from immigration.constants import (
 )
 
 
+def _final_stage_position(application_type_ref: str) -> Subquery:
+    """
+    Highest stage position of an application type, as a subquery.
+
+    application_type_ref names the outer query's field holding the
+    application type id. Lets list endpoints answer is_final_stage without
+    one MAX() query per row.
+    """
+    return Subquery(
+        Stage.objects.filter(
+            application_type_id=OuterRef(application_type_ref)
+        ).values('application_type').annotate(
+            max_position=Max('position')
+        ).values('max_position')[:1]
+    )
+
+
 # ============================================================================
 # APPLICATION TYPE SELECTORS
 # ============================================================================
@@ -44,7 +62,17 @@ def application_type_list(
     """
     filters = filters or {}
 
-    qs = ApplicationType.objects.all()
+    # stages_count/has_applications, read in the same query as subqueries
+    # (rather than a join) so the paginator's COUNT(*) does not aggregate
+    stages_count = Stage.objects.filter(
+        application_type=OuterRef('pk')
+    ).values('application_type').annotate(count=Count('id')).values('count')
+    qs = ApplicationType.objects.select_related('created_by').annotate(
+        annotated_stages_count=Coalesce(Subquery(stages_count), 0),
+        annotated_has_applications=Exists(
+            CollegeApplication.objects.filter(application_type=OuterRef('pk'), deleted_at__isnull=True)
+        ),
+    )
 
     # Apply filters
     if 'is_active' in filters and filters['is_active'] is not None:
@@ -99,7 +127,9 @@ def stage_list(
     """
     filters = filters or {}
 
-    qs = Stage.objects.select_related('application_type').all()
+    qs = Stage.objects.select_related('application_type').annotate(
+        final_stage_position=_final_stage_position('application_type_id'),
+    )
 
     # Filter by application_type
     if 'application_type_id' in filters and filters['application_type_id']:
@@ -172,7 +202,9 @@ def college_application_list(
         'assigned_to',
         'created_by',
         'updated_by'
-    ).filter(client__deleted_at__isnull=True).all()
+    ).annotate(
+        final_stage_position=_final_stage_position('application_type_id'),
+    ).filter(client__deleted_at__isnull=True)
 
     # Role-based scoping (same logic as visa applications)
     if user.is_in_group(GROUP_CONSULTANT) or user.is_in_group(GROUP_BRANCH_ADMIN):
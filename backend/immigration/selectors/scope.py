@@ -0,0 +1,48 @@
+"""
+Per-request role scoping shared by the client selectors.
+"""
+
+from typing import List, Optional, Tuple
+
+from immigration.constants import (
+    GROUP_CONSULTANT,
+    GROUP_BRANCH_ADMIN,
+    GROUP_REGION_MANAGER,
+)
+
+# client_scope() kinds
+SCOPE_BRANCHES = 'branches'
+SCOPE_REGIONS = 'regions'
+
+# Marks a user whose client scope has not been read yet
+_MISSING = object()
+
+
+def client_scope(user) -> Optional[Tuple[str, List[int]]]:
+    """
+    The branches or regions limiting which clients user may see.
+
+    Returns (SCOPE_BRANCHES, branch_ids) for consultants and branch admins,
+    (SCOPE_REGIONS, region_ids) for region managers and None for tenant-wide
+    access; empty id lists mean user sees no clients. Each selector module
+    turns it into filters on its own relations.
+
+    Users are loaded per request, so the scope is read once per request and
+    kept on the user: every client and client record selector call of the
+    request shares it.
+    """
+    scope = getattr(user, '_client_scope', _MISSING)
+    if scope is not _MISSING:
+        return scope
+
+    # Multi-tenant: Schema provides automatic tenant isolation, no need to filter by tenant FK
+    groups = user.group_names
+    if GROUP_CONSULTANT in groups or GROUP_BRANCH_ADMIN in groups:
+        scope = (SCOPE_BRANCHES, list(user.branches.values_list('id', flat=True)))
+    elif GROUP_REGION_MANAGER in groups:
+        scope = (SCOPE_REGIONS, list(user.regions.values_list('id', flat=True)))
+    else:
+        # SUPER_ADMIN sees all clients in current tenant schema
+        scope = None
+    user._client_scope = scope
+    return scope
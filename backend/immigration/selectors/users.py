@@ -5,7 +5,7 @@ No role-based filtering - uses Groups and Permissions.
 """
 
 from typing import Optional
-from django.db.models import QuerySet, Q
+from django.db.models import OuterRef, QuerySet, Q, Subquery
 from immigration.models.user import User
 from immigration.constants import (
     GROUP_CONSULTANT,
@@ -98,3 +98,16 @@ def user_get(*, user_id: int, requesting_user: User) -> Optional[User]:
         return user_list(user=requesting_user).get(id=user_id)
     except User.DoesNotExist:
         return None
+
+
+def user_annotate_primary_group(qs: QuerySet[User]) -> QuerySet[User]:
+    """
+    Annotate each user with ``primary_group_name``.
+
+    Same group as User.get_primary_group() (lowest group id), computed in SQL
+    so list serializers need no per-user query.
+    """
+    memberships = User.groups.through.objects.filter(
+        user_id=OuterRef('pk')
+    ).order_by('group_id').values('group__name')[:1]
+    return qs.annotate(primary_group_name=Subquery(memberships))
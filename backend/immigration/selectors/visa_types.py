@@ -4,7 +4,7 @@ Visa type selectors for read operations.
 This module implements the selector pattern for visa type queries.
 """
 
-from django.db.models import QuerySet
+from django.db.models import Count, Max, QuerySet
 from typing import Optional, Dict, Any
 
 from immigration.models.visa import VisaType, VisaCategory
@@ -81,3 +81,24 @@ def visa_category_get(*, visa_category_id: int) -> VisaCategory:
         VisaCategory.DoesNotExist: If visa category doesn't exist
     """
     return VisaCategory.objects.get(id=visa_category_id)
+
+
+def visa_reference_data_version() -> str:
+    """
+    Fingerprint of the visa category and visa type tables.
+
+    Changes whenever a row is created, updated or deleted (count and latest
+    updated_at of both tables), so it can back ETags on the read endpoints.
+    Visa type responses embed their category, hence both tables.
+    """
+    # One query: every visa type belongs to a category, so the join reaches all rows
+    stats = VisaCategory.objects.aggregate(
+        categories=Count('id', distinct=True),
+        categories_updated=Max('updated_at'),
+        types=Count('visa_types'),
+        types_updated=Max('visa_types__updated_at'),
+    )
+    return ':'.join(
+        value.isoformat() if hasattr(value, 'isoformat') else str(value)
+        for value in stats.values()
+    )
@@ -6,6 +6,7 @@ providing validation, scope checking, and transactional integrity.
 """
 
 from django.db import transaction
+from django.utils import timezone
 from pydantic import BaseModel, EmailStr, Field
 from typing import Optional
 
@@ -187,8 +188,12 @@ def agent_update(*, agent: Agent, data: AgentUpdateInput, user) -> Agent:
     # Set updated_by
     agent.updated_by = user
 
-    # Validate and save
-    agent.full_clean()
+    # Validate the written columns and save. updated_by is the authenticated
+    # user, so its existence query is skipped.
+    agent.full_clean(exclude=[
+        field.name for field in Agent._meta.concrete_fields
+        if field.name not in update_fields or field.name == 'updated_by'
+    ])
     agent.save(update_fields=update_fields)
 
     return agent
@@ -206,6 +211,24 @@ def agent_delete(*, agent: Agent, user) -> None:
     agent.delete()  # Soft delete sets deleted_at field
 
 
+def agent_delete_by_id(*, agent_id: int, user) -> bool:
+    """
+    Soft delete a live agent by ID in a single UPDATE.
+
+    Writes the same columns as agent_delete() (deleted_at and updated_at)
+    without fetching the agent first.
+
+    Args:
+        agent_id: ID of the agent to delete
+        user: Authenticated user performing the deletion
+
+    Returns:
+        True if the agent was deleted, False if no live agent has that ID
+    """
+    now = timezone.now()
+    return Agent.objects.filter(id=agent_id).update(deleted_at=now, updated_at=now) > 0
+
+
 @transaction.atomic
 def agent_restore(*, agent: Agent, user) -> Agent:
     """
@@ -228,4 +251,24 @@ def agent_restore(*, agent: Agent, user) -> Agent:
     agent.updated_by = user
     agent.save(update_fields=['deleted_at', 'updated_by'])
 
-    return agent
\ No newline at end of file
+    return agent
+
+
+def agent_restore_by_id(*, agent_id: int, user) -> bool:
+    """
+    Restore a soft-deleted agent by ID in a single UPDATE.
+
+    Writes the same columns as agent_restore() (deleted_at and updated_by)
+    without fetching the agent first. The deleted_at IS NOT NULL condition
+    makes concurrent restores of the same agent succeed only once.
+
+    Args:
+        agent_id: ID of the agent to restore
+        user: Authenticated user performing the restoration
+
+    Returns:
+        True if the agent was restored, False if no soft-deleted agent has
+        that ID
+    """
+    agents = Agent.all_objects.filter(id=agent_id, deleted_at__isnull=False)
+    return agents.update(deleted_at=None, updated_by=user) > 0
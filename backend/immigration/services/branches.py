@@ -8,10 +8,12 @@ Multi-tenant: Schema isolation provides automatic tenant scoping.
 """
 
 from django.db import transaction
+from django.utils import timezone
 from pydantic import BaseModel, Field
 from typing import Optional
 
 from immigration.models.branch import Branch
+from immigration.selectors.branches import branch_access_filter
 
 
 class BranchCreateInput(BaseModel):
@@ -191,8 +193,16 @@ def branch_update(*, branch: Branch, data: BranchUpdateInput, user) -> Branch:
     # Set updated_by
     branch.updated_by = user
 
-    # Validate and save
-    branch.full_clean()
+    # Validate the written columns and save. updated_by is the authenticated
+    # user and region was fetched above, so their existence queries are
+    # skipped; name uniqueness was already checked above if it changed.
+    branch.full_clean(
+        exclude=[
+            field.name for field in Branch._meta.concrete_fields
+            if field.name not in update_fields or field.name in ('updated_by', 'region')
+        ],
+        validate_unique=False,
+    )
     branch.save(update_fields=update_fields)
 
     return branch
@@ -217,6 +227,27 @@ def branch_delete(*, branch: Branch, user) -> None:
     branch.delete()  # Soft delete sets deleted_at field
 
 
+def branch_delete_by_id(*, branch_id: int, user) -> bool:
+    """
+    Soft delete a live branch by ID in a single UPDATE.
+
+    Writes the same columns as branch_delete() (deleted_at and updated_at)
+    without fetching the branch first. Branches outside the user's scope
+    (see branch_get()) are left untouched.
+
+    Args:
+        branch_id: ID of the branch to delete
+        user: Authenticated user performing the deletion
+
+    Returns:
+        True if the branch was deleted, False if no live branch in the
+        user's scope has that ID
+    """
+    now = timezone.now()
+    branches = branch_access_filter(Branch.objects.filter(id=branch_id), user=user)
+    return branches.update(deleted_at=now, updated_at=now) > 0
+
+
 @transaction.atomic
 def branch_restore(*, branch: Branch, user) -> Branch:
     """
@@ -244,4 +275,26 @@ def branch_restore(*, branch: Branch, user) -> Branch:
     branch.updated_by = user
     branch.save(update_fields=['deleted_at', 'updated_by'])
 
-    return branch
\ No newline at end of file
+    return branch
+
+
+def branch_restore_by_id(*, branch_id: int, user) -> bool:
+    """
+    Restore a soft-deleted branch by ID in a single UPDATE.
+
+    Writes the same columns as branch_restore() (deleted_at and updated_by)
+    without fetching the branch first. Branches outside the user's scope
+    (see branch_get()) are left untouched, and the deleted_at IS NOT NULL
+    condition makes concurrent restores of the same branch succeed only once.
+
+    Args:
+        branch_id: ID of the branch to restore
+        user: Authenticated user performing the restoration
+
+    Returns:
+        True if the branch was restored, False if no soft-deleted branch in
+        the user's scope has that ID
+    """
+    branches = Branch.all_objects.filter(id=branch_id, deleted_at__isnull=False)
+    branches = branch_access_filter(branches, user=user)
+    return branches.update(deleted_at=None, updated_by=user) > 0
@@ -78,44 +78,64 @@ class QualificationInput(BaseModel):
         str_strip_whitespace = True
 
 
+def _save_update(instance, update_fields) -> None:
+    """
+    Validate and write the updated columns of an existing record.
+
+    Related rows are skipped by validation: the client and exam were resolved
+    by the caller and updated_by is the authenticated user, so their existence
+    queries would only repeat those lookups.
+    """
+    instance.full_clean(exclude=[
+        field.name for field in type(instance)._meta.concrete_fields
+        if field.name not in update_fields or field.is_relation
+    ])
+    instance.save(update_fields=update_fields)
+
+
 @transaction.atomic
 def passport_upsert(*, data: PassportInput, user) -> Passport:
     """
     Create or update a passport for a client within the user's scope.
+
+    Written with a single INSERT ... ON CONFLICT (client) DO UPDATE, which
+    keeps created_by/created_at of an existing passport.
     """
     client = client_get(user=user, client_id=data.client_id)
-    defaults = {
-        "passport_no": data.passport_no,
-        "passport_country": data.passport_country,
-        "date_of_issue": data.date_of_issue,
-        "date_of_expiry": data.date_of_expiry,
-        "place_of_issue": data.place_of_issue or "",
-        "country_of_birth": data.country_of_birth,
-        "nationality": data.nationality,
-        "created_by": user,
-        "updated_by": user,
-    }
-
-    passport, created = Passport.objects.select_for_update().get_or_create(
+    passport = Passport(
         client=client,
-        defaults=defaults,
+        passport_no=data.passport_no,
+        passport_country=data.passport_country,
+        date_of_issue=data.date_of_issue,
+        date_of_expiry=data.date_of_expiry,
+        place_of_issue=data.place_of_issue or "",
+        country_of_birth=data.country_of_birth,
+        nationality=data.nationality,
+        created_by=user,
+        updated_by=user,
     )
-
-    if not created:
-        # Update fields when record already exists
-        passport.passport_no = data.passport_no
-        passport.passport_country = data.passport_country
-        passport.date_of_issue = data.date_of_issue
-        passport.date_of_expiry = data.date_of_expiry
-        passport.place_of_issue = data.place_of_issue or ""
-        passport.country_of_birth = data.country_of_birth
-        passport.nationality = data.nationality
-        passport.updated_by = user
-
-    passport.full_clean()
-    passport.save()
-
-    return passport
+    # client was resolved above and the users are the authenticated user;
+    # a second passport for the client is the conflict the upsert resolves
+    passport.full_clean(exclude=["client", "created_by", "updated_by"], validate_unique=False)
+
+    Passport.objects.bulk_create(
+        [passport],
+        update_conflicts=True,
+        unique_fields=["client"],
+        update_fields=[
+            "passport_no",
+            "passport_country",
+            "date_of_issue",
+            "date_of_expiry",
+            "place_of_issue",
+            "country_of_birth",
+            "nationality",
+            "updated_by",
+            "updated_at",
+        ],
+    )
+    # Read back the stored row (created_at of an updated passport)
+    return Passport.objects.get(pk=client.pk)
 
 
 @transaction.atomic
@@ -141,8 +161,7 @@ def lpe_update(*, exam: LPE, data: LPEInput, user) -> LPE:
     exam.name = data.name
     exam.validity_term = data.validity_term
     exam.description = data.description or ""
-    exam.full_clean()
-    exam.save()
+    _save_update(exam, ["name", "validity_term", "description", "updated_at"])
     return exam
 
 
@@ -204,8 +223,18 @@ def proficiency_update(*, proficiency: Proficiency, data: ProficiencyInput, user
     proficiency.test_date = data.test_date
     proficiency.updated_by = user
 
-    proficiency.full_clean()
-    proficiency.save()
+    _save_update(proficiency, [
+        "client",
+        "test_name",
+        "overall_score",
+        "speaking_score",
+        "reading_score",
+        "listening_score",
+        "writing_score",
+        "test_date",
+        "updated_by",
+        "updated_at",
+    ])
     return proficiency
 
 
@@ -255,8 +284,18 @@ def qualification_update(*, qualification: Qualification, data: QualificationInp
     qualification.country = data.country
     qualification.updated_by = user
 
-    qualification.full_clean()
-    qualification.save()
+    _save_update(qualification, [
+        "client",
+        "course",
+        "institute",
+        "degree",
+        "field_of_study",
+        "enroll_date",
+        "completion_date",
+        "country",
+        "updated_by",
+        "updated_at",
+    ])
     return qualification
 
 
@@ -314,8 +353,16 @@ def employment_update(*, employment: Employment, data: EmploymentInput, user) ->
     employment.country = data.country
     employment.updated_by = user
 
-    employment.full_clean()
-    employment.save()
+    _save_update(employment, [
+        "client",
+        "employer_name",
+        "position",
+        "start_date",
+        "end_date",
+        "country",
+        "updated_by",
+        "updated_at",
+    ])
     return employment
 
 
@@ -16,12 +16,20 @@ from immigration.models import CalendarEvent
 User = get_user_model()
 
 
+def _assigned_user(user_id: int) -> User:
+    """User an event is assigned to; raises User.DoesNotExist if missing."""
+    try:
+        return User.objects.get(id=user_id)
+    except User.DoesNotExist:
+        raise User.DoesNotExist(f'User with ID {user_id} not found') from None
+
+
 @transaction.atomic
 def event_create(
     title: str,
     start: timezone.datetime,
     end: timezone.datetime,
-    assigned_to: Optional[User] = None,
+    assigned_to_id: Optional[int] = None,
     hex_color: str = '#3788d8',
     description: str = '',
     location: str = '',
@@ -36,7 +44,7 @@ def event_create(
         title: Event title
         start: Event start date/time
         end: Event end date/time
-        assigned_to: User the event is assigned to (optional)
+        assigned_to_id: ID of the user the event is assigned to (optional)
         hex_color: Color for calendar display (hex format)
         description: Detailed event description
         location: Event location (physical or virtual)
@@ -49,6 +57,7 @@ def event_create(
 
     Raises:
         ValidationError: If validation fails (e.g., end before start)
+        User.DoesNotExist: If assigned_to_id matches no user
     """
     # Validate hex color format
     if hex_color and not hex_color.startswith('#'):
@@ -58,6 +67,8 @@ def event_create(
     if end <= start:
         raise ValidationError("Event end time must be after start time.")
 
+    assigned_to = _assigned_user(assigned_to_id) if assigned_to_id else None
+
     # Handle branch assignment
     branch_obj = None
     if branch_id:
@@ -91,7 +102,7 @@ def event_update(
     title: Optional[str] = None,
     start: Optional[timezone.datetime] = None,
     end: Optional[timezone.datetime] = None,
-    assigned_to: Optional[User] = None,
+    assigned_to_id: Optional[int] = None,
     hex_color: Optional[str] = None,
     description: Optional[str] = None,
     location: Optional[str] = None,
@@ -106,7 +117,7 @@ def event_update(
         title: New title (optional)
         start: New start date/time (optional)
         end: New end date/time (optional)
-        assigned_to: New assigned user (optional)
+        assigned_to_id: ID of the new assigned user (optional)
         hex_color: New color (optional)
         description: New description (optional)
         location: New location (optional)
@@ -118,6 +129,7 @@ def event_update(
 
     Raises:
         ValidationError: If validation fails
+        User.DoesNotExist: If assigned_to_id matches no user
     """
     update_fields = ['updated_by', 'updated_at']
 
@@ -133,8 +145,8 @@ def event_update(
         event.end = end
         update_fields.append('end')
 
-    if assigned_to is not None:
-        event.assigned_to = assigned_to
+    if assigned_to_id:
+        event.assigned_to = _assigned_user(assigned_to_id)
         update_fields.append('assigned_to')
 
     if hex_color is not None:
@@ -157,9 +169,7 @@ def event_update(
 
     event.updated_by = updated_by
 
-    # Validate before saving
-    event.full_clean()
-
+    # CalendarEvent.save() validates with full_clean() before writing
     event.save(update_fields=update_fields)
 
     return event
@@ -30,8 +30,9 @@ def timeline_list(
     Returns:
         QuerySet of ClientActivity records
     """
+    # Only the performer is rendered; the client is known by its id
     queryset = ClientActivity.objects.select_related(
-        'client', 'performed_by'
+        'performed_by'
     ).filter(client_id=client_id)
     
     # Filter by activity type if provided
@@ -154,6 +154,107 @@ def user_create(*, data: UserCreateInput, created_by: User) -> User:
     return user
 
 
+def _validate_bulk_ids(model, data: list, attr: str, label: str):
+    """Check every item's branch_ids/region_ids against one query for the whole batch."""
+    requested = {pk for item in data for pk in (getattr(item, attr) or ())}
+    if not requested:
+        return
+    existing = set(model.objects.filter(id__in=requested).values_list('id', flat=True))
+    for item in data:
+        ids = getattr(item, attr)
+        # Same rule as user_create: duplicates or unknown ids are invalid
+        if ids and len(existing.intersection(ids)) != len(ids):
+            raise ValueError(f"One or more {label} IDs are invalid")
+
+
+def _first_duplicate(values: list) -> Optional[str]:
+    """First value that appears more than once in values, if any."""
+    seen = set()
+    for value in values:
+        if value in seen:
+            return value
+        seen.add(value)
+    return None
+
+
+@transaction.atomic
+def user_bulk_create(*, data: list, created_by: User) -> list:
+    """
+    Create several users at once (batch onboarding).
+
+    Applies the same rules as user_create() to every item, but validates the
+    whole batch with one query per rule and writes users and their group,
+    branch and region memberships with bulk INSERTs. Nothing is created if
+    any item is invalid.
+
+    Args:
+        data: List of UserCreateInput
+        created_by: The user creating the new users
+
+    Returns:
+        List of created User instances, in input order
+
+    Raises:
+        PermissionError: If creator doesn't have permission
+        ValueError: If validation fails for any item
+    """
+    if not created_by.has_perm('immigration.add_user'):
+        raise PermissionError("You don't have permission to create users")
+
+    _validate_bulk_ids(Branch, data, 'branch_ids', 'branch')
+    _validate_bulk_ids(Region, data, 'region_ids', 'region')
+
+    usernames = [item.username for item in data]
+    emails = [item.email for item in data]
+    username = _first_duplicate(usernames) or User.objects.filter(
+        username__in=usernames
+    ).values_list('username', flat=True).first()
+    if username:
+        raise ValueError(f"Username '{username}' already exists")
+    email = _first_duplicate(emails) or User.objects.filter(
+        email__in=emails
+    ).values_list('email', flat=True).first()
+    if email:
+        raise ValueError(f"Email '{email}' already exists")
+
+    users = User.objects.bulk_create([
+        User(
+            username=item.username,
+            email=item.email,
+            password=make_password(item.password),
+            first_name=item.first_name,
+            last_name=item.last_name,
+            is_active=item.is_active,
+        )
+        for item in data
+    ])
+
+    group_names = {item.group_name for item in data}
+    groups = {group.name: group for group in Group.objects.filter(name__in=group_names)}
+    for name in group_names - groups.keys():
+        groups[name], _ = Group.objects.get_or_create(name=name)
+
+    GroupMembership = User.groups.through
+    UserBranch = User.branches.through
+    UserRegion = User.regions.through
+    GroupMembership.objects.bulk_create([
+        GroupMembership(user_id=user.id, group_id=groups[item.group_name].id)
+        for user, item in zip(users, data, strict=True)
+    ])
+    UserBranch.objects.bulk_create([
+        UserBranch(user_id=user.id, branch_id=branch_id)
+        for user, item in zip(users, data, strict=True)
+        for branch_id in item.branch_ids or ()
+    ])
+    UserRegion.objects.bulk_create([
+        UserRegion(user_id=user.id, region_id=region_id)
+        for user, item in zip(users, data, strict=True)
+        for region_id in item.region_ids or ()
+    ])
+
+    return users
+
+
 @transaction.atomic
 def user_update(*, user_id: int, data: UserUpdateInput, updated_by: User) -> User:
     """
@@ -30,6 +30,7 @@ env = environ.Env(
     DB_HOST=(str, "localhost"),
     DB_PORT=(str, "5432"),
     USE_HTTPS=(bool, False),  # Enable HTTPS redirects (default: False for HTTP-only)
+    REDIS_URL=(str, ""),  # Shared cache (required when DEBUG=False)
 )
 
 # Load .env file from project root
@@ -131,6 +132,7 @@ MIDDLEWARE = [
     "tenants.middleware.FourLevelSubdomainMiddleware",  # CUSTOM - 4-level subdomain support
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    "django.middleware.gzip.GZipMiddleware",  # Compress responses (JSON lists); adds Vary: Accept-Encoding
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
@@ -290,6 +292,10 @@ REST_FRAMEWORK = {
         # 'rest_framework.authentication.SessionAuthentication',
         "immigration.authentication.TenantJWTAuthentication",  # CHANGED: Tenant-bound JWT
     ],
+    "DEFAULT_RENDERER_CLASSES": [
+        "immigration.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
     "DEFAULT_FILTER_BACKENDS": ["django_filters.rest_framework.DjangoFilterBackend"],
     "DEFAULT_PAGINATION_CLASS": "immigration.pagination.StandardResultsSetPagination",
     "PAGE_SIZE": 25,
@@ -360,6 +366,9 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 # Custom user model
 AUTH_USER_MODEL = "immigration.User"
 
+# ModelBackend, reading a user's own and group permissions in one query
+AUTHENTICATION_BACKENDS = ["immigration.backends.ModelPermissionBackend"]
+
 
 # Environment-specific toggles for task/notification flows
 def _int_env(var_name, default):
@@ -398,6 +407,10 @@ def _validate_required_env_vars():
         except (ValueError, environ.ImproperlyConfigured):
             missing_vars.append(var)
 
+    # Every ASGI worker must see the same cache (see CACHES)
+    if not env.bool("DEBUG") and not env("REDIS_URL").strip():
+        missing_vars.append("REDIS_URL")
+
     if missing_vars:
         raise ValueError(
             f"Missing required environment variables: {', '.join(missing_vars)}. "
@@ -428,6 +441,23 @@ NOTIFICATION_STREAM_ALLOWED_ORIGIN = env(
 
 CHANNEL_LAYERS = {"default": {"BACKEND": "channels.layers.InMemoryChannelLayer"}}
 
+# Cached list responses, their invalidation tokens and paginator counts are
+# shared by every worker process through Redis, so a write handled by one
+# worker invalidates the pages cached by the others. Without REDIS_URL
+# (DEBUG only) each process keeps its own in-memory cache.
+REDIS_URL = env("REDIS_URL")
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+
 # drf-spectacular settings
 SPECTACULAR_SETTINGS = {
     "TITLE": "Immigration CRM API",
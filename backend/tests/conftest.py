@@ -0,0 +1,27 @@
+import pytest
+from django.db import connection
+from django_tenants.utils import get_public_schema_name
+
+from tenants.models import Domain, Tenant
+
+# Schema of the tenant the database tests run in
+TEST_SCHEMA = 'tenant_test'
+
+
+@pytest.fixture(scope='session')
+def django_db_setup(django_db_setup, django_db_blocker):
+    """Create the test tenant once per session: saving it migrates its schema."""
+    with django_db_blocker.unblock():
+        if not Tenant.objects.filter(schema_name=TEST_SCHEMA).exists():
+            tenant = Tenant(schema_name=TEST_SCHEMA, name='Test')
+            tenant.save(verbosity=0)
+            Domain.objects.create(tenant=tenant, domain='tenant.test', is_primary=True)
+
+
+@pytest.fixture
+def tenant(db):
+    """Run the test in the test tenant's schema, inside its transaction."""
+    tenant = Tenant.objects.get(schema_name=TEST_SCHEMA)
+    connection.set_tenant(tenant)
+    yield tenant
+    connection.set_schema(get_public_schema_name())
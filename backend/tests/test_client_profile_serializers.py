@@ -0,0 +1,129 @@
+import datetime
+from decimal import Decimal
+
+import pytest
+
+from immigration.api.v1.serializers.client_profiles import (
+    EMPLOYMENT_LIST_VALUES,
+    LPE_LIST_VALUES,
+    PASSPORT_LIST_VALUES,
+    PROFICIENCY_LIST_VALUES,
+    QUALIFICATION_LIST_VALUES,
+    EmploymentOutputSerializer,
+    LPESerializer,
+    PassportOutputSerializer,
+    ProficiencyOutputSerializer,
+    QualificationOutputSerializer,
+    employment_list_data,
+    lpe_list_data,
+    passport_list_data,
+    proficiency_list_data,
+    qualification_list_data,
+)
+from immigration.models import (
+    LPE,
+    Client,
+    Employment,
+    Passport,
+    Proficiency,
+    Qualification,
+)
+
+
+@pytest.fixture
+def client_record(tenant):
+    return Client.objects.create(first_name='Ada', country='AU')
+
+
+def assert_list_data_matches(model, values, builder, serializer_class):
+    """Every row's builder output equals the serializer's output for the instance."""
+    rows = model.objects.order_by('pk').values_list(*values, named=True)
+    instances = model.objects.order_by('pk')
+    assert len(rows) == len(instances) > 0
+    for row, instance in zip(rows, instances, strict=True):
+        assert builder(row) == serializer_class(instance).data
+
+
+def test_lpe_list_data_matches_serializer(tenant):
+    LPE.objects.create(name='IELTS', validity_term=2, description='Academic')
+    lpe = LPE.objects.create(name='PTE')
+    # updated_at is nullable on LPE
+    LPE.objects.filter(pk=lpe.pk).update(updated_at=None)
+
+    assert_list_data_matches(LPE, LPE_LIST_VALUES, lpe_list_data, LPESerializer)
+
+
+def test_proficiency_list_data_matches_serializer(client_record):
+    ielts = LPE.objects.create(name='IELTS')
+    Proficiency.objects.create(
+        client=client_record,
+        test_name=ielts,
+        overall_score=Decimal('7.5'),
+        speaking_score=Decimal('8'),
+        reading_score=Decimal('7.0'),
+        listening_score=Decimal('6.5'),
+        writing_score=Decimal('9.0'),
+        test_date=datetime.date(2025, 3, 14),
+    )
+    # No exam, scores or test date: test_name_display is left out
+    Proficiency.objects.create(client=client_record)
+
+    assert_list_data_matches(
+        Proficiency, PROFICIENCY_LIST_VALUES, proficiency_list_data, ProficiencyOutputSerializer,
+    )
+
+
+def test_qualification_list_data_matches_serializer(client_record):
+    Qualification.objects.create(
+        client=client_record,
+        course='Computer Science',
+        institute='ANU',
+        degree='BSc',
+        field_of_study='Computing',
+        enroll_date=datetime.date(2018, 2, 1),
+        completion_date=datetime.date(2021, 12, 1),
+        country='AU',
+    )
+    Qualification.objects.create(client=client_record, course='Diploma')
+
+    assert_list_data_matches(
+        Qualification, QUALIFICATION_LIST_VALUES, qualification_list_data, QualificationOutputSerializer,
+    )
+
+
+def test_passport_list_data_matches_serializer(client_record):
+    other = Client.objects.create(first_name='Grace', country='NZ')
+    Passport.objects.create(
+        client=client_record,
+        passport_no='PA1234567',
+        passport_country='AU',
+        date_of_issue=datetime.date(2020, 1, 2),
+        date_of_expiry=datetime.date(2030, 1, 1),
+        place_of_issue='Sydney',
+        country_of_birth='GB',
+        nationality='AU',
+    )
+    Passport.objects.create(
+        client=other,
+        passport_no='LN7654321',
+        passport_country='NZ',
+        country_of_birth='NZ',
+        nationality='NZ',
+    )
+
+    assert_list_data_matches(Passport, PASSPORT_LIST_VALUES, passport_list_data, PassportOutputSerializer)
+
+
+def test_employment_list_data_matches_serializer(client_record):
+    Employment.objects.create(
+        client=client_record,
+        employer_name='Acme',
+        position='Engineer',
+        start_date=datetime.date(2019, 7, 1),
+        end_date=datetime.date(2023, 6, 30),
+        country='AU',
+    )
+
+    assert_list_data_matches(
+        Employment, EMPLOYMENT_LIST_VALUES, employment_list_data, EmploymentOutputSerializer,
+    )
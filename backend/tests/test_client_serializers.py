@@ -0,0 +1,61 @@
+import datetime
+
+import pytest
+from django.contrib.auth import get_user_model
+
+from immigration.api.v1.serializers.clients import (
+    CLIENT_OUTPUT_ONLY,
+    ClientOutputSerializer,
+    client_output_data,
+)
+from immigration.models import Agent, Branch, Client, VisaCategory
+from immigration.renderers import ORJSONRenderer
+from immigration.selectors.clients import client_list
+
+
+@pytest.fixture
+def user(tenant):
+    return get_user_model().objects.create_user(username='ops', first_name='Olive', last_name='Park')
+
+
+@pytest.fixture
+def clients(user):
+    related = Client.objects.create(
+        first_name='Ada',
+        middle_name='K',
+        last_name='Lovelace',
+        gender='FEMALE',
+        dob=datetime.date(1990, 12, 10),
+        email='ada@example.com',
+        country='AU',
+        visa_category=VisaCategory.objects.create(name='Student'),
+        agent=Agent.objects.create(agent_name='Global Study'),
+        assigned_to=user,
+        branch=Branch.objects.create(name='Sydney'),
+        stage='LEAD',
+        created_by=user,
+        updated_by=user,
+    )
+    # No relations, no date of birth and a blank country
+    bare = Client.objects.create(first_name='Grace', country='')
+    return related, bare
+
+
+def assert_output_matches(client):
+    data = client_output_data(client)
+    expected = ClientOutputSerializer(client).data
+    assert data == expected
+    # Country values compare equal to their codes: check the rendered JSON too
+    assert ORJSONRenderer().render(data) == ORJSONRenderer().render(expected)
+
+
+def test_client_output_data_matches_serializer_for_detail_queryset(user, clients):
+    for client in clients:
+        assert_output_matches(client_list(user=user).get(pk=client.pk))
+
+
+def test_client_output_data_matches_serializer_for_list_queryset(user, clients):
+    page = client_list(user=user).only(*CLIENT_OUTPUT_ONLY).order_by('pk')
+    assert len(page) == len(clients)
+    for client in page:
+        assert_output_matches(client)
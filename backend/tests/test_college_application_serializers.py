@@ -0,0 +1,133 @@
+import datetime
+from decimal import Decimal
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+
+from immigration.api.v1.serializers.college_application import (
+    ApplicationTypeOutputSerializer,
+    CollegeApplicationOutputSerializer,
+    StageOutputSerializer,
+    application_type_output_data,
+    college_application_output_data,
+    stage_output_data,
+)
+from immigration.constants import GROUP_SUPER_ADMIN
+from immigration.models import (
+    Agent,
+    ApplicationType,
+    Client,
+    CollegeApplication,
+    Course,
+    Institute,
+    InstituteIntake,
+    Stage,
+)
+from immigration.models.institute import (
+    BroadField,
+    CourseLevel,
+    InstituteLocation,
+    NarrowField,
+)
+from immigration.selectors.college_applications import (
+    application_type_list,
+    college_application_list,
+    stage_list,
+)
+
+
+@pytest.fixture
+def user(tenant):
+    # Tenant-wide access: the selectors return every row
+    user = get_user_model().objects.create_user(username='ops', first_name='Olive', last_name='Park')
+    user.groups.add(Group.objects.get_or_create(name=GROUP_SUPER_ADMIN)[0])
+    return user
+
+
+@pytest.fixture
+def application_types(user):
+    visa = ApplicationType.objects.create(
+        title='Student Visa',
+        currency='AUD',
+        tax_name='GST',
+        tax_percentage=Decimal('10'),
+        created_by=user,
+        updated_by=user,
+    )
+    Stage.objects.create(application_type=visa, stage_name='Offer', position=1)
+    Stage.objects.create(application_type=visa, stage_name='Enrolled', position=2, created_by=user)
+    # No stages and no creator
+    ApplicationType.objects.create(title='Transfer')
+    return visa
+
+
+@pytest.fixture
+def applications(user, application_types):
+    institute = Institute.objects.create(name='Harbour College', short_name='HC')
+    broad_field = BroadField.objects.create(name='Information Technology')
+    course = Course.objects.create(
+        name='Master of IT',
+        institute=institute,
+        level=CourseLevel.objects.create(name='Masters'),
+        broad_field=broad_field,
+        narrow_field=NarrowField.objects.create(name='Computer Science', broad_field=broad_field),
+        total_tuition_fee=Decimal('42000'),
+        coe_fee=Decimal('250'),
+    )
+    intake = InstituteIntake.objects.create(institute=institute, intake_date=datetime.date(2026, 2, 1))
+    common = {
+        'application_type': application_types,
+        'institute': institute,
+        'course': course,
+        'start_date': intake,
+        'total_tuition_fee': Decimal('42000.5'),
+    }
+    CollegeApplication.objects.create(
+        **common,
+        stage=Stage.objects.get(stage_name='Enrolled'),
+        client=Client.objects.create(first_name='Ada', last_name='Lovelace', country='AU'),
+        location=InstituteLocation.objects.create(institute=institute, state='NSW', country='AU'),
+        finish_date=datetime.date(2027, 12, 1),
+        student_id='S123',
+        super_agent=Agent.objects.create(agent_name='Global Study', agent_type='SUPER_AGENT'),
+        sub_agent=Agent.objects.create(agent_name='Local Study', agent_type='SUB_AGENT'),
+        assigned_to=user,
+        notes='Scholarship pending',
+        created_by=user,
+        updated_by=user,
+    )
+    # No agents, assignee or finish date; a location without a state
+    CollegeApplication.objects.create(
+        **common,
+        stage=Stage.objects.get(stage_name='Offer'),
+        client=Client.objects.create(first_name='Grace', country='NZ'),
+        location=InstituteLocation.objects.create(institute=institute, state='', country='NZ'),
+    )
+
+
+def test_application_type_output_data_matches_serializer(user, application_types):
+    rows = application_type_list(user=user).order_by('pk')
+    assert len(rows) == 2
+    for application_type in rows:
+        assert (
+            application_type_output_data(application_type)
+            == ApplicationTypeOutputSerializer(application_type).data
+        )
+
+
+def test_stage_output_data_matches_serializer(user, application_types):
+    stages = stage_list(user=user, filters={'application_type_id': application_types.pk})
+    assert len(stages) == 2
+    for stage in stages:
+        assert stage_output_data(stage) == StageOutputSerializer(stage).data
+
+
+def test_college_application_output_data_matches_serializer(user, applications):
+    rows = college_application_list(user=user).order_by('pk')
+    assert len(rows) == 2
+    for application in rows:
+        assert (
+            college_application_output_data(application)
+            == CollegeApplicationOutputSerializer(application).data
+        )
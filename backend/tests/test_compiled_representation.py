@@ -0,0 +1,108 @@
+import datetime
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group, Permission
+from django.contrib.contenttypes.models import ContentType
+from rest_framework import serializers
+
+from immigration.api.v1.serializers.compiled import CompiledRepresentationMixin
+from immigration.api.v1.serializers.task import TaskOutputSerializer
+from immigration.api.v1.serializers.users import UserOutputSerializer
+from immigration.models import Branch, Client, Region, Task
+
+
+class CompiledUserOutputSerializer(CompiledRepresentationMixin, UserOutputSerializer):
+    """UserOutputSerializer with the compiled to_representation."""
+
+    always_include_fields = frozenset({'id', 'username', 'last_login'})
+
+
+def drf_representation(serializer_class, instance, context):
+    """DRF's generic field loop, with omit_nulls applied the way the mixin documents it."""
+    serializer = serializer_class(context=dict(context))
+    data = serializers.Serializer.to_representation(serializer, instance)
+    if context.get('omit_nulls'):
+        data = {
+            name: value for name, value in data.items()
+            if value is not None or name in serializer_class.always_include_fields
+        }
+    return data
+
+
+def assert_compiled_matches(serializer_class, instance, context):
+    compiled = serializer_class(instance, context=dict(context)).data
+    expected = drf_representation(serializer_class, instance, context)
+    assert compiled == expected
+    # Same keys in the same order
+    assert list(compiled) == list(expected)
+
+
+@pytest.fixture
+def user(tenant):
+    return get_user_model().objects.create_user(username='ops', first_name='Olive', last_name='Park')
+
+
+@pytest.fixture
+def tasks(user):
+    due = datetime.datetime(2026, 6, 1, 17, 0, tzinfo=datetime.UTC)
+    client = Client.objects.create(first_name='Ada', last_name='Lovelace', country='AU')
+    linked = Task.objects.create(
+        title='Collect documents',
+        detail='Passport and transcripts',
+        due_date=due,
+        assigned_to=user,
+        assigned_by=user,
+        tags=['documents', 'urgent'],
+        comments=[{'author': 'ops', 'text': 'Called the client'}],
+        content_type=ContentType.objects.get_for_model(Client),
+        object_id=client.pk,
+        completed_at=due,
+        created_by=user,
+        updated_by=user,
+    )
+    # Assigned to a branch instead of a user
+    branch_task = Task.objects.create(
+        title='Review intake',
+        detail='Branch queue',
+        due_date=due,
+        branch=Branch.objects.create(name='Sydney'),
+        assigned_by=user,
+    )
+    # Every foreign key, the link and completed_at null
+    bare = Task.objects.create(title='Follow up', detail='', due_date=due)
+    return linked, branch_task, bare
+
+
+@pytest.mark.parametrize('context', [{}, {'omit_nulls': True}], ids=['all', 'omit_nulls'])
+def test_task_output_matches_drf(tasks, context):
+    for task in tasks:
+        assert_compiled_matches(TaskOutputSerializer, Task.objects.get(pk=task.pk), context)
+
+
+@pytest.mark.parametrize('context', [{}, {'omit_nulls': True}], ids=['all', 'omit_nulls'])
+def test_user_output_matches_drf(user, context):
+    region = Region.objects.create(name='East')
+    user.branches.add(Branch.objects.create(name='Sydney', region=region))
+    user.regions.add(region)
+    user.groups.add(Group.objects.create(name='CONSULTANT'))
+    user.user_permissions.add(Permission.objects.get(codename='view_client'))
+    user.last_login = datetime.datetime(2026, 1, 2, 3, 4, 5, tzinfo=datetime.UTC)
+    user.save()
+    # Never logged in, no groups, branches or regions
+    bare = get_user_model().objects.create_user(username='bare')
+
+    for instance in (user, bare):
+        assert_compiled_matches(
+            CompiledUserOutputSerializer, get_user_model().objects.get(pk=instance.pk), context,
+        )
+
+
+def test_omit_nulls_keeps_always_included_fields(tasks):
+    bare = Task.objects.get(pk=tasks[-1].pk)
+    data = TaskOutputSerializer(bare, context={'omit_nulls': True}).data
+
+    assert 'assigned_to' not in data
+    assert 'completed_at' not in data
+    assert data['assigned_to_branch'] is False
+    assert TaskOutputSerializer.always_include_fields <= set(data)
@@ -0,0 +1,51 @@
+import datetime
+
+import pytest
+from django.contrib.auth import get_user_model
+
+from immigration.api.v1.serializers.event import (
+    EventOutputSerializer,
+    event_output_data,
+)
+from immigration.models import Branch, CalendarEvent
+from immigration.selectors.events import event_list
+
+
+@pytest.fixture
+def user(tenant):
+    return get_user_model().objects.create_user(username='ops', first_name='Olive', last_name='Park')
+
+
+@pytest.fixture
+def events(user):
+    start = datetime.datetime(2026, 5, 4, 9, 30, tzinfo=datetime.UTC)
+    CalendarEvent.objects.create(
+        title='Visa lodgement',
+        description='Lodge the 500 application',
+        start=start,
+        end=start + datetime.timedelta(hours=1, minutes=15),
+        assigned_to=user,
+        hex_color='#FF8800',
+        location='Sydney office',
+        branch=Branch.objects.create(name='Sydney'),
+        created_by=user,
+        updated_by=user,
+    )
+    # No branch, creator or editor; an assignee without a first or last name
+    anonymous = get_user_model().objects.create_user(username='anon')
+    CalendarEvent.objects.create(
+        title='All day',
+        start=start,
+        end=start + datetime.timedelta(days=1),
+        all_day=True,
+        assigned_to=anonymous,
+    )
+    return user, anonymous
+
+
+def test_event_output_data_matches_serializer(events):
+    for user in events:
+        rows = event_list(user=user)
+        assert len(rows) == 1
+        for event in rows:
+            assert event_output_data(event) == EventOutputSerializer(event).data
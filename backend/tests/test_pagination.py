@@ -0,0 +1,117 @@
+import base64
+import datetime
+import json
+
+import pytest
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from immigration.models import Client
+from immigration.pagination import KeysetPagination
+
+factory = APIRequestFactory()
+
+
+def paginate(queryset, url):
+    """(ids of the page, paginated body) for a GET of url."""
+    paginator = KeysetPagination()
+    rows = paginator.paginate_queryset(queryset, Request(factory.get(url)))
+    ids = [row.id for row in rows]
+    return ids, paginator.get_paginated_data(ids)
+
+
+def walk(queryset, url, link):
+    """Pages from url on, following the body's link ('next' or 'previous')."""
+    pages = []
+    while url:
+        ids, data = paginate(queryset, url)
+        pages.append(ids)
+        url = data[link]
+    return pages
+
+
+def cursor(data):
+    return base64.urlsafe_b64encode(json.dumps(data).encode()).decode()
+
+
+@pytest.fixture
+def clients(tenant):
+    # Ties on first_name, and dates of birth with NULLs among them
+    births = [
+        ('Ada', datetime.date(1990, 1, 1)),
+        ('Ada', None),
+        ('Ada', datetime.date(1985, 6, 1)),
+        ('Ben', None),
+        ('Ben', datetime.date(1990, 1, 1)),
+        ('Cy', datetime.date(2000, 2, 29)),
+        ('Cy', None),
+    ]
+    return [Client.objects.create(first_name=name, dob=dob, country='AU') for name, dob in births]
+
+
+@pytest.mark.parametrize('ordering', [
+    ('first_name',),
+    ('-first_name',),
+    ('dob',),
+    ('-dob',),
+    ('first_name', '-dob'),
+])
+def test_keyset_pages_forward_then_backward(clients, ordering):
+    queryset = Client.objects.order_by(*ordering)
+    expected = list(queryset.order_by(*ordering, 'id').values_list('id', flat=True))
+
+    forward = walk(queryset, '/clients/?page_size=3', 'next')
+    assert [len(page) for page in forward] == [3, 3, 1]
+    assert sum(forward, []) == expected
+
+    # Back from the last page: previous links retrace the same pages
+    _, last = paginate(queryset, '/clients/?page_size=3')
+    _, last = paginate(queryset, last['next'])
+    _, last = paginate(queryset, last['next'])
+    assert last['next'] is None
+    backward = walk(queryset, last['previous'], 'previous')
+    assert backward == forward[-2::-1]
+
+
+def test_keyset_first_page_has_no_previous_link(clients):
+    ids, data = paginate(Client.objects.order_by('first_name'), '/clients/?page_size=3')
+
+    assert data['count'] == len(clients)
+    assert data['previous'] is None
+    assert 'cursor=' in data['next']
+    assert len(ids) == 3
+
+
+@pytest.mark.parametrize('value', [
+    'not base64!',
+    base64.urlsafe_b64encode(b'not json').decode(),
+    cursor([]),
+    cursor({'r': 1}),
+    cursor({'v': 'Ada'}),
+    # Wrong arity: ordering by first_name plus id takes two values
+    cursor({'v': ['Ada']}),
+    cursor({'v': ['Ada', 1, 2]}),
+    cursor({'v': ['Ada', 'one']}),
+])
+def test_keyset_invalid_cursor_is_not_found(clients, value):
+    with pytest.raises(NotFound):
+        paginate(Client.objects.order_by('first_name'), f'/clients/?cursor={value}')
+
+
+def test_keyset_invalid_cursor_value_for_column_type_is_not_found(clients):
+    with pytest.raises(NotFound):
+        paginate(Client.objects.order_by('dob'), f"/clients/?cursor={cursor({'v': ['not a date', 1]})}")
+
+
+def test_page_parameter_keeps_offset_pagination(clients):
+    queryset = Client.objects.order_by('first_name', 'id')
+    expected = list(queryset.values_list('id', flat=True))
+
+    ids, data = paginate(queryset, '/clients/?page=2&page_size=3')
+
+    assert ids == expected[3:6]
+    assert data['count'] == len(clients)
+    assert 'page=3' in data['next']
+    assert 'cursor=' not in data['next']
+    assert 'cursor=' not in data['previous']
@@ -0,0 +1,145 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from immigration.api.v1.views.users import USER_BULK_CREATE_MAX, UserViewSet
+from immigration.constants import GROUP_BRANCH_ADMIN, GROUP_CONSULTANT
+from immigration.models import Branch, Region
+from immigration.services.users import UserCreateInput, user_bulk_create
+
+User = get_user_model()
+
+
+def item(username, **fields):
+    return {
+        'username': username,
+        'email': f'{username}@example.com',
+        'password': 'correct-horse',
+        'first_name': username.title(),
+        'last_name': 'Park',
+        'group_name': GROUP_CONSULTANT,
+        **fields,
+    }
+
+
+def bulk_create(creator, *items):
+    return user_bulk_create(data=[UserCreateInput(**data) for data in items], created_by=creator)
+
+
+@pytest.fixture
+def creator(tenant):
+    return User.objects.create_superuser(username='admin', email='admin@example.com', password='x')
+
+
+@pytest.fixture
+def scope(tenant):
+    east = Region.objects.create(name='East')
+    west = Region.objects.create(name='West')
+    sydney = Branch.objects.create(name='Sydney', region=east)
+    perth = Branch.objects.create(name='Perth', region=west)
+    return sydney, perth, east, west
+
+
+def test_bulk_create_writes_group_branch_and_region_rows(creator, scope):
+    sydney, perth, east, west = scope
+    # CONSULTANT exists already, BRANCH_ADMIN is created on the way
+    Group.objects.get_or_create(name=GROUP_CONSULTANT)
+    Group.objects.filter(name=GROUP_BRANCH_ADMIN).delete()
+
+    users = bulk_create(
+        creator,
+        item('ada', branch_ids=[sydney.pk, perth.pk], region_ids=[east.pk]),
+        item('ben', group_name=GROUP_BRANCH_ADMIN, branch_ids=[perth.pk], is_active=False),
+        item('cy', region_ids=[east.pk, west.pk]),
+    )
+
+    assert [user.username for user in users] == ['ada', 'ben', 'cy']
+    expected = {
+        'ada': ([GROUP_CONSULTANT], {sydney.pk, perth.pk}, {east.pk}, True),
+        'ben': ([GROUP_BRANCH_ADMIN], {perth.pk}, set(), False),
+        'cy': ([GROUP_CONSULTANT], set(), {east.pk, west.pk}, True),
+    }
+    for user in users:
+        stored = User.objects.get(pk=user.pk)
+        groups, branches, regions, is_active = expected[stored.username]
+        assert list(stored.groups.values_list('name', flat=True)) == groups
+        assert set(stored.branches.values_list('id', flat=True)) == branches
+        assert set(stored.regions.values_list('id', flat=True)) == regions
+        assert stored.is_active is is_active
+        assert stored.email == f'{stored.username}@example.com'
+        assert stored.check_password('correct-horse')
+
+
+def test_bulk_create_requires_add_user_permission(tenant):
+    consultant = User.objects.create_user(username='consultant')
+
+    with pytest.raises(PermissionError):
+        bulk_create(consultant, item('ada'))
+    assert not User.objects.filter(username='ada').exists()
+
+
+@pytest.mark.parametrize('items, message', [
+    ([item('ada'), item('ada', email='other@example.com')], "Username 'ada' already exists"),
+    ([item('ada'), item('ben', email='ada@example.com')], "Email 'ada@example.com' already exists"),
+    ([item('ada'), item('admin', email='new@example.com')], "Username 'admin' already exists"),
+    ([item('ada'), item('ben', email='admin@example.com')], "Email 'admin@example.com' already exists"),
+], ids=['username_in_batch', 'email_in_batch', 'existing_username', 'existing_email'])
+def test_bulk_create_rejects_duplicates(creator, items, message):
+    with pytest.raises(ValueError, match=message):
+        bulk_create(creator, *items)
+    # All or nothing: the valid item is not created either
+    assert list(User.objects.values_list('username', flat=True)) == ['admin']
+
+
+@pytest.mark.parametrize('fields, message', [
+    ({'branch_ids': [0]}, 'One or more branch IDs are invalid'),
+    ({'region_ids': [0]}, 'One or more region IDs are invalid'),
+], ids=['branch', 'region'])
+def test_bulk_create_rejects_unknown_ids(creator, scope, fields, message):
+    sydney, _, east, _ = scope
+    valid = item('ada', branch_ids=[sydney.pk], region_ids=[east.pk])
+
+    with pytest.raises(ValueError, match=message):
+        bulk_create(creator, valid, item('ben', **fields))
+    assert list(User.objects.values_list('username', flat=True)) == ['admin']
+
+
+def test_bulk_create_rejects_repeated_ids_within_an_item(creator, scope):
+    sydney = scope[0]
+
+    with pytest.raises(ValueError, match='One or more branch IDs are invalid'):
+        bulk_create(creator, item('ada', branch_ids=[sydney.pk, sydney.pk]))
+
+
+def post_bulk(creator, items):
+    request = APIRequestFactory().post('/api/v1/users/bulk/', items, format='json')
+    force_authenticate(request, user=creator)
+    return UserViewSet.as_view({'post': 'bulk_create'})(request)
+
+
+@pytest.fixture
+def fast_hashing(settings):
+    # A bulk request hashes one password per user
+    settings.PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+
+@pytest.mark.usefixtures('fast_hashing')
+def test_bulk_endpoint_accepts_the_user_limit(creator):
+    items = [item(f'user{index}') for index in range(USER_BULK_CREATE_MAX)]
+
+    response = post_bulk(creator, items)
+
+    assert response.status_code == 201
+    assert len(response.data) == USER_BULK_CREATE_MAX
+    assert User.objects.count() == USER_BULK_CREATE_MAX + 1
+
+
+@pytest.mark.usefixtures('fast_hashing')
+def test_bulk_endpoint_rejects_more_than_the_user_limit(creator):
+    items = [item(f'user{index}') for index in range(USER_BULK_CREATE_MAX + 1)]
+
+    response = post_bulk(creator, items)
+
+    assert response.status_code == 400
+    assert User.objects.count() == 1
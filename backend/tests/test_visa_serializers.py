@@ -0,0 +1,50 @@
+import pytest
+from rest_framework import serializers
+
+from immigration.api.v1.serializers.visa import RequiredDocumentField
+
+
+@pytest.mark.parametrize(
+    ('value', 'expected'),
+    [
+        ('  Passport ', 'Passport'),
+        ({'name': 'Passport'}, {'name': 'Passport', 'received': False}),
+        ({'name': ' Passport ', 'received': True}, {'name': 'Passport', 'received': True}),
+    ],
+)
+def test_required_document_field_accepts_names_and_checklist_items(value, expected):
+    assert RequiredDocumentField().to_internal_value(value) == expected
+
+
+@pytest.mark.parametrize(
+    'value',
+    [
+        '   ',
+        {'name': ' ', 'received': False},
+    ],
+)
+def test_required_document_field_rejects_blank_names(value):
+    with pytest.raises(serializers.ValidationError) as excinfo:
+        RequiredDocumentField().to_internal_value(value)
+    assert excinfo.value.detail[0].code == 'blank'
+
+
+@pytest.mark.parametrize(
+    'value',
+    [
+        {},
+        {'name': 5},
+        {'name': None, 'received': False},
+        {'received': True},
+        {'name': 'Passport', 'received': 'yes'},
+        {'name': 'Passport', 'received': 1},
+        {'name': 'Passport', 'received': False, 'notes': 'x'},
+        ['Passport'],
+        5,
+        None,
+    ],
+)
+def test_required_document_field_rejects_malformed_values(value):
+    with pytest.raises(serializers.ValidationError) as excinfo:
+        RequiredDocumentField().to_internal_value(value)
+    assert excinfo.value.detail[0].code == 'invalid'